@@ -0,0 +1,40 @@
+"""Run the benchmark suite and optionally compare two saved runs.
+
+Run with `python -m benchmarks --json before.json`, change something, run it
+again with `--json after.json` and compare the two with
+`python -m benchmarks compare before.json after.json`.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import _harness
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+    parser.add_argument("-k", dest="pattern", help="only run matching benchmarks")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    compare_parser = subparsers.add_parser("compare")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.05)
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        regressed = _harness.compare(args.base, args.new, threshold=args.threshold)
+        sys.exit(1 if regressed else 0)
+
+    import benchmarks.suite  # noqa: F401 registers the benchmarks
+
+    results = _harness.run(args.pattern, repeat=args.repeat, min_time=args.min_time)
+    if args.json is not None:
+        _harness.write_json(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
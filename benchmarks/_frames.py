@@ -0,0 +1,17 @@
+from pathlib import Path
+
+# frames from the Teltonika protocol documentation (codec 8e, 8 and 16)
+_DEFAULT_FRAMES = [
+    "000000000000004A8E010000016B412CEE000100000000000000000000000000000000010005000100010100010011001D00010010015E2C880002000B000000003544C87A000E000000001DD7E06A00000100002994",
+    "000000000000003608010000016B40D8EA30010000000000000000000000000000000105021503010101425E0F01F10000601A014E0000000000000000010000C7CF",
+    "000000000000005F10020000016BDBC7833000000000000000000000000000000000000B05040200010000030002000B00270042563A00000000016BDBC7871800000000000000000000000000000000000B05040200010000030002000B00260042563A00000200005FB3",
+]
+
+
+def load_frames(recording: str | None = None) -> list[bytes]:
+    """Load TCP frames from a file with one hex encoded frame per line."""
+    if recording:
+        lines = Path(recording).read_text().split()
+    else:
+        lines = _DEFAULT_FRAMES
+    return [bytes.fromhex(line) for line in lines]
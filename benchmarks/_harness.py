@@ -0,0 +1,142 @@
+import dataclasses
+import json
+import platform
+import statistics
+import subprocess
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+_REGISTRY: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Callable[[], object]]], Any]:
+    """Register a benchmark.
+
+    The decorated function does the setup and returns the callable to time.
+    """
+
+    def decorator(
+        setup: Callable[[], Callable[[], object]],
+    ) -> Callable[[], Callable[[], object]]:
+        assert name not in _REGISTRY, f"duplicate benchmark {name}"
+        _REGISTRY[name] = setup
+        return setup
+
+    return decorator
+
+
+@dataclasses.dataclass(kw_only=True)
+class Result:
+    name: str
+    loops: int
+    timings: list[float]
+    """seconds per call of every repetition"""
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.timings)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.timings) if len(self.timings) > 1 else 0
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "loops": self.loops,
+            "timings": self.timings,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": self.min,
+        }
+
+
+def run(
+    pattern: str | None = None, *, repeat: int = 7, min_time: float = 0.2
+) -> list[Result]:
+    results: list[Result] = []
+    for name, setup in _REGISTRY.items():
+        if pattern is not None and pattern not in name:
+            continue
+        func = setup()
+        timer = timeit.Timer(func)
+        # calibrate so every repetition takes at least min_time
+        loops, elapsed = timer.autorange()
+        if elapsed < min_time:
+            loops = max(1, int(loops * min_time / max(elapsed, 1e-9)))
+        timings = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+        result = Result(name=name, loops=loops, timings=timings)
+        print(f"{name:<50} {_format_time(result.mean)} +- {_format_time(result.stdev)}")
+        results.append(result)
+    return results
+
+
+def write_json(results: list[Result], path: Path) -> None:
+    data = {
+        "meta": {
+            "date": datetime.now(tz=UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+        },
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def compare(base_path: Path, new_path: Path, *, threshold: float = 0.05) -> bool:
+    """Print the change of every benchmark and return whether any regressed.
+
+    A benchmark counts as changed if its mean moved by more than `threshold`
+    and by more than the combined standard deviation of both runs.
+    """
+    base = json.loads(base_path.read_text())["benchmarks"]
+    new = json.loads(new_path.read_text())["benchmarks"]
+    regressed = False
+    for name in sorted(base.keys() & new.keys()):
+        old_mean = base[name]["mean"]
+        new_mean = new[name]["mean"]
+        noise = base[name]["stdev"] + new[name]["stdev"]
+        change = new_mean / old_mean - 1
+        if abs(change) <= threshold or abs(new_mean - old_mean) <= noise:
+            verdict = "same"
+        elif change > 0:
+            verdict = "SLOWER"
+            regressed = True
+        else:
+            verdict = "faster"
+        print(
+            f"{name:<50} {_format_time(old_mean)} -> {_format_time(new_mean)}"
+            f" {change:+7.1%} {verdict}"
+        )
+    for name in sorted(base.keys() - new.keys()):
+        print(f"{name:<50} missing in {new_path}")
+    for name in sorted(new.keys() - base.keys()):
+        print(f"{name:<50} new")
+    return regressed
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s ", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:8.2f}{unit}"
+    return f"{seconds / 1e-9:8.2f}ns"
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,106 @@
+"""Compare Codec 8E frame encoding into a preallocated buffer with concatenation.
+
+Run with `python -m benchmarks.codec8e_encode`.
+"""
+
+import functools
+import timeit
+
+from teltek.codec import (
+    Codec8e,
+    Codec8eAvlData,
+    Codec8eGpsElement,
+    Codec8eIoElement,
+    CodecId,
+    MessageFrame,
+)
+
+
+def _encode_concat(codec: Codec8e) -> bytes:
+    # the encoding approach used before encode_into
+    def fixed(ios: dict[int, int], n: int) -> bytes:
+        return len(ios).to_bytes(2, "big") + b"".join(
+            id.to_bytes(2, "big") + value.to_bytes(n, "big")
+            for id, value in ios.items()
+        )
+
+    def record(avl: Codec8eAvlData) -> bytes:
+        io = avl.io
+        total = len(io.n1) + len(io.n2) + len(io.n4) + len(io.n8) + len(io.nx)
+        return (
+            avl.timestamp.to_bytes(8, "big")
+            + avl.priority.to_bytes(1, "big")
+            + avl.gps.encode()
+            + io.event_io_id.to_bytes(2, "big")
+            + total.to_bytes(2, "big")
+            + fixed(io.n1, 1)
+            + fixed(io.n2, 2)
+            + fixed(io.n4, 4)
+            + fixed(io.n8, 8)
+            + len(io.nx).to_bytes(2, "big")
+            + b"".join(
+                id.to_bytes(2, "big") + len(value).to_bytes(2, "big") + value
+                for id, value in io.nx.items()
+            )
+        )
+
+    records = len(codec.avl_data).to_bytes(1, "big")
+    body = records + b"".join(record(avl) for avl in codec.avl_data) + records
+    return MessageFrame.build(CodecId.CODEC_8E, body).encode()
+
+
+def _codec(records: int) -> Codec8e:
+    return Codec8e(
+        avl_data=[
+            Codec8eAvlData(
+                timestamp=1740492332000 + i * 1000,
+                priority=0,
+                gps=Codec8eGpsElement(
+                    longitude=77031566,
+                    latitude=472914500,
+                    altitude=489,
+                    angle=309,
+                    satellites=18,
+                    speed=42,
+                ),
+                io=Codec8eIoElement(
+                    event_io_id=0,
+                    n1={239: 1, 240: 1, 21: 5},
+                    n2={66: 12500, 67: 4100, 24: 42},
+                    n4={16: 1234567},
+                    n8={11: 893600000000},
+                    nx={},
+                ),
+            )
+            for i in range(records)
+        ]
+    )
+
+
+def main() -> None:
+    print(f"{'records':>8} {'concat':>10} {'encode_into':>12} {'speed-up':>9}")
+    for records in (1, 50, 255):
+        codec = _codec(records)
+        buf = bytearray(codec.frame_len())
+        codec.encode_frame_into(buf)
+        assert buf == _encode_concat(codec)
+
+        number = max(1, 2000 // records)
+        concat = min(
+            timeit.repeat(
+                functools.partial(_encode_concat, codec), number=number, repeat=5
+            )
+        )
+        into = min(
+            timeit.repeat(
+                functools.partial(codec.encode_frame_into, buf), number=number, repeat=5
+            )
+        )
+        print(
+            f"{records:>8} {concat / number * 1e6:>8.0f}us {into / number * 1e6:>10.0f}us"
+            f" {concat / into:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
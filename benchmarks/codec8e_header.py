@@ -0,0 +1,104 @@
+"""Compare struct-based decoding of the AVL record header with per-field parsing.
+
+Run with `python -m benchmarks.codec8e_header`.
+"""
+
+import timeit
+
+from teltek.codec import Codec8eAvlData, Codec8eGpsElement, Codec8eIoElement
+from teltek.codec._codec8e import _AVL_HEADER
+
+_FIELD_OFFSETS = [
+    (0, 8),
+    (8, 9),
+    (9, 13),
+    (13, 17),
+    (17, 19),
+    (19, 21),
+    (21, 22),
+    (22, 24),
+]
+
+
+def _decode_header_per_field(body: bytes) -> tuple[int, int, Codec8eGpsElement]:
+    # the decoding approach used before the struct layouts
+    return (
+        int.from_bytes(body[0:8], byteorder="big"),
+        int.from_bytes(body[8:9], byteorder="big"),
+        Codec8eGpsElement(
+            longitude=int.from_bytes(body[9:13], byteorder="big", signed=True),
+            latitude=int.from_bytes(body[13:17], byteorder="big", signed=True),
+            altitude=int.from_bytes(body[17:19], byteorder="big"),
+            angle=int.from_bytes(body[19:21], byteorder="big"),
+            satellites=int.from_bytes(body[21:22], byteorder="big"),
+            speed=int.from_bytes(body[22:24], byteorder="big"),
+        ),
+    )
+
+
+def _unpack_per_field(body: bytes) -> list[int]:
+    return [int.from_bytes(body[start:end], "big") for start, end in _FIELD_OFFSETS]
+
+
+def _decode_header_struct(body: bytes) -> tuple[int, int, Codec8eGpsElement]:
+    (timestamp, priority, lon, lat, alt, angle, sats, speed) = _AVL_HEADER.unpack_from(
+        body
+    )
+    return (
+        timestamp,
+        priority,
+        Codec8eGpsElement(
+            longitude=lon,
+            latitude=lat,
+            altitude=alt,
+            angle=angle,
+            satellites=sats,
+            speed=speed,
+        ),
+    )
+
+
+def _record() -> bytes:
+    return Codec8eAvlData(
+        timestamp=1740492332000,
+        priority=0,
+        gps=Codec8eGpsElement(
+            longitude=-740060000,
+            latitude=407128000,
+            altitude=489,
+            angle=309,
+            satellites=18,
+            speed=42,
+        ),
+        io=Codec8eIoElement(event_io_id=0, n1={}, n2={}, n4={}, n8={}, nx={}),
+    ).encode()
+
+
+def _bench(func, body: bytes, number: int = 100_000) -> float:
+    return min(timeit.repeat(lambda: func(body), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    body = _record()
+    assert _decode_header_per_field(body) == _decode_header_struct(body)
+
+    per_field = _bench(_decode_header_per_field, body)
+    packed = _bench(_decode_header_struct, body)
+    per_field_raw = _bench(_unpack_per_field, body)
+    packed_raw = _bench(_AVL_HEADER.unpack_from, body)
+    record = _bench(Codec8eAvlData.decode, body)
+
+    print(f"{'':<28} {'per-field':>10} {'struct':>10} {'speed-up':>9}")
+    print(
+        f"{'header fields':<28} {per_field_raw * 1e9:>8.0f}ns {packed_raw * 1e9:>8.0f}ns"
+        f" {per_field_raw / packed_raw:>8.1f}x"
+    )
+    print(
+        f"{'header + gps element':<28} {per_field * 1e9:>8.0f}ns {packed * 1e9:>8.0f}ns"
+        f" {per_field / packed:>8.1f}x"
+    )
+    print(f"{'Codec8eAvlData.decode':<28} {'':>10} {record * 1e9:>8.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare the table-driven CRC-16/IBM with the previous bitwise implementation.
+
+Run with `python -m benchmarks.crc16`.
+"""
+
+import os
+import timeit
+
+from teltek.codec._frame import _crc16_ibm
+
+_SIZES = [1024, 4096, 16384, 65536]
+
+
+def _crc16_ibm_bitwise(data: bytes) -> int:
+    crc = 0
+    for b in data:
+        crc = crc ^ b
+        for _ in range(8):
+            carry = crc & 1
+            crc = crc >> 1
+            if carry:
+                crc = crc ^ 0xA001
+    return crc
+
+
+def _bench(func, data: bytes) -> float:
+    number = max(1, 2_000_000 // (len(data) * 8))
+    best = min(timeit.repeat(lambda: func(data), number=number, repeat=5))
+    return best / number
+
+
+def main() -> None:
+    print(f"{'size':>8} {'bitwise':>12} {'table':>12} {'speed-up':>9}")
+    for size in _SIZES:
+        data = os.urandom(size)
+        assert _crc16_ibm(data) == _crc16_ibm_bitwise(data)
+        bitwise = _bench(_crc16_ibm_bitwise, data)
+        table = _bench(_crc16_ibm, data)
+        print(
+            f"{size:>8} {bitwise * 1e6:>10.1f}us {table * 1e6:>10.1f}us {bitwise / table:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Import time of the teltek packages, as reported by `python -X importtime`.
+
+Run with `python -m benchmarks.importtime`. The parameter groups are loaded
+on first access, which `-X importtime` doesn't see, so the first access is
+timed directly, next to reading the same groups from a `ParameterCatalogue`
+file.
+
+Most of the `teltek.cmd` import time is asyncio and `teltek.parameters`. The
+MQTT and SMS transports, and with them aiomqtt, httpx and bs4, are only
+imported when first used.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from teltek.parameters import ParameterCatalogue
+
+_MODULES = ("teltek.codec", "teltek.parameters", "teltek.cmd")
+
+_DB_LOAD = """\
+import time, teltek.parameters
+start = time.perf_counter()
+teltek.parameters.db.ALL_GROUPS
+print(int((time.perf_counter() - start) * 1e6))
+"""
+
+_CATALOGUE_LOAD = """\
+import sys, time, teltek.parameters
+from pathlib import Path
+start = time.perf_counter()
+teltek.parameters.ParameterCatalogue.read(Path(sys.argv[1])).groups
+print(int((time.perf_counter() - start) * 1e6))
+"""
+
+
+def _import_time(module: str) -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        (_, cumulative, name) = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise ValueError(f"{module} not found in -X importtime output")
+
+
+def _load_time(code: str, *args: str) -> int:
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return int(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    for module in _MODULES:
+        times = [_import_time(module) for _ in range(args.repeat)]
+        print(f"import {module:<22} {statistics.median(times) / 1000:8.1f} ms")
+    times = [_load_time(_DB_LOAD) for _ in range(args.repeat)]
+    print(f"{'first db access':<29} {statistics.median(times) / 1000:8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalogue.json"
+        ParameterCatalogue.from_db().write(path)
+        times = [_load_time(_CATALOGUE_LOAD, str(path)) for _ in range(args.repeat)]
+    print(f"{'read catalogue':<29} {statistics.median(times) / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Benchmarks of the codec, parameter mapping and batching hot paths."""
+
+import io
+import logging
+import os
+
+import teltek.parameters
+from benchmarks._harness import benchmark
+from benchmarks.sample_config import DATA, RAW
+from teltek.cmd._batcher import iter_param_batches
+from teltek.codec import (
+    Codec8e,
+    Codec8eAvlData,
+    Codec8eGpsElement,
+    Codec8eIoElement,
+    MessageFrame,
+)
+from teltek.codec._frame import _crc16_ibm
+from teltek.parameters import Config, ConfigMatrix, ParameterCatalogue
+
+# the worst case length of some string parameters exceeds a single SMS, the
+# batcher warns about every one of them on every benchmark iteration
+logging.getLogger("teltek.cmd._batcher").setLevel(logging.ERROR)
+
+
+def _codec8e(records: int) -> Codec8e:
+    return Codec8e(
+        avl_data=[
+            Codec8eAvlData(
+                timestamp=1740492332000 + i * 1000,
+                priority=0,
+                gps=Codec8eGpsElement(
+                    longitude=77031566,
+                    latitude=472914500,
+                    altitude=489,
+                    angle=309,
+                    satellites=18,
+                    speed=42,
+                ),
+                io=Codec8eIoElement(
+                    event_io_id=0,
+                    n1={239: 1, 240: 1, 21: 5},
+                    n2={66: 12500, 67: 4100, 24: 42},
+                    n4={16: 1234567},
+                    n8={11: 893600000000},
+                    nx={},
+                ),
+            )
+            for i in range(records)
+        ]
+    )
+
+
+for _size in (1024, 65536):
+
+    @benchmark(f"codec/crc16_ibm[{_size}]")
+    def _crc16(size: int = _size):
+        data = os.urandom(size)
+        return lambda: _crc16_ibm(data)
+
+
+@benchmark("codec/MessageFrame.encode")
+def _frame_encode():
+    frame = _codec8e(50).to_frame()
+    return frame.encode
+
+
+@benchmark("codec/MessageFrame.decode")
+def _frame_decode():
+    raw = _codec8e(50).to_frame().encode()
+    return lambda: MessageFrame.decode(raw)
+
+
+for _records in (1, 50, 255):
+
+    @benchmark(f"codec/Codec8e.decode[{_records}]")
+    def _codec8e_decode(records: int = _records):
+        body = _codec8e(records).encode()
+        return lambda: Codec8e.decode(body)
+
+    @benchmark(f"codec/Codec8e.encode[{_records}]")
+    def _codec8e_encode(records: int = _records):
+        return _codec8e(records).encode
+
+
+@benchmark("parameters/map_raw_parameters")
+def _map_raw():
+    return lambda: teltek.parameters.map_raw_parameters(RAW)
+
+
+@benchmark("parameters/map_raw_parameters[5 ids]")
+def _map_raw_partial():
+    raw = dict(list(RAW.items())[:5])
+    return lambda: teltek.parameters.map_raw_parameters(raw)
+
+
+@benchmark("parameters/map_parameters_to_raw")
+def _map_to_raw():
+    return lambda: teltek.parameters.map_parameters_to_raw(DATA)
+
+
+@benchmark("parameters/Config.read")
+def _config_read():
+    config = Config(
+        configuration_version="1.0",
+        hw_version="FMC130",
+        title="benchmark",
+        fm_type="FMC130",
+        spec_id=1,
+        raw_parameters=RAW,
+    )
+    buf = io.BytesIO()
+    config.write(buf)
+    raw = buf.getvalue()
+    return lambda: Config.read(io.BytesIO(raw))
+
+
+@benchmark("parameters/ParameterCatalogue.read")
+def _catalogue_read():
+    buf = io.BytesIO()
+    ParameterCatalogue.from_db().write(buf)
+    raw = buf.getvalue()
+    return lambda: ParameterCatalogue.read(io.BytesIO(raw)).groups
+
+
+def _fleet_raws(devices: int) -> dict[str, dict[int, str]]:
+    raws: dict[str, dict[int, str]] = {}
+    for i in range(devices):
+        raw = dict(RAW)
+        raw[2001] = f"iot{i % 3}.example.com"
+        if i % 100 == 0:
+            raw[1000] = "999"
+        raws[f"{i:015d}"] = raw
+    return raws
+
+
+@benchmark("parameters/ConfigMatrix.from_raw_parameters[1000]")
+def _config_matrix_build():
+    raws = _fleet_raws(1000)
+    return lambda: ConfigMatrix.from_raw_parameters(raws)
+
+
+@benchmark("parameters/ConfigMatrix.diff[1000]")
+def _config_matrix_diff():
+    matrix = ConfigMatrix.from_raw_parameters(_fleet_raws(1000))
+    return lambda: matrix.diff(RAW)
+
+
+@benchmark("parameters/ConfigMatrix.outliers[1000]")
+def _config_matrix_outliers():
+    matrix = ConfigMatrix.from_raw_parameters(_fleet_raws(1000))
+    return matrix.outliers
+
+
+for _max_command_len in (160, 600):
+
+    @benchmark(f"cmd/iter_param_batches[{_max_command_len}]")
+    def _batches(max_command_len: int = _max_command_len):
+        param_ids = list(teltek.parameters.db.iter_parameter_ids())
+        return lambda: list(iter_param_batches(param_ids, max_command_len))
+
+    @benchmark(f"cmd/iter_param_batches[{_max_command_len},ffd]")
+    def _batches_ffd(max_command_len: int = _max_command_len):
+        param_ids = list(teltek.parameters.db.iter_parameter_ids())
+        return lambda: list(
+            iter_param_batches(
+                param_ids, max_command_len, packing="first-fit-decreasing"
+            )
+        )
@@ -0,0 +1,117 @@
+"""Load generator for AvlTcpServer that replays recorded frames.
+
+Run with `python -m benchmarks.tcp_server --devices 1000 --frames 20`. Pass
+`--target host:port` to load an already running server instead of starting
+one in-process, `--workers N` to start an AvlTcpServerPool with N worker
+processes, and `--recording FILE` to replay frames from a file with one
+hex encoded frame per line.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from benchmarks._frames import load_frames
+from teltek.server import AvlBatch, AvlSink, AvlTcpServer, AvlTcpServerPool
+
+
+class _CountingSink(AvlSink):
+    def __init__(self) -> None:
+        self.records = 0
+
+    async def handle(self, batch: AvlBatch) -> None:
+        self.records += batch.record_count
+
+
+async def _run_device(
+    host: str,
+    port: int,
+    imei: str,
+    frames: list[bytes],
+    latencies: list[float],
+    connect_limit: asyncio.Semaphore,
+) -> None:
+    async with connect_limit:
+        reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(len(imei).to_bytes(2, "big") + imei.encode())
+        if await reader.readexactly(1) != b"\x01":
+            raise RuntimeError(f"{imei} rejected")
+        for frame in frames:
+            start = time.perf_counter()
+            writer.write(frame)
+            await reader.readexactly(4)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def _load(
+    host: str, port: int, devices: int, frames: list[bytes], repeat: int
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    connect_limit = asyncio.Semaphore(256)
+    replay = [frames[i % len(frames)] for i in range(repeat)]
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _run_device(
+                host, port, f"35630704{i:07d}", replay, latencies, connect_limit
+            )
+            for i in range(devices)
+        )
+    )
+    return time.perf_counter() - start, latencies
+
+
+async def _main(args: argparse.Namespace) -> None:
+    frames = load_frames(args.recording)
+
+    if args.workers:
+        pool = AvlTcpServerPool(
+            _CountingSink, workers=args.workers, host="127.0.0.1", port=args.port
+        )
+        pool.start()
+        try:
+            # give the workers time to bind the port
+            await asyncio.sleep(2)
+            elapsed, latencies = await _load(
+                "127.0.0.1", args.port, args.devices, frames, args.frames
+            )
+        finally:
+            pool.stop()
+    elif args.target:
+        host, _, port = args.target.rpartition(":")
+        elapsed, latencies = await _load(
+            host, int(port), args.devices, frames, args.frames
+        )
+    else:
+        sink = _CountingSink()
+        async with AvlTcpServer(sink, host="127.0.0.1", port=0) as server:
+            elapsed, latencies = await _load(
+                "127.0.0.1", server.port, args.devices, frames, args.frames
+            )
+
+    total = len(latencies)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"devices:     {args.devices}")
+    print(f"frames:      {total} in {elapsed:.2f}s ({total / elapsed:.0f}/s)")
+    print(
+        f"ack latency: p50 {quantiles[49] * 1e3:.2f}ms p99 {quantiles[98] * 1e3:.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=20, help="frames per device")
+    parser.add_argument("--target", help="host:port of a running server")
+    parser.add_argument("--workers", type=int, help="start a server pool")
+    parser.add_argument("--port", type=int, default=5027, help="port of the pool")
+    parser.add_argument("--recording", help="file with one hex encoded frame per line")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
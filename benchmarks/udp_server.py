@@ -0,0 +1,120 @@
+"""Load generator for AvlUdpServer, compared with AvlTcpServer on the same data.
+
+Run with `python -m benchmarks.udp_server --devices 1000 --frames 20`. The
+recorded TCP frames (see `benchmarks.tcp_server`) are converted to UDP packets.
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import time
+
+from benchmarks._frames import load_frames
+from benchmarks.tcp_server import _CountingSink
+from benchmarks.tcp_server import _load as _load_tcp
+from teltek.codec import MessageFrame, UdpAvlAck, UdpAvlPacket
+from teltek.server import AvlTcpServer, AvlUdpServer
+
+
+class _Client(asyncio.DatagramProtocol):
+    def __init__(self) -> None:
+        self.waiters: dict[int, asyncio.Future[None]] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        ack = UdpAvlAck.decode(data)
+        fut = self.waiters.pop(ack.packet_id, None)
+        if fut is not None and not fut.done():
+            fut.set_result(None)
+
+
+async def _run_device(
+    transport: asyncio.DatagramTransport,
+    client: _Client,
+    device: int,
+    frames: list[MessageFrame],
+    latencies: list[float],
+) -> None:
+    imei = f"35630704{device:07d}"
+    for avl_packet_id, frame in enumerate(frames):
+        packet = UdpAvlPacket(
+            packet_id=device,
+            avl_packet_id=avl_packet_id % 256,
+            imei=imei,
+            codec_id=frame.codec_id,
+            data=frame.data,
+        ).encode()
+        start = time.perf_counter()
+        while True:
+            fut = client.waiters[device] = asyncio.get_running_loop().create_future()
+            transport.sendto(packet)
+            try:
+                await asyncio.wait_for(fut, timeout=2)
+            except asyncio.TimeoutError:
+                # retransmit like a device would
+                continue
+            break
+        latencies.append(time.perf_counter() - start)
+
+
+async def _load_udp(
+    port: int, devices: int, frames: list[bytes], repeat: int
+) -> tuple[float, list[float]]:
+    assert devices <= 0xFFFF, "packet ids are used to match acks"
+    decoded = [MessageFrame.decode(frame) for frame in frames]
+    replay = [decoded[i % len(decoded)] for i in range(repeat)]
+    loop = asyncio.get_running_loop()
+    transport, client = await loop.create_datagram_endpoint(
+        _Client, remote_addr=("127.0.0.1", port)
+    )
+    sock = transport.get_extra_info("socket")
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    latencies: list[float] = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                _run_device(transport, client, device, replay, latencies)
+                for device in range(devices)
+            )
+        )
+    finally:
+        transport.close()
+    return time.perf_counter() - start, latencies
+
+
+def _report(name: str, elapsed: float, latencies: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name}: {len(latencies)} frames in {elapsed:.2f}s"
+        f" ({len(latencies) / elapsed:.0f}/s),"
+        f" ack p50 {quantiles[49] * 1e3:.2f}ms p99 {quantiles[98] * 1e3:.2f}ms"
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    frames = load_frames(args.recording)
+
+    async with AvlUdpServer(_CountingSink(), host="127.0.0.1", port=0) as server:
+        elapsed, latencies = await _load_udp(
+            server.port, args.devices, frames, args.frames
+        )
+    _report("udp", elapsed, latencies)
+
+    async with AvlTcpServer(_CountingSink(), host="127.0.0.1", port=0) as server:
+        elapsed, latencies = await _load_tcp(
+            "127.0.0.1", server.port, args.devices, frames, args.frames
+        )
+    _report("tcp", elapsed, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=20, help="frames per device")
+    parser.add_argument("--recording", help="file with one hex encoded frame per line")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 from . import transport
 from ._accelerometer import AccelCalibrationInfo, AccelVector
+from ._batcher import BatchPacking, ParamLengthEstimator
 from ._client import CommandClient
 from ._device_id import DeviceId
+from ._state_cache import DeviceStateCache, MemoryStateCache, SqliteStateCache
 
 __all__ = [
     "CommandClient",
@@ -9,4 +11,9 @@ __all__ = [
     "DeviceId",
     "AccelCalibrationInfo",
     "AccelVector",
+    "BatchPacking",
+    "ParamLengthEstimator",
+    "DeviceStateCache",
+    "MemoryStateCache",
+    "SqliteStateCache",
 ]
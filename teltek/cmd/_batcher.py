@@ -1,21 +1,73 @@
 import logging
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from functools import cache
+from typing import Literal
 
 import teltek.parameters
 
 _LOGGER = logging.getLogger(__name__)
 
+BatchPacking = Literal["greedy", "first-fit-decreasing"]
+"""How parameters are packed into batches.
+
+"greedy" fills batches in input order. "first-fit-decreasing" places the
+longest parameters first, each into the first batch with room left, which
+needs fewer commands when long and short parameters are mixed.
+"""
+
+
+class ParamLengthEstimator:
+    """Learn the raw value lengths of parameters to plan batches optimistically.
+
+    Parameters that were never observed fall back to their worst-case length.
+    """
+
+    def __init__(self, *, margin: int = 0) -> None:
+        self._margin = margin
+        self._lens: dict[int, int] = {}
+
+    def observe(self, raw_params: Mapping[int, str]) -> None:
+        """Record received values, e.g. a response or the last known config."""
+        lens = self._lens
+        for param_id, value in raw_params.items():
+            if len(value) > lens.get(param_id, -1):
+                lens[param_id] = len(value)
+
+    def value_len(self, param_id: int) -> int:
+        max_len = _id_to_max_len_map()[param_id]
+        observed = self._lens.get(param_id)
+        if observed is None:
+            return max_len
+        return min(observed + self._margin, max_len)
+
 
 def iter_param_batches(
-    param_ids: Iterable[int], max_command_len: int
+    param_ids: Iterable[int],
+    max_command_len: int,
+    *,
+    value_len: Callable[[int], int] | None = None,
+    packing: BatchPacking = "greedy",
 ) -> Iterator[list[int]]:
+    """Batch parameter IDs so the getparam response fits into `max_command_len`.
+
+    `value_len` estimates the raw value length of a parameter and defaults to
+    the worst case.
+    """
     batch: list[int] = []
     batch_len = 0
 
     # the response is always longer
     resp_overhead_len = len("Param ID: Value:")
-    max_len_map = _id_to_max_len_map()
+    if value_len is None:
+        value_len = _id_to_max_len_map().__getitem__
+
+    if packing == "first-fit-decreasing":
+        yield from _first_fit_decreasing(
+            [(id, len(f";{id}:") + value_len(id)) for id in param_ids],
+            max_command_len,
+            resp_overhead_len,
+        )
+        return
 
     param_ids = iter(param_ids)
     while True:
@@ -26,7 +78,7 @@ def iter_param_batches(
                 yield batch
             break
 
-        max_len = max_len_map[param_id]
+        max_len = value_len(param_id)
         # for every parameter we add ";{id}:{value}"
         additional_len_required = len(f";{param_id}:") + max_len
 
@@ -52,7 +104,10 @@ def iter_param_batches(
 
 
 def iter_set_param_batches(
-    params: Iterable[tuple[int, str]], max_command_len: int
+    params: Iterable[tuple[int, str]],
+    max_command_len: int,
+    *,
+    packing: BatchPacking = "greedy",
 ) -> Iterator[dict[int, str]]:
     batch: dict[int, str] = {}
     batch_len = 0
@@ -60,6 +115,16 @@ def iter_set_param_batches(
     # the response is always longer: New value 2001:wap2;2002:user;2003:pass
     resp_overhead_len = len("New value  ")
 
+    if packing == "first-fit-decreasing":
+        params = dict(params)
+        for id_batch in _first_fit_decreasing(
+            [(id, 2 + len(str(id)) + len(raw)) for id, raw in params.items()],
+            max_command_len,
+            resp_overhead_len,
+        ):
+            yield {id: params[id] for id in id_batch}
+        return
+
     params = iter(params)
     while True:
         try:
@@ -93,6 +158,58 @@ def iter_set_param_batches(
             batch_len += additional_len_required
 
 
+def _first_fit_decreasing(
+    items: list[tuple[int, int]], max_command_len: int, resp_overhead_len: int
+) -> list[list[int]]:
+    """Pack (param_id, length) items into as few batches as possible.
+
+    Parameters keep their input order within a batch.
+    """
+    capacity = max_command_len - resp_overhead_len
+    order = {id: idx for idx, (id, _) in enumerate(items)}
+    batches: list[list[int]] = []
+    remaining: list[int] = []
+    for param_id, length in sorted(items, key=lambda item: item[1], reverse=True):
+        if length > capacity:
+            _LOGGER.warning(
+                "parameter %s itself exceeds max_command_len (%s > %s), returning on its own",
+                param_id,
+                length,
+                max_command_len,
+            )
+            batches.append([param_id])
+            remaining.append(0)
+            continue
+        for idx, room in enumerate(remaining):
+            if length <= room:
+                batches[idx].append(param_id)
+                remaining[idx] -= length
+                break
+        else:
+            batches.append([param_id])
+            remaining.append(capacity - length)
+
+    for batch in batches:
+        batch.sort(key=order.__getitem__)
+    batches.sort(key=lambda batch: order[batch[0]])
+
+    # same as the greedy fill but only counting
+    greedy_count = 0
+    room = -1
+    for _, length in items:
+        if length > room:
+            greedy_count += 1
+            room = capacity
+        room -= length
+    _LOGGER.info(
+        "packed %d parameter(s) into %d batches, %d fewer than greedy",
+        len(items),
+        len(batches),
+        greedy_count - len(batches),
+    )
+    return batches
+
+
 @cache
 def _id_to_max_len_map() -> dict[int, int]:
     id_to_len: dict[int, int] = {}
@@ -1,20 +1,50 @@
 import asyncio
 import logging
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from typing import Any
 
 import teltek.parameters
 from teltek.cmd._accelerometer import AccelCalibrationInfo
-from teltek.cmd._batcher import iter_param_batches, iter_set_param_batches
+from teltek.cmd._batcher import (
+    BatchPacking,
+    ParamLengthEstimator,
+    iter_param_batches,
+    iter_set_param_batches,
+)
 from teltek.cmd._device_id import DeviceId
+from teltek.cmd._state_cache import DeviceStateCache
 from teltek.cmd.transport import Transport
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class CommandClient:
-    def __init__(self, transport: Transport) -> None:
+    """Run commands on devices through a transport.
+
+    With a `length_estimator` getparam batches are planned from the value
+    lengths seen so far instead of the worst case. Parameters missing from an
+    optimistic response are requested again with worst-case batches.
+
+    `batch_packing` selects how parameters are packed into commands, see
+    `BatchPacking`.
+
+    With a `state_cache` every parameter read or successfully set is
+    remembered, and `set_full_parameters` only sends values that differ from
+    the known state of the device.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        *,
+        length_estimator: ParamLengthEstimator | None = None,
+        batch_packing: BatchPacking = "greedy",
+        state_cache: DeviceStateCache | None = None,
+    ) -> None:
         self._transport = transport
+        self._state_cache = state_cache
+        self._length_estimator = length_estimator
+        self._batch_packing: BatchPacking = batch_packing
 
     async def get_accelerometer_auto_calibration(
         self, device_id: DeviceId
@@ -27,6 +57,57 @@ class CommandClient:
         raw_params = await self.get_raw_parameters(device_id, param_ids)
         return teltek.parameters.map_raw_parameters(raw_params)
 
+    async def get_full_parameters_many(
+        self,
+        device_ids: Iterable[DeviceId],
+        *,
+        concurrency: int = 32,
+    ) -> AsyncIterator[tuple[DeviceId, dict[str, Any] | Exception]]:
+        """Get the full parameters of many devices concurrently.
+
+        Results are yielded in completion order. A failing device yields its
+        exception instead of the parameters and doesn't affect the others.
+        At most `concurrency` devices are queried at the same time, on top of
+        the limits of the transport. Workers wait while `concurrency` results
+        haven't been consumed yet.
+        """
+        assert concurrency >= 1
+        device_ids = iter(device_ids)
+        results: asyncio.Queue[tuple[DeviceId, dict[str, Any] | Exception] | None] = (
+            asyncio.Queue(maxsize=concurrency)
+        )
+        running = concurrency
+
+        async def worker() -> None:
+            nonlocal running
+            try:
+                for device_id in device_ids:
+                    result: dict[str, Any] | Exception
+                    try:
+                        result = await self.get_full_parameters(device_id)
+                    except Exception as exc:
+                        _LOGGER.warning(
+                            "%s: failed to get parameters: %r", device_id, exc
+                        )
+                        result = exc
+                    await results.put((device_id, result))
+            finally:
+                running -= 1
+                # wake up the consumer, a full queue gets drained anyway
+                if not results.full():
+                    results.put_nowait(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            while running or not results.empty():
+                item = await results.get()
+                if item is not None:
+                    yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     async def set_full_parameters(
         self,
         device_id: DeviceId,
@@ -43,6 +124,17 @@ class CommandClient:
                 for id, raw in raw_values.items()
                 if old_raw_values.get(id) != raw
             }
+        elif self._state_cache is not None and (
+            known := self._state_cache.get(device_id)
+        ):
+            raw_values = {
+                id: raw for id, raw in raw_values.items() if known.get(id) != raw
+            }
+            _LOGGER.info(
+                "%s: %d parameter(s) differ from the cached state",
+                device_id,
+                len(raw_values),
+            )
         await self.set_raw_parameters(device_id, raw_values)
 
     async def get_raw_parameters(
@@ -52,7 +144,47 @@ class CommandClient:
         *,
         attempts_per_batch: int = 3,
     ) -> dict[int, str]:
-        batches = list(iter_param_batches(param_ids, self._transport.max_command_len))
+        param_ids = list(param_ids)
+        estimator = self._length_estimator
+        if estimator is None:
+            params = await self._get_raw_parameters(
+                device_id, param_ids, attempts_per_batch=attempts_per_batch
+            )
+        else:
+            (params, missing) = await self._get_raw_parameters_optimistic(
+                device_id, param_ids, estimator
+            )
+            if missing:
+                _LOGGER.info(
+                    "%s: requesting %d parameter(s) again with worst-case batches",
+                    device_id,
+                    len(missing),
+                )
+                params.update(
+                    await self._get_raw_parameters(
+                        device_id, missing, attempts_per_batch=attempts_per_batch
+                    )
+                )
+            estimator.observe(params)
+
+        if self._state_cache is not None:
+            self._state_cache.update(device_id, params)
+        return params
+
+    async def _get_raw_parameters(
+        self,
+        device_id: DeviceId,
+        param_ids: list[int],
+        *,
+        attempts_per_batch: int,
+    ) -> dict[int, str]:
+        batches = list(
+            iter_param_batches(
+                param_ids,
+                self._transport.max_command_len,
+                packing=self._batch_packing,
+            )
+        )
         param_count = sum(len(batch) for batch in batches)
         _LOGGER.info(
             "%s: requesting %s parameter(s) in %d batches",
@@ -61,35 +193,106 @@ class CommandClient:
             len(batches),
         )
 
+        # batches are pipelined if the transport supports it
+        pipeline = asyncio.Semaphore(self._transport.max_pipelined_commands)
+
+        async def get_batch(batch_nr: int, batch: list[int]) -> dict[int, str]:
+            async with pipeline:
+                _LOGGER.debug(
+                    "%s: getting batch %d/%d", device_id, batch_nr, len(batches)
+                )
+                last_exc = None
+                for attempt in range(1, attempts_per_batch + 1):
+                    if last_exc:
+                        _LOGGER.warning(
+                            "%s: retrying batch %d (attempt %d/%d)",
+                            device_id,
+                            batch_nr,
+                            attempt,
+                            attempts_per_batch,
+                        )
+                    try:
+                        return await self._get_raw_parameters_batch(device_id, *batch)
+                    except asyncio.TimeoutError:
+                        raise
+                    except Exception as exc:
+                        last_exc = exc
+                assert last_exc is not None
+                raise last_exc
+
+        tasks = [
+            asyncio.ensure_future(get_batch(batch_nr, batch))
+            for batch_nr, batch in enumerate(batches, 1)
+        ]
+        try:
+            batch_results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
         params: dict[int, str] = {}
-        for batch_nr, batch in enumerate(batches, 1):
-            _LOGGER.debug("%s: getting batch %d/%d", device_id, batch_nr, len(batches))
-            last_exc = None
-            for attempt in range(1, attempts_per_batch + 1):
-                if last_exc:
-                    _LOGGER.warning(
-                        "%s: retrying batch %d (attempt %d/%d)",
-                        device_id,
-                        batch_nr,
-                        attempt,
-                        attempts_per_batch,
-                    )
+        for batch_params in batch_results:
+            params.update(batch_params)
+        return params
+
+    async def _get_raw_parameters_optimistic(
+        self,
+        device_id: DeviceId,
+        param_ids: list[int],
+        estimator: ParamLengthEstimator,
+    ) -> tuple[dict[int, str], list[int]]:
+        """Get parameters in batches planned from the learned value lengths.
+
+        Returns the received parameters and the IDs of batches that were
+        truncated or failed, those have to be requested again.
+        """
+        max_command_len = self._transport.max_command_len
+        batches = list(
+            iter_param_batches(
+                param_ids,
+                max_command_len,
+                value_len=estimator.value_len,
+                packing=self._batch_packing,
+            )
+        )
+        _LOGGER.info(
+            "%s: requesting %s parameter(s) in %d optimistic batches",
+            device_id,
+            len(param_ids),
+            len(batches),
+        )
+        pipeline = asyncio.Semaphore(self._transport.max_pipelined_commands)
+        params: dict[int, str] = {}
+        missing: list[int] = []
+
+        async def get_batch(batch: list[int]) -> None:
+            async with pipeline:
                 try:
-                    batch_params = await self._get_raw_parameters_batch(
-                        device_id, *batch
+                    response = await self.run_command(
+                        device_id, "getparam " + ";".join(map(str, batch)), attempts=1
                     )
+                    batch_params = _parse_getparam_response(response)
+                    _ensure_param_ids_match(batch, batch_params.keys())
                 except asyncio.TimeoutError:
                     raise
                 except Exception as exc:
-                    last_exc = exc
-                else:
-                    last_exc = None
-                    params.update(batch_params)
-                    break
-            if last_exc:
-                raise last_exc
+                    _LOGGER.info("%s: optimistic batch failed: %r", device_id, exc)
+                    missing.extend(batch)
+                    return
+            if len(response) >= max_command_len:
+                # the response may have been cut off, don't trust the last value
+                batch_params.popitem()
+            # the device may also leave out IDs of a complete response
+            missing.extend(id for id in batch if id not in batch_params)
+            params.update(batch_params)
 
-        return params
+        tasks = [asyncio.ensure_future(get_batch(batch)) for batch in batches]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return (params, missing)
 
     async def set_raw_parameters(
         self,
@@ -99,7 +302,11 @@ class CommandClient:
         attempts_per_batch: int = 3,
     ) -> None:
         batches = list(
-            iter_set_param_batches(params.items(), self._transport.max_command_len)
+            iter_set_param_batches(
+                params.items(),
+                self._transport.max_command_len,
+                packing=self._batch_packing,
+            )
         )
         param_count = sum(len(batch) for batch in batches)
         _LOGGER.info(
@@ -111,28 +318,42 @@ class CommandClient:
 
         for batch_nr, batch in enumerate(batches, 1):
             _LOGGER.debug("%s: setting batch %d/%d", device_id, batch_nr, len(batches))
+            # the response echoes the applied values, only mismatches are re-sent
+            pending = batch
             last_exc = None
             for attempt in range(1, attempts_per_batch + 1):
-                if last_exc:
+                if attempt > 1:
                     _LOGGER.warning(
-                        "%s: retrying batch %d (attempt %d/%d)",
+                        "%s: retrying %d parameter(s) of batch %d (attempt %d/%d)",
                         device_id,
+                        len(pending),
                         batch_nr,
                         attempt,
                         attempts_per_batch,
                     )
 
                 try:
-                    await self._set_raw_parameters_batch(device_id, batch)
+                    applied = await self._set_raw_parameters_batch(device_id, pending)
                 except asyncio.TimeoutError:
                     raise
                 except Exception as exc:
                     last_exc = exc
-                else:
-                    last_exc = None
+                    continue
+                last_exc = None
+                confirmed = {
+                    id: raw for id, raw in pending.items() if applied.get(id) == raw
+                }
+                if self._state_cache is not None:
+                    self._state_cache.update(device_id, confirmed)
+                pending = {
+                    id: raw for id, raw in pending.items() if id not in confirmed
+                }
+                if not pending:
                     break
             if last_exc:
                 raise last_exc
+            if pending:
+                raise ValueError(f"Parameters weren't applied: {sorted(pending)}")
 
     async def _get_raw_parameters_batch(
         self,
@@ -142,42 +363,20 @@ class CommandClient:
         response = await self.run_command(
             device_id, "getparam " + ";".join(map(str, param_ids))
         )
-        params: dict[int, str] = {}
-        raw_params = response.split(";")
-
-        # first param is special: Param ID:1000 Value:300
-        first_param = raw_params[0]
-        first_param = first_param[9:]
-        try:
-            param_id, _, param_value = first_param.partition(" ")
-            param_value = param_value[6:]
-            param_id = int(param_id)
-        except ValueError as exc:
-            raise ValueError(f"Failed to parse first param {first_param!r}") from exc
-        params[param_id] = param_value
-
-        # others are: 10000:60
-        for rest_param in raw_params[1:]:
-            try:
-                param_id, _, param_value = rest_param.partition(":")
-                param_id = int(param_id)
-            except ValueError as exc:
-                raise ValueError(f"Failed to parse param {rest_param!r}") from exc
-            params[param_id] = param_value
-
+        params = _parse_getparam_response(response)
         _ensure_param_ids_match(param_ids, params.keys())
-
         return params
 
     async def _set_raw_parameters_batch(
         self,
         device_id: DeviceId,
         params: dict[int, str],
-    ) -> None:
-        await self.run_command(
+    ) -> dict[int, str]:
+        response = await self.run_command(
             device_id,
             "setparam " + ";".join(f"{id}:{raw}" for id, raw in params.items()),
         )
+        return _parse_setparam_response(response)
 
     async def run_command(
         self,
@@ -204,6 +403,51 @@ class CommandClient:
         raise last_exc
 
 
+def _parse_getparam_response(response: str) -> dict[int, str]:
+    params: dict[int, str] = {}
+    raw_params = response.split(";")
+
+    # first param is special: Param ID:1000 Value:300
+    first_param = raw_params[0]
+    first_param = first_param[9:]
+    try:
+        param_id, _, param_value = first_param.partition(" ")
+        param_value = param_value[6:]
+        param_id = int(param_id)
+    except ValueError as exc:
+        raise ValueError(f"Failed to parse first param {first_param!r}") from exc
+    params[param_id] = param_value
+
+    # others are: 10000:60
+    for rest_param in raw_params[1:]:
+        try:
+            param_id, _, param_value = rest_param.partition(":")
+            param_id = int(param_id)
+        except ValueError as exc:
+            raise ValueError(f"Failed to parse param {rest_param!r}") from exc
+        params[param_id] = param_value
+
+    return params
+
+
+def _parse_setparam_response(response: str) -> dict[int, str]:
+    # New value 2001:wap2;2002:user;2003:pass
+    prefix = "New value "
+    if not response.startswith(prefix):
+        raise ValueError(f"Unexpected setparam response {response!r}")
+    params: dict[int, str] = {}
+    for raw_param in response[len(prefix) :].split(";"):
+        if not raw_param:
+            continue
+        try:
+            param_id, _, param_value = raw_param.partition(":")
+            param_id = int(param_id)
+        except ValueError as exc:
+            raise ValueError(f"Failed to parse param {raw_param!r}") from exc
+        params[param_id] = param_value
+    return params
+
+
 def _ensure_param_ids_match(requested: Iterable[int], received: Iterable[int]) -> bool:
     requested_set = set(requested)
     received_set = set(received)
@@ -0,0 +1,136 @@
+import abc
+import collections
+import sqlite3
+from collections.abc import Mapping
+from pathlib import Path
+
+from teltek.cmd._device_id import DeviceId
+
+
+class DeviceStateCache(abc.ABC):
+    """Last confirmed raw parameters of every device.
+
+    Devices are keyed by IMEI, or by ICCID if the IMEI isn't known, so address
+    a device consistently. An entry keyed by the ICCID is dropped once the
+    device is updated with both IDs. Devices without any ID aren't cached.
+    """
+
+    @abc.abstractmethod
+    def get(self, device_id: DeviceId) -> dict[int, str] | None:
+        """Get the known raw parameters or `None` if the device is unknown."""
+
+    @abc.abstractmethod
+    def update(self, device_id: DeviceId, raw_params: Mapping[int, str]) -> None:
+        """Merge confirmed raw parameters into the state of the device."""
+
+    @abc.abstractmethod
+    def invalidate(self, device_id: DeviceId) -> None:
+        """Forget everything known about the device."""
+
+
+class MemoryStateCache(DeviceStateCache):
+    """Keep the state of the `max_devices` most recently used devices."""
+
+    def __init__(self, *, max_devices: int = 10_000) -> None:
+        assert max_devices >= 1
+        self._max_devices = max_devices
+        self._states: collections.OrderedDict[str, dict[int, str]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, device_id: DeviceId) -> dict[int, str] | None:
+        key = _cache_key(device_id)
+        if key is None:
+            return None
+        state = self._states.get(key)
+        if state is None:
+            return None
+        self._states.move_to_end(key)
+        return dict(state)
+
+    def update(self, device_id: DeviceId, raw_params: Mapping[int, str]) -> None:
+        key = _cache_key(device_id)
+        if key is None:
+            return
+        if (alias := _alias_key(device_id)) is not None:
+            self._states.pop(alias, None)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = {}
+            if len(self._states) > self._max_devices:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(key)
+        state.update(raw_params)
+
+    def invalidate(self, device_id: DeviceId) -> None:
+        for key in (_cache_key(device_id), _alias_key(device_id)):
+            if key is not None:
+                self._states.pop(key, None)
+
+
+class SqliteStateCache(DeviceStateCache):
+    """Persist device states in a SQLite database."""
+
+    def __init__(self, path: Path | str) -> None:
+        self._conn = sqlite3.connect(path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS device_params ("
+                " device TEXT NOT NULL,"
+                " param_id INTEGER NOT NULL,"
+                " value TEXT NOT NULL,"
+                " PRIMARY KEY (device, param_id)"
+                ") WITHOUT ROWID"
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, device_id: DeviceId) -> dict[int, str] | None:
+        key = _cache_key(device_id)
+        if key is None:
+            return None
+        rows = self._conn.execute(
+            "SELECT param_id, value FROM device_params WHERE device = ?", (key,)
+        ).fetchall()
+        if not rows:
+            return None
+        return dict(rows)
+
+    def update(self, device_id: DeviceId, raw_params: Mapping[int, str]) -> None:
+        key = _cache_key(device_id)
+        if key is None:
+            return
+        with self._conn:
+            if (alias := _alias_key(device_id)) is not None:
+                self._conn.execute(
+                    "DELETE FROM device_params WHERE device = ?", (alias,)
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO device_params VALUES (?, ?, ?)",
+                ((key, param_id, value) for param_id, value in raw_params.items()),
+            )
+
+    def invalidate(self, device_id: DeviceId) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM device_params WHERE device = ?",
+                (
+                    (key,)
+                    for key in (_cache_key(device_id), _alias_key(device_id))
+                    if key is not None
+                ),
+            )
+
+
+def _cache_key(device_id: DeviceId) -> str | None:
+    return device_id.imei or device_id.iccid
+
+
+def _alias_key(device_id: DeviceId) -> str | None:
+    """ICCID of a device also known by IMEI, its state may be keyed by it."""
+    return device_id.iccid if device_id.imei else None
@@ -1,5 +1,44 @@
+"""Transports running commands on devices.
+
+`MqttTransport` and `TruphoneTransport` are imported on first access, so
+importing `teltek.cmd` doesn't import their MQTT and HTTP clients.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from ._abc import Transport
-from ._mqtt import MqttTransport
-from ._sms import TruphoneTransport
+from ._queue import DeviceQueueStats
+from ._rate_limit import RateLimit
+
+if TYPE_CHECKING:
+    from ._mqtt import MqttTransport
+    from ._sms import TruphoneTransport
+
+__all__ = [
+    "Transport",
+    "MqttTransport",
+    "TruphoneTransport",
+    "DeviceQueueStats",
+    "RateLimit",
+]
+
+# transport name -> module defining it
+_LAZY_MODULES = {
+    "MqttTransport": "._mqtt",
+    "TruphoneTransport": "._sms",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # cache it so __getattr__ isn't called again
+    globals()[name] = value
+    return value
+
 
-__all__ = ["Transport", "MqttTransport", "TruphoneTransport"]
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,6 +1,9 @@
 import abc
+from collections.abc import Mapping
 
 from teltek.cmd._device_id import DeviceId
+from teltek.cmd.transport._queue import DeviceQueueStats
+from teltek.cmd.transport._rate_limit import RateLimit
 
 
 class Transport(abc.ABC):
@@ -8,5 +11,33 @@ class Transport(abc.ABC):
     @abc.abstractmethod
     def max_command_len(self) -> int: ...
 
+    @property
+    def max_concurrent_commands(self) -> int | None:
+        """Maximum number of commands in flight across all devices.
+
+        Enforced by the transport once a command got its turn on the device.
+        `None` means the transport doesn't impose a limit.
+        """
+        return None
+
+    @property
+    def rate_limit(self) -> RateLimit | None:
+        """Maximum rate of commands across all devices.
+
+        Enforced by the transport once a command got its turn on the device.
+        `None` means the transport doesn't impose a limit.
+        """
+        return None
+
+    @property
+    def max_pipelined_commands(self) -> int:
+        """Number of commands that can be in flight for a single device."""
+        return 1
+
+    @property
+    def device_queue_stats(self) -> Mapping[str, DeviceQueueStats]:
+        """Command queueing per device, keyed by IMEI or ICCID."""
+        return {}
+
     @abc.abstractmethod
     async def run_command(self, device_id: DeviceId, command: str) -> str: ...
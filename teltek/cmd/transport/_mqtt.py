@@ -1,5 +1,8 @@
 import asyncio
+import collections
+import dataclasses
 import logging
+import time
 from types import TracebackType
 from typing import Self, cast
 
@@ -8,13 +11,39 @@ from aiomqtt import Client
 
 from teltek.cmd._device_id import DeviceId
 from teltek.cmd.transport._abc import Transport
+from teltek.cmd.transport._queue import DeviceQueueStats, _DeviceQueues
+from teltek.cmd.transport._rate_limit import RateLimit, _CommandLimiter
 from teltek.codec import Codec12, Codec12Type, CodecId, MessageFrame
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class _Tombstone:
+    """Slot of a request that gave up waiting, its late response is dropped."""
+
+    expires: float
+    """monotonic time after which no response is expected anymore"""
+
+
 class MqttTransport(Transport):
+    """Run commands over MQTT using Codec 12 frames.
+
+    Up to `pipeline_depth` commands are sent to a device without waiting for
+    the previous response. The device answers them in order, so responses are
+    matched to requests in FIFO order. Further callers for the same device
+    wait for their turn.
+
+    A request that times out or is cancelled leaves a tombstone in its slot, so
+    its late response is dropped instead of being matched to the next request.
+    If no response arrives within `_LATE_RESP_TIMEOUT`, the tombstone expires.
+
+    `max_concurrent_commands` and `rate_limit` bound the load on the broker
+    across all devices.
+    """
+
     _RESP_TIMEOUT = 15
+    _LATE_RESP_TIMEOUT = 15
 
     def __init__(
         self,
@@ -22,13 +51,24 @@ class MqttTransport(Transport):
         *,
         command_topic: str = "{imei}/commands",
         data_topic: str = "{imei}/data",
+        pipeline_depth: int = 1,
+        max_concurrent_commands: int | None = None,
+        rate_limit: RateLimit | None = None,
     ) -> None:
         super().__init__()
+        assert pipeline_depth >= 1
         self._client = client
+        self._pipeline_depth = pipeline_depth
+        self._max_concurrent_commands = max_concurrent_commands
+        self._rate_limit = rate_limit
         self._command_topic = command_topic
         self._data_topic = parse.compile(data_topic)  # type: ignore
         self._reader_task: asyncio.Task[None] | None = None
-        self._pending_requests: dict[str, asyncio.Future[Codec12]] = {}
+        self._pending_requests: dict[
+            str, collections.deque[asyncio.Future[Codec12] | _Tombstone]
+        ] = {}
+        self._device_queues = _DeviceQueues(pipeline_depth)
+        self._command_limiter = _CommandLimiter(max_concurrent_commands, rate_limit)
         self._subscribed_imeis: set[str] = set()
 
     async def __aenter__(self) -> Self:
@@ -48,6 +88,7 @@ class MqttTransport(Transport):
             self._reader_task = None
         await self._client.__aexit__(exc_type, exc_value, traceback)
         self._pending_requests.clear()
+        self._device_queues.clear()
         self._subscribed_imeis.clear()
 
     async def run_command(self, device_id: DeviceId, command: str) -> str:
@@ -55,8 +96,10 @@ class MqttTransport(Transport):
         return await self._run_command_imei(device_id.imei, command)
 
     async def _run_command_imei(self, imei: str, command: str) -> str:
-        assert imei not in self._pending_requests
+        async with self._device_queues.slot(imei), self._command_limiter.slot():
+            return await self._run_pipelined_command(imei, command)
 
+    async def _run_pipelined_command(self, imei: str, command: str) -> str:
         command_topic = self._get_command_topic(imei)
         data_topic = self._get_data_topic(imei)
 
@@ -65,13 +108,43 @@ class MqttTransport(Transport):
             await self._client.subscribe(data_topic)
 
         req_frame = Codec12(type=Codec12Type.REQUEST, content=command).to_frame()
-        fut = self._pending_requests[imei] = asyncio.Future()
+        fut: asyncio.Future[Codec12] = asyncio.Future()
+        pending = self._pending_requests.setdefault(imei, collections.deque())
+        _drop_expired_tombstones(pending)
+        pending.append(fut)
+        sent = False
         try:
             await self._client.publish(command_topic, req_frame.encode())
+            sent = True
             response = await asyncio.wait_for(fut, timeout=self._RESP_TIMEOUT)
             return response.content
         finally:
-            self._pending_requests.pop(imei)
+            if fut in pending:
+                if sent:
+                    # timed out or cancelled, the device may still answer
+                    expires = time.monotonic() + self._LATE_RESP_TIMEOUT
+                    pending[pending.index(fut)] = _Tombstone(expires)
+                else:
+                    pending.remove(fut)
+            # the reader drops emptied queues too, keep a newer one
+            if not pending and self._pending_requests.get(imei) is pending:
+                del self._pending_requests[imei]
+
+    @property
+    def max_concurrent_commands(self) -> int | None:
+        return self._max_concurrent_commands
+
+    @property
+    def rate_limit(self) -> RateLimit | None:
+        return self._rate_limit
+
+    @property
+    def max_pipelined_commands(self) -> int:
+        return self._pipeline_depth
+
+    @property
+    def device_queue_stats(self) -> dict[str, DeviceQueueStats]:
+        return self._device_queues.stats
 
     @property
     def max_command_len(self) -> int:
@@ -93,17 +166,35 @@ class MqttTransport(Transport):
             assert isinstance(res, parse.Result)
             imei = cast(str, res["imei"])
 
-            fut = self._pending_requests.get(imei)
-            if fut is None or fut.done():
+            pending = self._pending_requests.get(imei)
+            if not pending:
                 continue
             try:
                 frame = MessageFrame.decode(msg.payload)  # type: ignore
             except Exception as exc:
                 _LOGGER.exception("failed to decode message", exc_info=exc)
                 continue
+            if frame.codec_id != CodecId.CODEC_12:
+                continue
+            # responses arrive in the order the commands were sent
+            _drop_expired_tombstones(pending)
+            fut = pending.popleft() if pending else None
+            if not pending:
+                self._pending_requests.pop(imei, None)
+            if fut is None or isinstance(fut, _Tombstone) or fut.done():
+                _LOGGER.debug("dropping response of abandoned request of %s", imei)
+                continue
             try:
-                if frame.codec_id == CodecId.CODEC_12:
-                    codec = Codec12.from_frame(frame)
-                    fut.set_result(codec)
+                codec = Codec12.from_frame(frame)
             except Exception as exc:
                 fut.set_exception(exc)
+            else:
+                fut.set_result(codec)
+
+
+def _drop_expired_tombstones(
+    pending: collections.deque[asyncio.Future[Codec12] | _Tombstone],
+) -> None:
+    now = time.monotonic()
+    while pending and isinstance(pending[0], _Tombstone) and pending[0].expires < now:
+        pending.popleft()
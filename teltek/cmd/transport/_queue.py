@@ -0,0 +1,58 @@
+import asyncio
+import contextlib
+import dataclasses
+import time
+from collections.abc import AsyncIterator
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeviceQueueStats:
+    """Queueing of commands for a single device."""
+
+    waiting: int = 0
+    """callers currently waiting for their turn"""
+    max_waiting: int = 0
+    commands: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.commands if self.commands else 0.0
+
+
+class _DeviceQueues:
+    """Serialise commands per device, allowing `slots` of them in flight."""
+
+    def __init__(self, slots: int = 1) -> None:
+        assert slots >= 1
+        self._slots = slots
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self.stats: dict[str, DeviceQueueStats] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(self._slots)
+            self.stats[key] = DeviceQueueStats()
+        stats = self.stats[key]
+
+        start = time.monotonic()
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+        waited = time.monotonic() - start
+        stats.commands += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def clear(self) -> None:
+        self._semaphores.clear()
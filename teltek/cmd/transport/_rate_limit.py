@@ -0,0 +1,68 @@
+import asyncio
+import contextlib
+import dataclasses
+import time
+from collections.abc import AsyncIterator
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RateLimit:
+    """At most `commands` commands per `interval` seconds, bursts included."""
+
+    commands: int
+    interval: float
+
+    def __post_init__(self) -> None:
+        assert self.commands >= 1
+        assert self.interval > 0
+
+
+class _RateLimiter:
+    """Token bucket enforcing a `RateLimit`, waiting callers are served in order."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        self._capacity = limit.commands
+        self._rate = limit.commands / limit.interval
+        self._tokens = float(limit.commands)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class _CommandLimiter:
+    """Enforce the limits of a transport across all devices.
+
+    Transports take a slot only once the command got its turn on the device,
+    commands queued behind a busy device don't hold back the others.
+    """
+
+    def __init__(
+        self, max_concurrent_commands: int | None, rate_limit: RateLimit | None
+    ) -> None:
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrent_commands)
+            if max_concurrent_commands is not None
+            else None
+        )
+        self._rate_limiter = (
+            _RateLimiter(rate_limit) if rate_limit is not None else None
+        )
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._semaphore or contextlib.nullcontext():
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            yield
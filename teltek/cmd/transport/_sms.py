@@ -11,11 +11,21 @@ import httpx
 
 from teltek.cmd._device_id import DeviceId
 from teltek.cmd.transport._abc import Transport
+from teltek.cmd.transport._queue import DeviceQueueStats, _DeviceQueues
+from teltek.cmd.transport._rate_limit import RateLimit, _CommandLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class TruphoneTransport(Transport):
+    """Run commands over SMS through the Truphone IoT portal.
+
+    Every command is two portal requests, and responses are found by polling
+    the latest SMS page. Limit `max_concurrent_commands` to keep the
+    outstanding responses within that page, e.g. to 20, and set `rate_limit`
+    to spare the portal.
+    """
+
     _IOT_BASE_URL = "https://iot.truphone.com"
     _POLL_INTERVAL = 1
     _RESP_TIMEOUT = 20
@@ -27,8 +37,12 @@ class TruphoneTransport(Transport):
         password: str,
         device_username: str = "",
         device_password: str = "",
+        max_concurrent_commands: int | None = None,
+        rate_limit: RateLimit | None = None,
     ) -> None:
         super().__init__()
+        self._max_concurrent_commands = max_concurrent_commands
+        self._rate_limit = rate_limit
         self._device_username = device_username
         self._device_password = device_password
         self._max_command_len = 160 - len(
@@ -38,6 +52,9 @@ class TruphoneTransport(Transport):
         self._reader_task: asyncio.Task[None] | None = None
         self._active_event = asyncio.Event()
         self._pending_requests: dict[str, tuple[asyncio.Future[str], datetime]] = {}
+        # responses can't be correlated to requests, so only one per SIM
+        self._device_queues = _DeviceQueues()
+        self._command_limiter = _CommandLimiter(max_concurrent_commands, rate_limit)
         self._seen_responses: set[int] = set()
 
     async def __aenter__(self) -> Self:
@@ -58,17 +75,34 @@ class TruphoneTransport(Transport):
         await self._client.__aexit__(exc_type, exc_value, traceback)
         self._active_event.clear()
         self._pending_requests.clear()
+        self._device_queues.clear()
         self._seen_responses.clear()
 
     @property
     def max_command_len(self) -> int:
         return self._max_command_len
 
+    @property
+    def max_concurrent_commands(self) -> int | None:
+        return self._max_concurrent_commands
+
+    @property
+    def rate_limit(self) -> RateLimit | None:
+        return self._rate_limit
+
+    @property
+    def device_queue_stats(self) -> dict[str, DeviceQueueStats]:
+        return self._device_queues.stats
+
     async def run_command(self, device_id: DeviceId, command: str) -> str:
         assert device_id.iccid is not None, "ICCID required"
         return await self._run_command_iccid(device_id.iccid, command)
 
     async def _run_command_iccid(self, iccid: str, command: str) -> str:
+        async with self._device_queues.slot(iccid), self._command_limiter.slot():
+            return await self._run_queued_command(iccid, command)
+
+    async def _run_queued_command(self, iccid: str, command: str) -> str:
         assert iccid not in self._pending_requests
         message = f"{self._device_username} {self._device_password} {command}"
         (fut, _) = self._pending_requests[iccid] = (
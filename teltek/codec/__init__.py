@@ -1,21 +1,42 @@
+from teltek.codec._avl import AvlCodec, decode_avl, decode_avl_frame
+from teltek.codec._codec8 import Codec8, Codec8AvlData, Codec8IoElement
 from teltek.codec._codec12 import Codec12, Codec12Type
+from teltek.codec._codec16 import Codec16, Codec16AvlData, Codec16IoElement
 from teltek.codec._error import CodecException
 from teltek.codec._frame import CodecId, MessageFrame
+from teltek.codec._stream import FrameDecoder
+from teltek.codec._udp import UdpAvlAck, UdpAvlPacket
 from teltek.codec._codec8e import (
     Codec8e,
     Codec8eGpsElement,
     Codec8eAvlData,
     Codec8eIoElement,
+    Codec8eLazyAvlData,
 )
+from teltek.codec._columnar import Codec8eColumns
 
 __all__ = [
+    "AvlCodec",
+    "decode_avl",
+    "decode_avl_frame",
+    "Codec8",
+    "Codec8AvlData",
+    "Codec8IoElement",
     "Codec12",
     "Codec12Type",
+    "Codec16",
+    "Codec16AvlData",
+    "Codec16IoElement",
     "CodecException",
     "CodecId",
     "MessageFrame",
+    "FrameDecoder",
+    "UdpAvlAck",
+    "UdpAvlPacket",
     "Codec8e",
     "Codec8eGpsElement",
     "Codec8eAvlData",
     "Codec8eIoElement",
+    "Codec8eLazyAvlData",
+    "Codec8eColumns",
 ]
@@ -0,0 +1,26 @@
+from teltek.codec._codec8 import Codec8
+from teltek.codec._codec8e import Codec8e
+from teltek.codec._codec16 import Codec16
+from teltek.codec._error import CodecException
+from teltek.codec._frame import CodecId, MessageFrame
+
+AvlCodec = Codec8 | Codec8e | Codec16
+
+_AVL_CODECS: dict[CodecId, type[Codec8] | type[Codec8e] | type[Codec16]] = {
+    CodecId.CODEC_8: Codec8,
+    CodecId.CODEC_8E: Codec8e,
+    CodecId.CODEC_16: Codec16,
+}
+
+
+def decode_avl_frame(frame: MessageFrame) -> AvlCodec:
+    """Decode an AVL data frame with the codec given by its codec id."""
+    return decode_avl(frame.codec_id, frame.data)
+
+
+def decode_avl(codec_id: CodecId, body: bytes) -> AvlCodec:
+    try:
+        codec = _AVL_CODECS[codec_id]
+    except KeyError:
+        raise CodecException(f"expected an avl data codec but got {codec_id}") from None
+    return codec.decode(body)
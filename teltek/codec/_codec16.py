@@ -0,0 +1,125 @@
+import dataclasses
+import struct
+from typing import Self
+
+from teltek.codec._codec8 import (
+    _decode_avl_header,
+    _decode_fixed_ios,
+    _decode_records_header,
+    _encode_avl_header,
+    _encode_fixed_ios,
+    _ensure_no_leftover,
+)
+from teltek.codec._codec8e import _AVL_HEADER, Codec8eGpsElement
+from teltek.codec._error import CodecException
+from teltek.codec._frame import CodecId, MessageFrame
+
+_U8 = struct.Struct(">B")
+# io id followed by the value
+_FIXED_IO_STRUCTS = {
+    1: struct.Struct(">HB"),
+    2: struct.Struct(">HH"),
+    4: struct.Struct(">HI"),
+    8: struct.Struct(">HQ"),
+}
+# event io id, generation type, total io count
+_IO_HEADER = struct.Struct(">HBB")
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Codec16:
+    avl_data: "list[Codec16AvlData]"
+
+    def encode(self) -> bytes:
+        records = len(self.avl_data).to_bytes(1, byteorder="big")
+        return records + b"".join(avl.encode() for avl in self.avl_data) + records
+
+    @classmethod
+    def decode(cls, body: bytes) -> Self:
+        view, records = _decode_records_header(body, "codec16")
+        end = len(view) - 1
+        offset = 1
+        avl_data: list[Codec16AvlData] = []
+        for _ in range(records):
+            (data, offset) = Codec16AvlData._decode_from(view, offset, end)
+            avl_data.append(data)
+        _ensure_no_leftover(view, offset, end, "codec16")
+        return cls(avl_data=avl_data)
+
+    def to_frame(self) -> MessageFrame:
+        return MessageFrame.build(CodecId.CODEC_16, self.encode())
+
+    @classmethod
+    def from_frame(cls, frame: MessageFrame) -> Self:
+        if frame.codec_id != CodecId.CODEC_16:
+            raise CodecException(f"expected codec16 but got {frame.codec_id}")
+        return cls.decode(frame.data)
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Codec16IoElement:
+    event_io_id: int
+    generation_type: int
+    n1: dict[int, int]
+    n2: dict[int, int]
+    n4: dict[int, int]
+    n8: dict[int, int]
+
+    def encode(self) -> bytes:
+        total_count = len(self.n1) + len(self.n2) + len(self.n4) + len(self.n8)
+        header = _IO_HEADER.pack(self.event_io_id, self.generation_type, total_count)
+        return header + _encode_fixed_ios(
+            (self.n1, self.n2, self.n4, self.n8), _U8, _FIXED_IO_STRUCTS
+        )
+
+    @classmethod
+    def decode(cls, body: bytes) -> tuple[Self, int]:
+        return cls._decode_from(memoryview(body), 0, len(body))
+
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int, end: int) -> tuple[Self, int]:
+        if end - offset < _IO_HEADER.size:
+            raise CodecException(
+                f"expected at least {_IO_HEADER.size} bytes for io element but got {end - offset}"
+            )
+        (event_io_id, generation_type, total_count) = _IO_HEADER.unpack_from(
+            view, offset
+        )
+        ((n1, n2, n4, n8), offset) = _decode_fixed_ios(
+            view, offset + _IO_HEADER.size, end, _U8, _FIXED_IO_STRUCTS
+        )
+        if total_count != len(n1) + len(n2) + len(n4) + len(n8):
+            raise CodecException(
+                f"total count {total_count} does not match sum of all io counts"
+            )
+        return cls(
+            event_io_id=event_io_id,
+            generation_type=generation_type,
+            n1=n1,
+            n2=n2,
+            n4=n4,
+            n8=n8,
+        ), offset
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Codec16AvlData:
+    timestamp: int
+    priority: int
+    gps: Codec8eGpsElement
+    io: Codec16IoElement
+
+    def encode(self) -> bytes:
+        return _encode_avl_header(self.timestamp, self.priority, self.gps) + (
+            self.io.encode()
+        )
+
+    @classmethod
+    def decode(cls, body: bytes) -> tuple[Self, int]:
+        return cls._decode_from(memoryview(body), 0, len(body))
+
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int, end: int) -> tuple[Self, int]:
+        (timestamp, priority, gps) = _decode_avl_header(view, offset, end)
+        io, io_end = Codec16IoElement._decode_from(view, offset + _AVL_HEADER.size, end)
+        return cls(timestamp=timestamp, priority=priority, gps=gps, io=io), io_end
@@ -0,0 +1,203 @@
+import dataclasses
+import struct
+from typing import Self
+
+from teltek.codec._codec8e import _AVL_HEADER, Codec8eGpsElement
+from teltek.codec._error import CodecException
+from teltek.codec._frame import CodecId, MessageFrame
+
+_U8 = struct.Struct(">B")
+# io id followed by the value
+_FIXED_IO_STRUCTS = {
+    1: struct.Struct(">BB"),
+    2: struct.Struct(">BH"),
+    4: struct.Struct(">BI"),
+    8: struct.Struct(">BQ"),
+}
+# event io id, total io count
+_IO_HEADER = struct.Struct(">BB")
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Codec8:
+    avl_data: "list[Codec8AvlData]"
+
+    def encode(self) -> bytes:
+        records = len(self.avl_data).to_bytes(1, byteorder="big")
+        return records + b"".join(avl.encode() for avl in self.avl_data) + records
+
+    @classmethod
+    def decode(cls, body: bytes) -> Self:
+        view, records = _decode_records_header(body, "codec8")
+        end = len(view) - 1
+        offset = 1
+        avl_data: list[Codec8AvlData] = []
+        for _ in range(records):
+            (data, offset) = Codec8AvlData._decode_from(view, offset, end)
+            avl_data.append(data)
+        _ensure_no_leftover(view, offset, end, "codec8")
+        return cls(avl_data=avl_data)
+
+    def to_frame(self) -> MessageFrame:
+        return MessageFrame.build(CodecId.CODEC_8, self.encode())
+
+    @classmethod
+    def from_frame(cls, frame: MessageFrame) -> Self:
+        if frame.codec_id != CodecId.CODEC_8:
+            raise CodecException(f"expected codec8 but got {frame.codec_id}")
+        return cls.decode(frame.data)
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Codec8IoElement:
+    event_io_id: int
+    n1: dict[int, int]
+    n2: dict[int, int]
+    n4: dict[int, int]
+    n8: dict[int, int]
+
+    def encode(self) -> bytes:
+        total_count = len(self.n1) + len(self.n2) + len(self.n4) + len(self.n8)
+        return _IO_HEADER.pack(self.event_io_id, total_count) + _encode_fixed_ios(
+            (self.n1, self.n2, self.n4, self.n8), _U8, _FIXED_IO_STRUCTS
+        )
+
+    @classmethod
+    def decode(cls, body: bytes) -> tuple[Self, int]:
+        return cls._decode_from(memoryview(body), 0, len(body))
+
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int, end: int) -> tuple[Self, int]:
+        if end - offset < _IO_HEADER.size:
+            raise CodecException(
+                f"expected at least {_IO_HEADER.size} bytes for io element but got {end - offset}"
+            )
+        (event_io_id, total_count) = _IO_HEADER.unpack_from(view, offset)
+        ((n1, n2, n4, n8), offset) = _decode_fixed_ios(
+            view, offset + _IO_HEADER.size, end, _U8, _FIXED_IO_STRUCTS
+        )
+        if total_count != len(n1) + len(n2) + len(n4) + len(n8):
+            raise CodecException(
+                f"total count {total_count} does not match sum of all io counts"
+            )
+        return cls(event_io_id=event_io_id, n1=n1, n2=n2, n4=n4, n8=n8), offset
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Codec8AvlData:
+    timestamp: int
+    priority: int
+    gps: Codec8eGpsElement
+    io: Codec8IoElement
+
+    def encode(self) -> bytes:
+        return _encode_avl_header(self.timestamp, self.priority, self.gps) + (
+            self.io.encode()
+        )
+
+    @classmethod
+    def decode(cls, body: bytes) -> tuple[Self, int]:
+        return cls._decode_from(memoryview(body), 0, len(body))
+
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int, end: int) -> tuple[Self, int]:
+        (timestamp, priority, gps) = _decode_avl_header(view, offset, end)
+        io, io_end = Codec8IoElement._decode_from(view, offset + _AVL_HEADER.size, end)
+        return cls(timestamp=timestamp, priority=priority, gps=gps, io=io), io_end
+
+
+def _decode_records_header(body: bytes, name: str) -> tuple[memoryview, int]:
+    if len(body) < 2:
+        raise CodecException(f"expected at least 2 bytes for {name}, got {len(body)}")
+    records = body[0]
+    records2 = body[-1]
+    if records != records2:
+        raise CodecException(
+            f"first quantity {records} does not match last quantity {records2}"
+        )
+    return memoryview(body), records
+
+
+def _ensure_no_leftover(view: memoryview, offset: int, end: int, name: str) -> None:
+    if offset != end:
+        raise CodecException(
+            f"leftover bytes after decoding {name}: {bytes(view[offset:end])!r}"
+        )
+
+
+def _encode_avl_header(timestamp: int, priority: int, gps: Codec8eGpsElement) -> bytes:
+    return _AVL_HEADER.pack(
+        timestamp,
+        priority,
+        gps.longitude,
+        gps.latitude,
+        gps.altitude,
+        gps.angle,
+        gps.satellites,
+        gps.speed,
+    )
+
+
+def _decode_avl_header(
+    view: memoryview, offset: int, end: int
+) -> tuple[int, int, Codec8eGpsElement]:
+    if end - offset < _AVL_HEADER.size:
+        raise CodecException(
+            f"expected at least {_AVL_HEADER.size} bytes for avl data but got {end - offset}"
+        )
+    (
+        timestamp,
+        priority,
+        longitude,
+        latitude,
+        altitude,
+        angle,
+        satellites,
+        speed,
+    ) = _AVL_HEADER.unpack_from(view, offset)
+    gps = Codec8eGpsElement(
+        longitude=longitude,
+        latitude=latitude,
+        altitude=altitude,
+        angle=angle,
+        satellites=satellites,
+        speed=speed,
+    )
+    return timestamp, priority, gps
+
+
+def _encode_fixed_ios(
+    ios: tuple[dict[int, int], ...],
+    count_struct: struct.Struct,
+    io_structs: dict[int, struct.Struct],
+) -> bytes:
+    parts: list[bytes] = []
+    for section, io_struct in zip(ios, io_structs.values(), strict=True):
+        parts.append(count_struct.pack(len(section)))
+        parts.extend(io_struct.pack(id, value) for id, value in section.items())
+    return b"".join(parts)
+
+
+def _decode_fixed_ios(
+    view: memoryview,
+    offset: int,
+    end: int,
+    count_struct: struct.Struct,
+    io_structs: dict[int, struct.Struct],
+) -> tuple[list[dict[int, int]], int]:
+    sections: list[dict[int, int]] = []
+    for n, io_struct in io_structs.items():
+        if end - offset < count_struct.size:
+            raise CodecException(
+                f"expected at least {count_struct.size} byte(s) for fixed io (n={n}) count but got {end - offset}"
+            )
+        (count,) = count_struct.unpack_from(view, offset)
+        offset += count_struct.size
+        ios_end = offset + count * io_struct.size
+        if ios_end > end:
+            raise CodecException(
+                f"expected at least {count * io_struct.size} bytes for fixed io (n={n}) but got {end - offset}"
+            )
+        sections.append(dict(io_struct.iter_unpack(view[offset:ios_end])))
+        offset = ios_end
+    return sections, offset
@@ -1,8 +1,40 @@
 import dataclasses
+import functools
+import itertools
+import struct
 from typing import Self
 
 from teltek.codec._error import CodecException
-from teltek.codec._frame import CodecId, MessageFrame
+from teltek.codec._frame import CodecId, MessageFrame, _encode_frame_into
+
+_U8 = struct.Struct(">B")
+_U16 = struct.Struct(">H")
+# event io id, total io count
+_IO_HEADER = struct.Struct(">HH")
+# longitude, latitude, altitude, angle, satellites, speed
+_GPS_ELEMENT = struct.Struct(">iiHHBH")
+# timestamp, priority followed by the gps element
+_AVL_HEADER = struct.Struct(">QB" + _GPS_ELEMENT.format[1:])
+# io id followed by the value
+_FIXED_IO_STRUCTS = {
+    1: struct.Struct(">HB"),
+    2: struct.Struct(">HH"),
+    4: struct.Struct(">HI"),
+    8: struct.Struct(">HQ"),
+}
+# io id followed by the value length
+_DYNAMIC_IO_HEADER = struct.Struct(">HH")
+# (n, struct, element size) of the fixed io sections in encoding order
+_FIXED_IO_SECTIONS = tuple(
+    (n, io_struct, io_struct.size) for n, io_struct in _FIXED_IO_STRUCTS.items()
+)
+
+
+@functools.cache
+def _fixed_io_section_struct(n: int, count: int) -> struct.Struct:
+    # count followed by count elements
+    element_format = _FIXED_IO_STRUCTS[n].format[1:]
+    return struct.Struct(">H" + element_format * count)
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True)
@@ -10,11 +42,64 @@ class Codec8e:
     avl_data: "list[Codec8eAvlData]"
 
     def encode(self) -> bytes:
-        records = len(self.avl_data).to_bytes(1, byteorder="big")
-        return records + b"".join(avl.encode() for avl in self.avl_data) + records
+        buf = bytearray(self.encoded_len())
+        self.encode_into(buf, 0)
+        return bytes(buf)
+
+    def encoded_len(self) -> int:
+        return 2 + sum(avl.encoded_len() for avl in self.avl_data)
+
+    def encode_into(self, buf: bytearray | memoryview, offset: int) -> int:
+        """Encode into buf at offset and return the offset after the data."""
+        records = len(self.avl_data)
+        _U8.pack_into(buf, offset, records)
+        offset += 1
+        for avl in self.avl_data:
+            offset = avl.encode_into(buf, offset)
+        _U8.pack_into(buf, offset, records)
+        return offset + 1
+
+    def encode_frame_into(self, buf: bytearray | memoryview, offset: int = 0) -> int:
+        """Encode a complete message frame into buf without intermediate copies.
+
+        Use `frame_len` to size the buffer. Returns the offset after the frame.
+        """
+        return _encode_frame_into(buf, offset, CodecId.CODEC_8E, self.encode_into)
+
+    def frame_len(self) -> int:
+        return MessageFrame.frame_len(self.encoded_len())
 
     @classmethod
     def decode(cls, body: bytes) -> Self:
+        view, records = cls._decode_header(body)
+        end = len(view) - 1
+        offset = 1
+        avl_data: list[Codec8eAvlData] = []
+        for _ in range(records):
+            (data, offset) = Codec8eAvlData._decode_from(view, offset, end)
+            avl_data.append(data)
+        cls._ensure_no_leftover(view, offset, end)
+        return cls(avl_data=avl_data)
+
+    @classmethod
+    def decode_lazy(cls, body: bytes) -> "list[Codec8eLazyAvlData]":
+        """Decode records without decoding their io elements.
+
+        Only the record lengths are validated up front, the io elements are
+        decoded on first access.
+        """
+        view, records = cls._decode_header(body)
+        end = len(view) - 1
+        offset = 1
+        avl_data: list[Codec8eLazyAvlData] = []
+        for _ in range(records):
+            (data, offset) = Codec8eLazyAvlData._decode_from(view, offset, end)
+            avl_data.append(data)
+        cls._ensure_no_leftover(view, offset, end)
+        return avl_data
+
+    @staticmethod
+    def _decode_header(body: bytes) -> tuple[memoryview, int]:
         # min size according to docs
         if len(body) < 45:
             raise CodecException(
@@ -27,21 +112,15 @@ class Codec8e:
             raise CodecException(
                 f"first quantity {records} does not match last quantity {records2}"
             )
+        return memoryview(body), records
 
-        avl_data: list[Codec8eAvlData] = []
-        remaining_body = body[1:-1]
-        for _ in range(records):
-            (data, consumed) = Codec8eAvlData.decode(remaining_body)
-            avl_data.append(data)
-            remaining_body = remaining_body[consumed:]
-
-        if remaining_body:
+    @staticmethod
+    def _ensure_no_leftover(view: memoryview, offset: int, end: int) -> None:
+        if offset != end:
             raise CodecException(
-                f"leftover bytes after decoding codec8e: {remaining_body!r}"
+                f"leftover bytes after decoding codec8e: {bytes(view[offset:end])!r}"
             )
 
-        return cls(avl_data=avl_data)
-
     def to_frame(self) -> MessageFrame:
         return MessageFrame.build(CodecId.CODEC_8E, self.encode())
 
@@ -62,28 +141,40 @@ class Codec8eGpsElement:
     speed: int
 
     def encode(self) -> bytes:
-        return (
-            self.longitude.to_bytes(4, byteorder="big")
-            + self.latitude.to_bytes(4, byteorder="big")
-            + self.altitude.to_bytes(2, byteorder="big")
-            + self.angle.to_bytes(2, byteorder="big")
-            + self.satellites.to_bytes(1, byteorder="big")
-            + self.speed.to_bytes(2, byteorder="big")
+        return _GPS_ELEMENT.pack(
+            self.longitude,
+            self.latitude,
+            self.altitude,
+            self.angle,
+            self.satellites,
+            self.speed,
         )
 
     @classmethod
     def decode(cls, body: bytes) -> Self:
-        if len(body) != 15:
+        if len(body) != _GPS_ELEMENT.size:
             raise CodecException(
-                f"expected 15 bytes for gps element but got {len(body)}"
+                f"expected {_GPS_ELEMENT.size} bytes for gps element but got {len(body)}"
             )
+        return cls._decode_from(memoryview(body), 0)
+
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int) -> Self:
+        (
+            longitude,
+            latitude,
+            altitude,
+            angle,
+            satellites,
+            speed,
+        ) = _GPS_ELEMENT.unpack_from(view, offset)
         return cls(
-            longitude=int.from_bytes(body[0:4], byteorder="big"),
-            latitude=int.from_bytes(body[4:8], byteorder="big"),
-            altitude=int.from_bytes(body[8:10], byteorder="big"),
-            angle=int.from_bytes(body[10:12], byteorder="big"),
-            satellites=int.from_bytes(body[12:13], byteorder="big"),
-            speed=int.from_bytes(body[13:15], byteorder="big"),
+            longitude=longitude,
+            latitude=latitude,
+            altitude=altitude,
+            angle=angle,
+            satellites=satellites,
+            speed=speed,
         )
 
 
@@ -97,105 +188,135 @@ class Codec8eIoElement:
     nx: dict[int, bytes]
 
     def encode(self) -> bytes:
-        total_count = (
-            len(self.n1) + len(self.n2) + len(self.n4) + len(self.n8) + len(self.nx)
-        )
+        buf = bytearray(self.encoded_len())
+        self.encode_into(buf, 0)
+        return bytes(buf)
+
+    def encoded_len(self) -> int:
         return (
-            self.event_io_id.to_bytes(2, "big")
-            + total_count.to_bytes(2, "big")
-            + self._encode_fixed_io(self.n1, 1)
-            + self._encode_fixed_io(self.n2, 2)
-            + self._encode_fixed_io(self.n4, 4)
-            + self._encode_fixed_io(self.n8, 8)
-            + self._encode_dynamic_io(self.nx)
+            _IO_HEADER.size
+            + 5 * _U16.size
+            + len(self.n1) * _FIXED_IO_STRUCTS[1].size
+            + len(self.n2) * _FIXED_IO_STRUCTS[2].size
+            + len(self.n4) * _FIXED_IO_STRUCTS[4].size
+            + len(self.n8) * _FIXED_IO_STRUCTS[8].size
+            + sum(_DYNAMIC_IO_HEADER.size + len(value) for value in self.nx.values())
         )
 
-    @staticmethod
-    def _encode_fixed_io(ios: dict[int, int], n: int) -> bytes:
-        count = len(ios).to_bytes(2, "big")
-        return count + b"".join(
-            id.to_bytes(2, "big") + value.to_bytes(n, "big")
-            for id, value in ios.items()
+    def encode_into(self, buf: bytearray | memoryview, offset: int) -> int:
+        """Encode into buf at offset and return the offset after the data."""
+        total_count = (
+            len(self.n1) + len(self.n2) + len(self.n4) + len(self.n8) + len(self.nx)
         )
+        _IO_HEADER.pack_into(buf, offset, self.event_io_id, total_count)
+        offset += _IO_HEADER.size
+        for ios, n in ((self.n1, 1), (self.n2, 2), (self.n4, 4), (self.n8, 8)):
+            # count and all elements of the section in a single call
+            section_struct = _fixed_io_section_struct(n, len(ios))
+            section_struct.pack_into(
+                buf, offset, len(ios), *itertools.chain.from_iterable(ios.items())
+            )
+            offset += section_struct.size
 
-    @staticmethod
-    def _encode_dynamic_io(ios: dict[int, bytes]) -> bytes:
-        count = len(ios).to_bytes(2, "big")
-        return count + b"".join(
-            id.to_bytes(2, "big") + len(value).to_bytes(2, "big") + value
-            for id, value in ios.items()
-        )
+        _U16.pack_into(buf, offset, len(self.nx))
+        offset += _U16.size
+        for id, value in self.nx.items():
+            _DYNAMIC_IO_HEADER.pack_into(buf, offset, id, len(value))
+            offset += _DYNAMIC_IO_HEADER.size
+            buf[offset : offset + len(value)] = value
+            offset += len(value)
+        return offset
 
     @classmethod
     def decode(cls, body: bytes) -> tuple[Self, int]:
-        if len(body) < 4:
-            raise CodecException(
-                f"expected at least 4 bytes for io element but got {len(body)}"
-            )
-
-        event_io_id = int.from_bytes(body[0:2], "big")
-        total_count = int.from_bytes(body[2:4], "big")
+        return cls._decode_from(memoryview(body), 0, len(body))
 
-        offset = 4
-        (n1, consumed) = cls._decode_fixed_io(body[offset:], 1)
-        offset += consumed
-        (n2, consumed) = cls._decode_fixed_io(body[offset:], 2)
-        offset += consumed
-        (n4, consumed) = cls._decode_fixed_io(body[offset:], 4)
-        offset += consumed
-        (n8, consumed) = cls._decode_fixed_io(body[offset:], 8)
-        offset += consumed
-
-        (nx, consumed) = cls._decode_dynamic_io(body[offset:])
-        offset += consumed
-
-        if total_count != len(n1) + len(n2) + len(n4) + len(n8) + len(nx):
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int, end: int) -> tuple[Self, int]:
+        (event_io_id, fixed, nx, io_end) = _walk_io_element(view, offset, end)
+        (_, total_count) = _IO_HEADER.unpack_from(view, offset)
+        (n1, n2, n4, n8) = (
+            dict(io_struct.iter_unpack(view[start:stop]))
+            for io_struct, start, stop in fixed
+        )
+        nx_ios = {id: bytes(view[start:stop]) for id, start, stop in nx}
+        # repeated io ids collapse in the dicts
+        if total_count != len(n1) + len(n2) + len(n4) + len(n8) + len(nx_ios):
             raise CodecException(
                 f"total count {total_count} does not match sum of all io counts"
             )
-
-        return cls(event_io_id=event_io_id, n1=n1, n2=n2, n4=n4, n8=n8, nx=nx), offset
+        return cls(
+            event_io_id=event_io_id, n1=n1, n2=n2, n4=n4, n8=n8, nx=nx_ios
+        ), io_end
 
     @staticmethod
-    def _decode_fixed_io(remaining: bytes, n: int) -> tuple[dict[int, int], int]:
-        count = int.from_bytes(remaining[0:2], "big")
-        required_len = 2 + count * (2 + n)
-        if len(remaining) < required_len:
+    def _skip_from(view: memoryview, offset: int, end: int) -> int:
+        """Validate the io element lengths and return the offset after it."""
+        return _walk_io_element(view, offset, end)[3]
+
+
+def _walk_io_element(
+    view: memoryview, offset: int, end: int
+) -> tuple[int, list[tuple[struct.Struct, int, int]], list[tuple[int, int, int]], int]:
+    """Validate an io element and locate its values without decoding them.
+
+    Returns the event io id, (struct, start, stop) of the n1, n2, n4 and n8
+    sections, (id, start, stop) of every nx value and the offset after the
+    element.
+    """
+    if end - offset < 4:
+        raise CodecException(
+            f"expected at least 4 bytes for io element but got {end - offset}"
+        )
+    (event_io_id, total_count) = _IO_HEADER.unpack_from(view, offset)
+    offset += _IO_HEADER.size
+
+    unpack_u16 = _U16.unpack_from
+    count = 0
+    fixed: list[tuple[struct.Struct, int, int]] = []
+    for n, io_struct, size in _FIXED_IO_SECTIONS:
+        if end - offset < 2:
             raise CodecException(
-                f"expected at least {required_len} bytes for fixed io (n={n}) but got {len(remaining)}"
+                f"expected at least 2 bytes for fixed io (n={n}) count but got {end - offset}"
             )
+        (n_count,) = unpack_u16(view, offset)
+        offset += 2
+        stop = offset + n_count * size
+        if stop > end:
+            raise CodecException(
+                f"expected at least {2 + n_count * size} bytes for fixed io (n={n}) but got {end - offset + 2}"
+            )
+        fixed.append((io_struct, offset, stop))
+        offset = stop
+        count += n_count
 
-        offset = 2
-        ios: dict[int, int] = {}
-        for _ in range(count):
-            id = int.from_bytes(remaining[offset : offset + 2], "big")
-            offset += 2
-            value = int.from_bytes(remaining[offset : offset + n], "big")
-            offset += n
-            ios[id] = value
-        return ios, offset
-
-    @staticmethod
-    def _decode_dynamic_io(remaining: bytes) -> tuple[dict[int, bytes], int]:
-        count = int.from_bytes(remaining[0:2], "big")
-        offset = 2
-        ios: dict[int, bytes] = {}
-        for _ in range(count):
-            id = int.from_bytes(remaining[offset : offset + 2], "big")
-            offset += 2
-            value_len = int.from_bytes(remaining[offset : offset + 2], "big")
-            offset += 2
-            value = remaining[offset : offset + value_len]
-            offset += value_len
-
-            if len(value) != value_len:
-                raise CodecException(
-                    f"expected {value_len} byte(s) for dynamic io value, got {len(value)}"
-                )
-
-            ios[id] = value
+    if end - offset < 2:
+        raise CodecException(
+            f"expected at least 2 bytes for dynamic io count but got {end - offset}"
+        )
+    (nx_count,) = unpack_u16(view, offset)
+    offset += 2
+    nx: list[tuple[int, int, int]] = []
+    for _ in range(nx_count):
+        if end - offset < _DYNAMIC_IO_HEADER.size:
+            raise CodecException(
+                f"expected at least {_DYNAMIC_IO_HEADER.size} bytes for dynamic io header, got {end - offset}"
+            )
+        (id, value_len) = _DYNAMIC_IO_HEADER.unpack_from(view, offset)
+        offset += _DYNAMIC_IO_HEADER.size
+        if end - offset < value_len:
+            raise CodecException(
+                f"expected {value_len} byte(s) for dynamic io value, got {end - offset}"
+            )
+        nx.append((id, offset, offset + value_len))
+        offset += value_len
+    count += nx_count
 
-        return ios, offset
+    if total_count != count:
+        raise CodecException(
+            f"total count {total_count} does not match sum of all io counts"
+        )
+    return event_io_id, fixed, nx, offset
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True)
@@ -206,23 +327,160 @@ class Codec8eAvlData:
     io: Codec8eIoElement
 
     def encode(self) -> bytes:
-        return (
-            self.timestamp.to_bytes(8, byteorder="big")
-            + self.priority.to_bytes(1, byteorder="big")
-            + self.gps.encode()
-            + self.io.encode()
+        buf = bytearray(self.encoded_len())
+        self.encode_into(buf, 0)
+        return bytes(buf)
+
+    def encoded_len(self) -> int:
+        return _AVL_HEADER.size + self.io.encoded_len()
+
+    def encode_into(self, buf: bytearray | memoryview, offset: int) -> int:
+        """Encode into buf at offset and return the offset after the data."""
+        gps = self.gps
+        _AVL_HEADER.pack_into(
+            buf,
+            offset,
+            self.timestamp,
+            self.priority,
+            gps.longitude,
+            gps.latitude,
+            gps.altitude,
+            gps.angle,
+            gps.satellites,
+            gps.speed,
         )
+        return self.io.encode_into(buf, offset + _AVL_HEADER.size)
 
     @classmethod
     def decode(cls, body: bytes) -> tuple[Self, int]:
-        if len(body) < 24:
+        return cls._decode_from(memoryview(body), 0, len(body))
+
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int, end: int) -> tuple[Self, int]:
+        if end - offset < _AVL_HEADER.size:
             raise CodecException(
-                f"expected at least 24 bytes for avl data but got {len(body)}"
+                f"expected at least {_AVL_HEADER.size} bytes for avl data but got {end - offset}"
             )
-        io, consumed = Codec8eIoElement.decode(body[24:])
-        return cls(
-            timestamp=int.from_bytes(body[0:8], byteorder="big"),
-            priority=int.from_bytes(body[8:9], byteorder="big"),
-            gps=Codec8eGpsElement.decode(body[9:24]),
-            io=io,
-        ), consumed + 24
+        (
+            timestamp,
+            priority,
+            longitude,
+            latitude,
+            altitude,
+            angle,
+            satellites,
+            speed,
+        ) = _AVL_HEADER.unpack_from(view, offset)
+        io, io_end = Codec8eIoElement._decode_from(view, offset + _AVL_HEADER.size, end)
+        gps = Codec8eGpsElement(
+            longitude=longitude,
+            latitude=latitude,
+            altitude=altitude,
+            angle=angle,
+            satellites=satellites,
+            speed=speed,
+        )
+        return cls(timestamp=timestamp, priority=priority, gps=gps, io=io), io_end
+
+
+class Codec8eLazyAvlData:
+    """AVL record that references the frame body and decodes io on demand.
+
+    The record header is unpacked eagerly, `gps` and `io` are only built when
+    they are first accessed.
+    """
+
+    __slots__ = ("_view", "_io_offset", "_io_end", "_header", "_gps", "_io")
+
+    def __init__(
+        self,
+        view: memoryview,
+        io_offset: int,
+        io_end: int,
+        header: tuple[int, int, int, int, int, int, int, int],
+    ) -> None:
+        self._view = view
+        self._io_offset = io_offset
+        self._io_end = io_end
+        self._header = header
+        self._gps: Codec8eGpsElement | None = None
+        self._io: Codec8eIoElement | None = None
+
+    @classmethod
+    def _decode_from(cls, view: memoryview, offset: int, end: int) -> tuple[Self, int]:
+        if end - offset < _AVL_HEADER.size:
+            raise CodecException(
+                f"expected at least {_AVL_HEADER.size} bytes for avl data but got {end - offset}"
+            )
+        header = _AVL_HEADER.unpack_from(view, offset)
+        io_offset = offset + _AVL_HEADER.size
+        io_end = Codec8eIoElement._skip_from(view, io_offset, end)
+        return cls(view, io_offset, io_end, header), io_end
+
+    @property
+    def timestamp(self) -> int:
+        return self._header[0]
+
+    @property
+    def priority(self) -> int:
+        return self._header[1]
+
+    @property
+    def longitude(self) -> int:
+        return self._header[2]
+
+    @property
+    def latitude(self) -> int:
+        return self._header[3]
+
+    @property
+    def gps(self) -> Codec8eGpsElement:
+        if self._gps is None:
+            (_, _, longitude, latitude, altitude, angle, satellites, speed) = (
+                self._header
+            )
+            self._gps = Codec8eGpsElement(
+                longitude=longitude,
+                latitude=latitude,
+                altitude=altitude,
+                angle=angle,
+                satellites=satellites,
+                speed=speed,
+            )
+        return self._gps
+
+    @property
+    def io(self) -> Codec8eIoElement:
+        if self._io is None:
+            (self._io, _) = Codec8eIoElement._decode_from(
+                self._view, self._io_offset, self._io_end
+            )
+        return self._io
+
+    @property
+    def n1(self) -> dict[int, int]:
+        return self.io.n1
+
+    @property
+    def n2(self) -> dict[int, int]:
+        return self.io.n2
+
+    @property
+    def n4(self) -> dict[int, int]:
+        return self.io.n4
+
+    @property
+    def n8(self) -> dict[int, int]:
+        return self.io.n8
+
+    @property
+    def nx(self) -> dict[int, bytes]:
+        return self.io.nx
+
+    def to_avl_data(self) -> Codec8eAvlData:
+        return Codec8eAvlData(
+            timestamp=self.timestamp,
+            priority=self.priority,
+            gps=self.gps,
+            io=self.io,
+        )
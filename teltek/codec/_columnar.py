@@ -0,0 +1,162 @@
+import dataclasses
+from array import array
+from collections.abc import Iterable
+from typing import Any, Self
+
+from teltek.codec._codec8e import _AVL_HEADER, _walk_io_element
+from teltek.codec._error import CodecException
+from teltek.codec._frame import CodecId, MessageFrame
+
+
+def _array(typecode: str) -> Any:
+    return dataclasses.field(default_factory=lambda: array(typecode))
+
+
+@dataclasses.dataclass(kw_only=True)
+class Codec8eColumns:
+    """Codec 8E records decoded into one array per field.
+
+    IO elements are stored sparsely as (record, id, value) triplets ordered by
+    record index. NX values are kept separately because they aren't integers.
+    """
+
+    timestamp: "array[int]" = _array("Q")
+    priority: "array[int]" = _array("B")
+    longitude: "array[int]" = _array("i")
+    latitude: "array[int]" = _array("i")
+    altitude: "array[int]" = _array("H")
+    angle: "array[int]" = _array("H")
+    satellites: "array[int]" = _array("B")
+    speed: "array[int]" = _array("H")
+    event_io_id: "array[int]" = _array("H")
+
+    io_record: "array[int]" = _array("I")
+    io_id: "array[int]" = _array("H")
+    io_value: "array[int]" = _array("Q")
+
+    nx_record: "array[int]" = _array("I")
+    nx_id: "array[int]" = _array("H")
+    nx_value: list[bytes] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def decode(cls, body: bytes) -> Self:
+        columns = cls()
+        columns.extend(body)
+        return columns
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[MessageFrame]) -> Self:
+        columns = cls()
+        for frame in frames:
+            if frame.codec_id != CodecId.CODEC_8E:
+                raise CodecException(f"expected codec8e but got {frame.codec_id}")
+            columns.extend(frame.data)
+        return columns
+
+    def extend(self, body: bytes) -> None:
+        """Decode a codec8e body and append its records.
+
+        The body is validated completely before any column is modified. While a
+        column is exported, e.g. as a view from `columns()`, this raises
+        `BufferError` and leaves all columns unchanged.
+        """
+        staging = type(self)()
+        staging._decode_into(memoryview(body), record_base=len(self))
+        extended: list[tuple[Any, int]] = []
+        try:
+            for field in dataclasses.fields(self):
+                column = getattr(self, field.name)
+                size = len(column)
+                column.extend(getattr(staging, field.name))
+                extended.append((column, size))
+        except BufferError:
+            # a column is exported, e.g. as a NumPy view from `columns()`
+            for column, size in extended:
+                del column[size:]
+            raise
+
+    def _decode_into(self, view: memoryview, *, record_base: int) -> None:
+        if len(view) < 45:
+            raise CodecException(
+                f"expected at least 45 bytes for codec8e, got {len(view)}"
+            )
+        records = view[0]
+        records2 = view[-1]
+        if records != records2:
+            raise CodecException(
+                f"first quantity {records} does not match last quantity {records2}"
+            )
+
+        end = len(view) - 1
+        offset = 1
+        for record in range(record_base, record_base + records):
+            if end - offset < _AVL_HEADER.size:
+                raise CodecException(
+                    f"expected at least {_AVL_HEADER.size} bytes for avl data but got {end - offset}"
+                )
+            (
+                timestamp,
+                priority,
+                longitude,
+                latitude,
+                altitude,
+                angle,
+                satellites,
+                speed,
+            ) = _AVL_HEADER.unpack_from(view, offset)
+            (event_io_id, fixed, nx, offset) = _walk_io_element(
+                view, offset + _AVL_HEADER.size, end
+            )
+            self.timestamp.append(timestamp)
+            self.priority.append(priority)
+            self.longitude.append(longitude)
+            self.latitude.append(latitude)
+            self.altitude.append(altitude)
+            self.angle.append(angle)
+            self.satellites.append(satellites)
+            self.speed.append(speed)
+            self.event_io_id.append(event_io_id)
+            for io_struct, start, stop in fixed:
+                for id, value in io_struct.iter_unpack(view[start:stop]):
+                    self.io_record.append(record)
+                    self.io_id.append(id)
+                    self.io_value.append(value)
+            for id, start, stop in nx:
+                self.nx_record.append(record)
+                self.nx_id.append(id)
+                self.nx_value.append(bytes(view[start:stop]))
+
+        if offset != end:
+            raise CodecException(
+                f"leftover bytes after decoding codec8e: {bytes(view[offset:end])!r}"
+            )
+
+    def columns(self, *, numpy: bool | None = None) -> dict[str, Any]:
+        """Return all columns by name.
+
+        With `numpy=True` the integer columns are returned as NumPy views
+        sharing memory with this object. The default uses NumPy only if it's
+        installed and falls back to `array.array` otherwise. As long as a view
+        is alive, `extend` raises `BufferError`, copy the views to keep them
+        while decoding more records.
+        """
+        columns = {
+            field.name: getattr(self, field.name) for field in dataclasses.fields(self)
+        }
+        if numpy is False:
+            return columns
+        try:
+            import numpy as np
+        except ImportError:
+            if numpy:
+                raise
+            return columns
+        return {
+            name: np.asarray(memoryview(column))
+            if isinstance(column, array)
+            else column
+            for name, column in columns.items()
+        }
@@ -1,16 +1,22 @@
 import dataclasses
 import enum
+import struct
+from collections.abc import Callable
 from typing import Self
 
 from teltek.codec._error import CodecException
 
 _PREAMBLE = 4 * b"\0"
+# preamble, data size, codec id
+_HEADER = struct.Struct(">IIB")
+_CRC16 = struct.Struct(">I")
 
 
 class CodecId(enum.IntEnum):
     CODEC_8 = 0x08
     CODEC_8E = 0x8E
     CODEC_12 = 0x0C
+    CODEC_16 = 0x10
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True)
@@ -21,13 +27,18 @@ class MessageFrame:
 
     @classmethod
     def build(cls, codec_id: CodecId, data: bytes) -> Self:
-        crc16 = _crc16_ibm(codec_id.to_bytes(1, byteorder="big") + data)
+        crc16 = _crc16_ibm(data, _crc16_ibm(codec_id.to_bytes(1, byteorder="big")))
         return cls(
             codec_id=codec_id,
             data=data,
             crc16=crc16,
         )
 
+    @staticmethod
+    def frame_len(body_len: int) -> int:
+        """Length of an encoded frame whose codec body has body_len bytes."""
+        return _HEADER.size + body_len + _CRC16.size
+
     def encode(self) -> bytes:
         codec_id = self.codec_id.to_bytes(1, byteorder="big")
         data_size = (len(codec_id) + len(self.data)).to_bytes(4, byteorder="big")
@@ -43,25 +54,71 @@ class MessageFrame:
         if len(data) != data_size:
             raise CodecException(f"expected {data_size} byte(s) but got {len(data)}")
         crc16 = int.from_bytes(payload[-4:], byteorder="big")
-        if _crc16_ibm(data) != crc16:
+        return cls._from_data(data, crc16)
+
+    @classmethod
+    def _from_data(cls, data: bytes | memoryview, crc16: int) -> Self:
+        calculated_crc16 = _crc16_ibm(data)
+        if calculated_crc16 != crc16:
             raise CodecException(
-                f"crc16 expected {crc16} but calculated {_crc16_ibm(data)}"
+                f"crc16 expected {crc16} but calculated {calculated_crc16}"
             )
-        codec_id = CodecId(data[0])
+        if not data:
+            raise CodecException("expected at least 1 byte for the codec id")
         return cls(
-            codec_id=codec_id,
-            data=data[1:],
+            codec_id=_codec_id(data[0]),
+            data=bytes(data[1:]),
             crc16=crc16,
         )
 
 
-def _crc16_ibm(data: bytes) -> int:
-    crc = 0
-    for b in data:
-        crc = crc ^ b
+def _codec_id(value: int) -> CodecId:
+    try:
+        return CodecId(value)
+    except ValueError:
+        raise CodecException(f"unknown codec id {value:#04x}") from None
+
+
+def _encode_frame_into(
+    buf: bytearray | memoryview,
+    offset: int,
+    codec_id: CodecId,
+    encode_body: Callable[[bytearray | memoryview, int], int],
+) -> int:
+    # reserve the header, the data size is only known after encoding the body
+    body_end = encode_body(buf, offset + _HEADER.size)
+    data_start = offset + len(_PREAMBLE) + 4
+    _HEADER.pack_into(buf, offset, 0, body_end - data_start, codec_id)
+    with memoryview(buf) as view:
+        crc16 = _crc16_ibm(view[data_start:body_end])
+    _CRC16.pack_into(buf, body_end, crc16)
+    return body_end + _CRC16.size
+
+
+def _make_crc16_table(poly: int) -> tuple[int, ...]:
+    table: list[int] = []
+    for b in range(256):
+        crc = b
         for _ in range(8):
             carry = crc & 1
             crc = crc >> 1
             if carry:
-                crc = crc ^ 0xA001
+                crc = crc ^ poly
+        table.append(crc)
+    return tuple(table)
+
+
+# CRC-16/IBM (reflected polynomial 0xA001)
+_CRC16_IBM_TABLE = _make_crc16_table(0xA001)
+
+
+def _crc16_ibm(data: bytes | bytearray | memoryview, crc: int = 0) -> int:
+    """Calculate the CRC-16/IBM checksum of data.
+
+    Pass the result of a previous call as `crc` to continue the checksum over
+    multiple chunks.
+    """
+    table = _CRC16_IBM_TABLE
+    for b in data:
+        crc = (crc >> 8) ^ table[(crc ^ b) & 0xFF]
     return crc
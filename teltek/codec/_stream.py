@@ -0,0 +1,84 @@
+from collections.abc import Iterator
+
+from teltek.codec._error import CodecException
+from teltek.codec._frame import _PREAMBLE, MessageFrame
+
+# preamble + data size
+_HEADER_LEN = 8
+_CRC_LEN = 4
+_DEFAULT_MAX_DATA_SIZE = 64 * 1024
+
+
+class FrameDecoder:
+    """Incrementally decode message frames from a byte stream.
+
+    Feed arbitrarily sized chunks with `feed` and iterate the decoder to get
+    every frame that is complete so far. A decoding error leaves the stream
+    in an unknown state, so the buffered data is dropped.
+    """
+
+    def __init__(self, *, max_data_size: int = _DEFAULT_MAX_DATA_SIZE) -> None:
+        self._max_data_size = max_data_size
+        self._buffer = bytearray()
+        self._offset = 0
+        self._bytes_consumed = 0
+
+    @property
+    def bytes_consumed(self) -> int:
+        """total number of bytes that were decoded into frames"""
+        return self._bytes_consumed
+
+    @property
+    def pending(self) -> int:
+        """number of buffered bytes that don't form a complete frame yet"""
+        return len(self._buffer) - self._offset
+
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        if self._offset:
+            # bytearray deletes from the front without moving the remainder
+            del self._buffer[: self._offset]
+            self._offset = 0
+        self._buffer += data
+
+    def __iter__(self) -> Iterator[MessageFrame]:
+        while (frame := self.next_frame()) is not None:
+            yield frame
+
+    def next_frame(self) -> MessageFrame | None:
+        try:
+            with memoryview(self._buffer) as view:
+                result = self._decode_at(view, self._offset)
+        except Exception:
+            self._buffer = bytearray()
+            self._offset = 0
+            raise
+        if result is None:
+            return None
+        frame, frame_len = result
+        self._offset += frame_len
+        self._bytes_consumed += frame_len
+        return frame
+
+    def _decode_at(
+        self, view: memoryview, offset: int
+    ) -> tuple[MessageFrame, int] | None:
+        available = len(view) - offset
+        if available < _HEADER_LEN:
+            return None
+        if view[offset : offset + 4] != _PREAMBLE:
+            raise CodecException(
+                f"expected preamble but got {bytes(view[offset : offset + 4])!r}"
+            )
+        data_size = int.from_bytes(view[offset + 4 : offset + 8], byteorder="big")
+        if data_size > self._max_data_size:
+            raise CodecException(
+                f"frame data size {data_size} exceeds maximum of {self._max_data_size}"
+            )
+        frame_len = _HEADER_LEN + data_size + _CRC_LEN
+        if available < frame_len:
+            return None
+        data_start = offset + _HEADER_LEN
+        data_end = data_start + data_size
+        crc16 = int.from_bytes(view[data_end : offset + frame_len], byteorder="big")
+        frame = MessageFrame._from_data(view[data_start:data_end], crc16)
+        return frame, frame_len
@@ -0,0 +1,98 @@
+import dataclasses
+import struct
+from typing import Self
+
+from teltek.codec._error import CodecException
+from teltek.codec._frame import CodecId, _codec_id
+
+# length, packet id, packet type, avl packet id, imei length
+_HEADER = struct.Struct(">HHBBH")
+# length, packet id, packet type, avl packet id, number of accepted records
+_ACK = struct.Struct(">HHBBB")
+_PACKET_TYPE = 0x01
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class UdpAvlPacket:
+    """AVL data sent over UDP.
+
+    Unlike TCP, every datagram carries the IMEI and there is no preamble or
+    CRC. `data` is the codec body, the same as `MessageFrame.data`.
+    """
+
+    packet_id: int
+    avl_packet_id: int
+    imei: str
+    codec_id: CodecId
+    data: bytes
+
+    def encode(self) -> bytes:
+        imei = self.imei.encode("ascii")
+        # everything after the length field
+        length = _HEADER.size - 2 + len(imei) + 1 + len(self.data)
+        header = _HEADER.pack(
+            length, self.packet_id, _PACKET_TYPE, self.avl_packet_id, len(imei)
+        )
+        return header + imei + self.codec_id.to_bytes(1, byteorder="big") + self.data
+
+    @classmethod
+    def decode(cls, payload: bytes) -> Self:
+        if len(payload) < _HEADER.size:
+            raise CodecException(
+                f"expected at least {_HEADER.size} bytes for udp packet, got {len(payload)}"
+            )
+        (length, packet_id, _, avl_packet_id, imei_len) = _HEADER.unpack_from(payload)
+        if length != len(payload) - 2:
+            raise CodecException(
+                f"expected {length} byte(s) after length but got {len(payload) - 2}"
+            )
+        codec_offset = _HEADER.size + imei_len
+        if len(payload) <= codec_offset:
+            raise CodecException("udp packet ends before the codec id")
+        try:
+            imei = payload[_HEADER.size : codec_offset].decode("ascii")
+        except UnicodeDecodeError as e:
+            raise CodecException(f"imei is not ascii: {e}") from None
+        return cls(
+            packet_id=packet_id,
+            avl_packet_id=avl_packet_id,
+            imei=imei,
+            codec_id=_codec_id(payload[codec_offset]),
+            data=payload[codec_offset + 1 :],
+        )
+
+    def ack(self, accepted_records: int) -> "UdpAvlAck":
+        return UdpAvlAck(
+            packet_id=self.packet_id,
+            avl_packet_id=self.avl_packet_id,
+            accepted_records=accepted_records,
+        )
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class UdpAvlAck:
+    packet_id: int
+    avl_packet_id: int
+    accepted_records: int
+
+    def encode(self) -> bytes:
+        return _ACK.pack(
+            _ACK.size - 2,
+            self.packet_id,
+            _PACKET_TYPE,
+            self.avl_packet_id,
+            self.accepted_records,
+        )
+
+    @classmethod
+    def decode(cls, payload: bytes) -> Self:
+        if len(payload) != _ACK.size:
+            raise CodecException(
+                f"expected {_ACK.size} bytes for udp ack, got {len(payload)}"
+            )
+        (_, packet_id, _, avl_packet_id, accepted_records) = _ACK.unpack(payload)
+        return cls(
+            packet_id=packet_id,
+            avl_packet_id=avl_packet_id,
+            accepted_records=accepted_records,
+        )
@@ -1,5 +1,7 @@
 from . import _db as db
+from ._catalogue import ParameterCatalogue
 from ._config import Config
+from ._config_matrix import ConfigMatrix
 from ._map import map_parameters_to_raw, map_raw_parameters
 from ._parameter import (
     Parameter,
@@ -21,4 +23,6 @@ __all__ = [
     "ValueMapping",
     "ValueRange",
     "Config",
+    "ConfigMatrix",
+    "ParameterCatalogue",
 ]
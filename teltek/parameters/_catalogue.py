@@ -0,0 +1,178 @@
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Self
+
+import teltek.parameters._db as db
+from teltek.parameters._parameter import (
+    Parameter,
+    ParameterGroup,
+    ParameterIdRange,
+    ParameterType,
+    ValueMapping,
+    ValueRange,
+)
+
+_FORMAT_VERSION = 1
+
+
+class ParameterCatalogue:
+    """Parameter database of one device model and firmware version.
+
+    Catalogues are stored as compact JSON. A catalogue read from a file keeps the
+    decoded JSON and builds a `ParameterGroup` only when it is first accessed.
+    """
+
+    def __init__(
+        self, *, model: str, firmware: str, groups: Iterable[ParameterGroup]
+    ) -> None:
+        self.model = model
+        self.firmware = firmware
+        self._groups: dict[str, ParameterGroup] = {group.key: group for group in groups}
+        self._group_data: dict[str, dict[str, Any]] = {}
+        self._group_keys = list(self._groups)
+
+    @classmethod
+    def from_db(cls, *, model: str = "", firmware: str = "") -> Self:
+        """Catalogue of the built-in `teltek.parameters.db`."""
+        return cls(model=model, firmware=firmware, groups=db.ALL_GROUPS)
+
+    @staticmethod
+    def file_name(model: str, firmware: str) -> str:
+        """File name of the catalogue of a model and firmware in a directory."""
+        return f"{model}_{firmware}.json"
+
+    @property
+    def group_keys(self) -> list[str]:
+        return list(self._group_keys)
+
+    @property
+    def groups(self) -> list[ParameterGroup]:
+        return [self.group(key) for key in self._group_keys]
+
+    def group(self, key: str) -> ParameterGroup:
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _group_from_data(self._group_data.pop(key))
+        return group
+
+    def iter_parameters(self) -> Iterator[Parameter]:
+        for key in self._group_keys:
+            yield from self.group(key).iter_parameters()
+
+    def iter_parameter_ids(self) -> Iterator[int]:
+        for key in self._group_keys:
+            data = self._group_data.get(key)
+            if data is None:
+                yield from self._groups[key].iter_parameter_ids()
+            else:
+                # no need to build the group for its IDs
+                yield from _iter_data_ids(data)
+
+    def _to_data(self) -> dict[str, Any]:
+        return {
+            "format": _FORMAT_VERSION,
+            "model": self.model,
+            "firmware": self.firmware,
+            "groups": [
+                self._group_data.get(key) or _group_to_data(self._groups[key])
+                for key in self._group_keys
+            ],
+        }
+
+    @classmethod
+    def _from_data(cls, data: dict[str, Any]) -> Self:
+        if data.get("format") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported catalogue format: {data.get('format')}")
+        catalogue = cls(model=data["model"], firmware=data["firmware"], groups=())
+        catalogue._group_data = {group["key"]: group for group in data["groups"]}
+        catalogue._group_keys = list(catalogue._group_data)
+        return catalogue
+
+    @classmethod
+    def read(cls, path: Path | BinaryIO) -> Self:
+        if isinstance(path, Path):
+            content = path.read_bytes()
+        else:
+            content = path.read()
+        return cls._from_data(json.loads(content))
+
+    def write(self, path: Path | BinaryIO) -> None:
+        content = json.dumps(self._to_data(), separators=(",", ":")).encode()
+        if isinstance(path, Path):
+            path.write_bytes(content)
+        else:
+            path.write(content)
+
+
+def _group_to_data(group: ParameterGroup) -> dict[str, Any]:
+    data: dict[str, Any] = {"key": group.key, "name": group.name}
+    if group.groups:
+        data["groups"] = [_group_to_data(subgroup) for subgroup in group.groups]
+    if group.parameters:
+        data["parameters"] = [_parameter_to_data(param) for param in group.parameters]
+    return data
+
+
+def _parameter_to_data(param: Parameter) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "key": param.key,
+        "id": (
+            [param.id.start, param.id.end]
+            if isinstance(param.id, ParameterIdRange)
+            else param.id
+        ),
+        "type": param.type.value,
+        "default": param.default_value,
+        "range": [param.value_range.min, param.value_range.max],
+        "name": param.name,
+    }
+    if param.value_is_bitflag:
+        data["bitflag"] = True
+    if param.value_map is not None:
+        data["map"] = [
+            [mapping.key, mapping.value, mapping.display] for mapping in param.value_map
+        ]
+    return data
+
+
+def _group_from_data(data: dict[str, Any]) -> ParameterGroup:
+    return ParameterGroup(
+        key=data["key"],
+        name=data["name"],
+        groups=[_group_from_data(subgroup) for subgroup in data.get("groups", ())],
+        parameters=[
+            _parameter_from_data(param) for param in data.get("parameters", ())
+        ],
+    )
+
+
+def _parameter_from_data(data: dict[str, Any]) -> Parameter:
+    id = data["id"]
+    value_map = data.get("map")
+    return Parameter(
+        key=data["key"],
+        id=ParameterIdRange(*id) if isinstance(id, list) else id,
+        type=ParameterType(data["type"]),
+        default_value=data["default"],
+        value_range=ValueRange(*data["range"]),
+        name=data["name"],
+        value_is_bitflag=data.get("bitflag", False),
+        value_map=(
+            None
+            if value_map is None
+            else [ValueMapping(*mapping) for mapping in value_map]
+        ),
+    )
+
+
+def _iter_data_ids(data: dict[str, Any]) -> Iterator[int]:
+    # same order as ParameterGroup.iter_parameter_ids
+    for subgroup in data.get("groups", ()):
+        yield from _iter_data_ids(subgroup)
+    for param in data.get("parameters", ()):
+        id = param["id"]
+        if isinstance(id, list):
+            yield from range(id[0], id[1] + 1)
+        else:
+            yield id
@@ -0,0 +1,251 @@
+import collections
+import itertools
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import Self
+
+import teltek.parameters._db as db
+from teltek.parameters._catalogue import ParameterCatalogue
+from teltek.parameters._config import Config
+
+
+class ConfigMatrix:
+    """Raw parameters of many devices as a (device × parameter ID) table.
+
+    Every column interns its distinct values and stores one small integer code
+    per device, code 0 meaning the device doesn't have the parameter. Columns
+    follow the catalogue ID order, IDs unknown to the catalogue come last.
+    Devices whose configs list the same IDs are kept next to each other.
+    """
+
+    def __init__(
+        self,
+        devices: list[str],
+        param_ids: list[int],
+        values: list[list[str | None]],
+        codes: "list[array[int]]",
+    ) -> None:
+        self._devices = devices
+        self._device_rows = {device: row for row, device in enumerate(devices)}
+        self._param_ids = param_ids
+        self._columns = {param_id: col for col, param_id in enumerate(param_ids)}
+        self._values = values
+        self._codes = codes
+
+    @classmethod
+    def from_configs(
+        cls,
+        configs: Mapping[str, Config],
+        *,
+        catalogue: ParameterCatalogue | None = None,
+    ) -> Self:
+        return cls.from_raw_parameters(
+            {device: config.raw_parameters for device, config in configs.items()},
+            catalogue=catalogue,
+        )
+
+    @classmethod
+    def from_raw_parameters(
+        cls,
+        raw_parameters: Mapping[str, Mapping[int, str]],
+        *,
+        catalogue: ParameterCatalogue | None = None,
+    ) -> Self:
+        # configs of the same firmware list the same IDs in the same order,
+        # such devices are kept together and transposed at once
+        layouts: dict[tuple[int, ...], list[Mapping[int, str]]] = {}
+        layout_devices: dict[tuple[int, ...], list[str]] = {}
+        for device, raw in raw_parameters.items():
+            layout = tuple(raw)
+            layouts.setdefault(layout, []).append(raw)
+            layout_devices.setdefault(layout, []).append(device)
+        devices = [device for group in layout_devices.values() for device in group]
+        device_count = len(devices)
+        remaining_parts = collections.Counter(
+            param_id for layout in layouts for param_id in layout
+        )
+
+        interned: dict[int, dict[str | None, int]] = {}
+        partial_codes: dict[int, array[int]] = {}
+        values: dict[int, list[str | None]] = {}
+        codes: dict[int, array[int]] = {}
+        start = 0
+        for layout, raws in layouts.items():
+            columns = zip(*(raw.values() for raw in raws), strict=True)
+            for param_id, column in zip(layout, columns, strict=True):
+                intern = interned.setdefault(param_id, {None: 0})
+                distinct = dict.fromkeys(column)
+                for value in distinct:
+                    if value not in intern:
+                        intern[value] = len(intern)
+                typecode = _typecode(len(intern))
+                if len(distinct) == 1:
+                    # most of the config is usually the same on every device
+                    (value,) = distinct
+                    column_codes = array(typecode, [intern[value]]) * len(raws)
+                else:
+                    column_codes = array(typecode, map(intern.__getitem__, column))
+
+                if len(raws) < device_count:
+                    part = column_codes
+                    column_codes = partial_codes.pop(param_id, None) or array(typecode)
+                    if column_codes.typecode != typecode:
+                        column_codes = array(typecode, column_codes)
+                    # devices of the previous layouts without the parameter
+                    column_codes.frombytes(
+                        bytes(column_codes.itemsize * (start - len(column_codes)))
+                    )
+                    column_codes.extend(part)
+                    remaining_parts[param_id] -= 1
+                    if remaining_parts[param_id]:
+                        partial_codes[param_id] = column_codes
+                        continue
+                    column_codes.frombytes(
+                        bytes(
+                            column_codes.itemsize * (device_count - len(column_codes))
+                        )
+                    )
+                codes[param_id] = column_codes
+                values[param_id] = list(interned.pop(param_id))
+            start += len(raws)
+
+        if catalogue is None:
+            known_ids = db.iter_parameter_ids()
+        else:
+            known_ids = catalogue.iter_parameter_ids()
+        param_ids = [
+            param_id for param_id in dict.fromkeys(known_ids) if param_id in codes
+        ]
+        param_ids += sorted(codes.keys() - set(param_ids))
+        return cls(
+            devices,
+            param_ids,
+            [values[param_id] for param_id in param_ids],
+            [codes[param_id] for param_id in param_ids],
+        )
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    @property
+    def devices(self) -> list[str]:
+        return list(self._devices)
+
+    @property
+    def param_ids(self) -> list[int]:
+        return list(self._param_ids)
+
+    def get(self, device: str, param_id: int) -> str | None:
+        col = self._columns.get(param_id)
+        if col is None:
+            return None
+        return self._values[col][self._codes[col][self._device_rows[device]]]
+
+    def row(self, device: str) -> dict[int, str]:
+        """Raw parameters of a device, e.g. to use it as the golden config."""
+        row = self._device_rows[device]
+        out: dict[int, str] = {}
+        for param_id, values, codes in zip(self._param_ids, self._values, self._codes):
+            value = values[codes[row]]
+            if value is not None:
+                out[param_id] = value
+        return out
+
+    def column(self, param_id: int) -> list[str | None]:
+        """Value of every device, None where the device doesn't have it."""
+        col = self._columns.get(param_id)
+        if col is None:
+            return [None] * len(self._devices)
+        return list(map(self._values[col].__getitem__, self._codes[col]))
+
+    def value_counts(self, param_id: int) -> dict[str | None, int]:
+        """Number of devices per value, most common first."""
+        col = self._columns.get(param_id)
+        if col is None:
+            return {None: len(self._devices)} if self._devices else {}
+        values = self._values[col]
+        counts = collections.Counter(self._codes[col])
+        return {values[code]: count for code, count in counts.most_common()}
+
+    def group_by_value(self, param_id: int) -> dict[str | None, list[str]]:
+        """Devices per value, most common value first."""
+        col = self._columns.get(param_id)
+        if col is None:
+            return {None: list(self._devices)} if self._devices else {}
+        groups: list[list[str]] = [[] for _ in self._values[col]]
+        for device, code in zip(self._devices, self._codes[col]):
+            groups[code].append(device)
+        groups_by_value = zip(self._values[col], groups)
+        return {
+            value: devices
+            for value, devices in sorted(
+                groups_by_value, key=lambda item: len(item[1]), reverse=True
+            )
+            if devices
+        }
+
+    def diff(self, golden: Mapping[int, str]) -> dict[str, list[int]]:
+        """IDs of `golden` on which each device differs, for differing devices.
+
+        A device without a parameter differs from the golden value.
+        """
+        out: dict[str, list[int]] = {}
+        device_count = len(self._devices)
+        for param_id, golden_value in golden.items():
+            rows: Iterable[int] = range(device_count)
+            col = self._columns.get(param_id)
+            if col is not None and golden_value in self._values[col]:
+                golden_code = self._values[col].index(golden_value)
+                codes = self._codes[col]
+                if codes.count(golden_code) == device_count:
+                    continue
+                rows = itertools.compress(
+                    range(device_count), map(golden_code.__ne__, codes)
+                )
+            for row in rows:
+                out.setdefault(self._devices[row], []).append(param_id)
+        return out
+
+    def outliers(
+        self, *, max_share: float = 0.01, param_ids: Iterable[int] | None = None
+    ) -> dict[str, list[int]]:
+        """IDs on which each device has a rare value, for devices having any.
+
+        A value is rare when at most `max_share` of the devices have it. Columns
+        without a value more common than that, e.g. device specific values,
+        have no outliers.
+        """
+        out: dict[str, list[int]] = {}
+        device_count = len(self._devices)
+        if not device_count:
+            return out
+        max_count = max_share * device_count
+        if param_ids is None:
+            param_ids = self._param_ids
+        for param_id in param_ids:
+            col = self._columns.get(param_id)
+            if col is None:
+                continue
+            codes = self._codes[col]
+            if codes.count(codes[0]) == device_count:
+                continue
+            counts = collections.Counter(codes)
+            if max(counts.values()) <= max_count:
+                continue
+            rare = {code for code, count in counts.items() if count <= max_count}
+            if not rare:
+                continue
+            rows = itertools.compress(
+                range(device_count), map(rare.__contains__, codes)
+            )
+            for row in rows:
+                out.setdefault(self._devices[row], []).append(param_id)
+        return out
+
+
+def _typecode(value_count: int) -> str:
+    if value_count <= 1 << 8:
+        return "B"
+    if value_count <= 1 << 16:
+        return "H"
+    return "I"
@@ -1,20 +1,29 @@
+"""The parameter database.
+
+Groups are imported on first access, so importing `teltek.parameters` doesn't
+build every `ParameterGroup`.
+"""
+
+import importlib
 from collections.abc import Iterator
-from typing import TYPE_CHECKING
-
-from ._accelerometer import ACCELEROMETER
-from ._data_acquisition_mode import DATA_ACQUISITION_MODE
-from ._features import FEATURES
-from ._gprs import GPRS
-from ._gsm import GSM
-from ._io import IO
-from ._obd import OBD
-from ._sms_call import SMS
-from ._system import SYSTEM
-from ._tracking_on_demand import TRACKING_ON_DEMAND
-from ._trip_odometer import TRIP_ODOMETER
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from teltek.parameters import Parameter
+    from teltek.parameters import Parameter, ParameterGroup
+
+    from ._accelerometer import ACCELEROMETER
+    from ._data_acquisition_mode import DATA_ACQUISITION_MODE
+    from ._features import FEATURES
+    from ._gprs import GPRS
+    from ._gsm import GSM
+    from ._io import IO
+    from ._obd import OBD
+    from ._sms_call import SMS
+    from ._system import SYSTEM
+    from ._tracking_on_demand import TRACKING_ON_DEMAND
+    from ._trip_odometer import TRIP_ODOMETER
+
+    ALL_GROUPS: list[ParameterGroup]
 
 __all__ = [
     "ACCELEROMETER",
@@ -32,26 +41,52 @@ __all__ = [
     "iter_parameter_ids",
 ]
 
-ALL_GROUPS = [
-    ACCELEROMETER,
-    DATA_ACQUISITION_MODE,
-    FEATURES,
-    GPRS,
-    GSM,
-    IO,
-    OBD,
-    SMS,
-    SYSTEM,
-    TRACKING_ON_DEMAND,
-    TRIP_ODOMETER,
-]
+# group name -> module defining it, in the order of ALL_GROUPS
+_GROUP_MODULES = {
+    "ACCELEROMETER": "._accelerometer",
+    "DATA_ACQUISITION_MODE": "._data_acquisition_mode",
+    "FEATURES": "._features",
+    "GPRS": "._gprs",
+    "GSM": "._gsm",
+    "IO": "._io",
+    "OBD": "._obd",
+    "SMS": "._sms_call",
+    "SYSTEM": "._system",
+    "TRACKING_ON_DEMAND": "._tracking_on_demand",
+    "TRIP_ODOMETER": "._trip_odometer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ALL_GROUPS":
+        value: Any = [__getattr__(group_name) for group_name in _GROUP_MODULES]
+    elif (module_name := _GROUP_MODULES.get(name)) is not None:
+        module = importlib.import_module(module_name, __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache it so __getattr__ isn't called again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def _all_groups() -> "list[ParameterGroup]":
+    # module globals don't go through __getattr__
+    groups = globals().get("ALL_GROUPS")
+    if groups is None:
+        groups = __getattr__("ALL_GROUPS")
+    return groups
 
 
 def iter_parameters() -> "Iterator[Parameter]":
-    for group in ALL_GROUPS:
+    for group in _all_groups():
         yield from group.iter_parameters()
 
 
 def iter_parameter_ids() -> Iterator[int]:
-    for group in ALL_GROUPS:
+    for group in _all_groups():
         yield from group.iter_parameter_ids()
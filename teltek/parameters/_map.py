@@ -1,4 +1,7 @@
+import dataclasses
+import functools
 import logging
+from collections.abc import Callable
 from typing import Any, cast
 
 import teltek.parameters._db as db
@@ -7,62 +10,182 @@ from teltek.parameters._parameter import Parameter, ParameterGroup, ParameterIdR
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _ParameterIndex:
+    """Flat view of the parameter database, parameters are numbered by ordinal.
+
+    Ordinals follow the output order of the mapping: depth-first with the
+    subgroups of a group before its parameters.
+    """
+
+    targets: dict[int, tuple[tuple[int, int | None], ...]]
+    """ID -> (ordinal, slot in the ID range) of every parameter using it"""
+    single_targets: dict[int, int]
+    """ID -> ordinal for IDs used by exactly one parameter without a range"""
+    parameters: tuple[Parameter, ...]
+    converters: tuple[Callable[[str], Any], ...]
+    range_lens: tuple[int, ...]
+    """number of IDs of range parameters, 0 for single parameters"""
+    parameter_groups: tuple[int, ...]
+    """group number of every parameter"""
+    groups: tuple[tuple[int, str], ...]
+    """(parent group number or -1, key) of every group"""
+
+
+@functools.cache
+def _compile_index() -> _ParameterIndex:
+    targets: dict[int, list[tuple[int, int | None]]] = {}
+    parameters: list[Parameter] = []
+    parameter_groups: list[int] = []
+    groups: list[tuple[int, str]] = []
+
+    def add_group(group: ParameterGroup, parent: int) -> None:
+        group_nr = len(groups)
+        groups.append((parent, group.key))
+        for subgroup in group.groups:
+            add_group(subgroup, group_nr)
+        for parameter in group.parameters:
+            ordinal = len(parameters)
+            parameters.append(parameter)
+            parameter_groups.append(group_nr)
+            if isinstance(parameter.id, ParameterIdRange):
+                for slot, id in enumerate(parameter.id.to_range()):
+                    targets.setdefault(id, []).append((ordinal, slot))
+            else:
+                targets.setdefault(parameter.id, []).append((ordinal, None))
+
+    for group in db.ALL_GROUPS:
+        add_group(group, -1)
+    return _ParameterIndex(
+        targets={id: tuple(id_targets) for id, id_targets in targets.items()},
+        single_targets={
+            id: id_targets[0][0]
+            for id, id_targets in targets.items()
+            if len(id_targets) == 1 and id_targets[0][1] is None
+        },
+        parameters=tuple(parameters),
+        converters=tuple(param._from_raw for param in parameters),
+        range_lens=tuple(
+            len(param.id) if isinstance(param.id, ParameterIdRange) else 0
+            for param in parameters
+        ),
+        parameter_groups=tuple(parameter_groups),
+        groups=tuple(groups),
+    )
+
+
 def map_raw_parameters(raw: dict[int, str]) -> dict[str, Any]:
+    index = _compile_index()
+    targets = index.targets
+    single_targets = index.single_targets
+    converters = index.converters
+    range_lens = index.range_lens
+    values: dict[int, Any] = {}
+    missing_ids: set[int] = set()
+    for id, raw_value in raw.items():
+        ordinal = single_targets.get(id)
+        if ordinal is not None:
+            values[ordinal] = converters[ordinal](raw_value)
+            continue
+        id_targets = targets.get(id)
+        if id_targets is None:
+            missing_ids.add(id)
+            continue
+        for ordinal, slot in id_targets:
+            value = converters[ordinal](raw_value)
+            if slot is None:
+                values[ordinal] = value
+                continue
+            slots = values.get(ordinal)
+            if slots is None:
+                slots = values[ordinal] = [None] * range_lens[ordinal]
+            slots[slot] = value
+
     out: dict[str, Any] = {}
-    param_ids_used: set[int] = set()
-    for group in db.ALL_GROUPS:
-        group_out = _map_group(group, raw, param_ids_used=param_ids_used)
-        if group_out:
-            out[group.key] = group_out
-    missing_ids = set(raw) - param_ids_used
+    parameters = index.parameters
+    parameter_groups = index.parameter_groups
+    group_outs: dict[int, dict[str, Any]] = {}
+    dropped: set[int] = set()
+    for ordinal in sorted(values):
+        value = values[ordinal]
+        if value is None:
+            dropped.add(ordinal)
+            continue
+        if range_lens[ordinal]:
+            # strip trailing None values
+            while value and value[-1] is None:
+                value.pop()
+            if not value:
+                dropped.add(ordinal)
+                continue
+        group_nr = parameter_groups[ordinal]
+        group_out = group_outs.get(group_nr)
+        if group_out is None:
+            group_out = _group_out(index, group_nr, out, group_outs)
+        group_out[parameters[ordinal].key] = value
+
+    # IDs of dropped parameters are unused unless another parameter shares them
+    for ordinal in dropped:
+        for id in parameters[ordinal].iter_ids():
+            if id in raw and all(
+                other in dropped or other not in values for other, _ in targets[id]
+            ):
+                missing_ids.add(id)
     if missing_ids:
         _LOGGER.warning("Unused parameter IDs: %s", missing_ids)
     return out
 
 
-def _map_group(
-    group: ParameterGroup,
-    raw: dict[int, str],
-    *,
-    param_ids_used: set[int],
+def _group_out(
+    index: _ParameterIndex,
+    group_nr: int,
+    out: dict[str, Any],
+    group_outs: dict[int, dict[str, Any]],
 ) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-    for subgroup in group.groups:
-        subgroup_out = _map_group(subgroup, raw, param_ids_used=param_ids_used)
-        if subgroup_out:
-            out[subgroup.key] = subgroup_out
-    for parameter in group.parameters:
-        value = _map_parameter(parameter, raw)
-        if value is not None:
-            out[parameter.key] = value
-            param_ids_used.update(parameter.iter_ids())
-    return out
+    (parent, key) = index.groups[group_nr]
+    if parent < 0:
+        parent_out = out
+    else:
+        parent_out = group_outs.get(parent)
+        if parent_out is None:
+            parent_out = _group_out(index, parent, out, group_outs)
+    group_out = group_outs[group_nr] = parent_out[key] = {}
+    return group_out
 
 
-def _map_parameter(param: Parameter, raw: dict[int, str]) -> Any:
-    if isinstance(param.id, ParameterIdRange):
-        values: list[Any] = []
-        for id in param.id.to_range():
-            value = raw.get(id)
-            if value is not None:
-                value = param.convert_from_raw(value)
-            values.append(value)
-        # strip trailing None values
-        while values and values[-1] is None:
-            values.pop()
-        if not values:
-            return None
-        return values
-    else:
-        value = raw.get(param.id)
-        if value is not None:
-            value = param.convert_from_raw(value)
-        return value
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _RawGroup:
+    """Group of the parameter database prepared for `map_parameters_to_raw`."""
+
+    key: str
+    groups: tuple["_RawGroup", ...]
+    parameters: tuple[tuple[str, int, range | None, Callable[[Any], str]], ...]
+    """(key, ID, ID range or None, converter) of every parameter"""
+
+    @classmethod
+    def compile(cls, group: ParameterGroup) -> "_RawGroup":
+        parameters: list[tuple[str, int, range | None, Callable[[Any], str]]] = []
+        for param in group.parameters:
+            if isinstance(param.id, ParameterIdRange):
+                ids = param.id.to_range()
+                parameters.append((param.key, ids.start, ids, param._to_raw))
+            else:
+                parameters.append((param.key, param.id, None, param._to_raw))
+        return cls(
+            key=group.key,
+            groups=tuple(cls.compile(subgroup) for subgroup in group.groups),
+            parameters=tuple(parameters),
+        )
+
+
+@functools.cache
+def _compile_raw_groups() -> tuple[_RawGroup, ...]:
+    return tuple(_RawGroup.compile(group) for group in db.ALL_GROUPS)
 
 
 def map_parameters_to_raw(values: dict[str, Any]) -> dict[int, str]:
     out: dict[int, str] = {}
-    for group in db.ALL_GROUPS:
+    for group in _compile_raw_groups():
         group_values = values.get(group.key)
         if group_values is None:
             continue
@@ -71,7 +194,7 @@ def map_parameters_to_raw(values: dict[str, Any]) -> dict[int, str]:
 
 
 def _map_group_to_raw(
-    group: ParameterGroup,
+    group: _RawGroup,
     values: dict[str, Any],
     *,
     out: dict[int, str],
@@ -81,33 +204,16 @@ def _map_group_to_raw(
         if subgroup_values is None:
             continue
         _map_group_to_raw(subgroup, subgroup_values, out=out)
-    for parameter in group.parameters:
-        _map_parameter_to_raw(parameter, values, out=out)
-
+    for key, id, ids, to_raw in group.parameters:
+        if key not in values:
+            continue
+        value = values[key]
+        if ids is None:
+            out[id] = to_raw(value)
+            continue
 
-def _map_parameter_to_raw(
-    param: Parameter,
-    values: dict[str, Any],
-    *,
-    out: dict[int, str],
-) -> None:
-    if not isinstance(param.id, ParameterIdRange):
-        try:
-            value = values[param.key]
-        except KeyError:
-            return
-        out[param.id] = param.convert_to_raw(value)
-        return
-
-    try:
-        list_values = values[param.key]
-    except KeyError:
-        return
-    assert isinstance(list_values, list)
-    list_values = cast(list[Any], list_values)
-    for idx, id in enumerate(param.id.to_range()):
-        if idx < len(list_values):
-            value = list_values[idx]
-        else:
-            value = None
-        out[id] = param.convert_to_raw(value)
+        assert isinstance(value, list)
+        list_values = cast(list[Any], value)
+        count = len(list_values)
+        for idx, id in enumerate(ids):
+            out[id] = to_raw(list_values[idx] if idx < count else None)
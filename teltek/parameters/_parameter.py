@@ -1,8 +1,12 @@
 import dataclasses
 import enum
-from collections.abc import Iterator
+import functools
+from collections.abc import Callable, Iterator
 from typing import Any, Self
 
+# integers beyond this can't round trip through float exactly
+_MAX_EXACT_FLOAT_INT = 2**53
+
 
 @dataclasses.dataclass(frozen=True)
 class ParameterIdRange:
@@ -128,6 +132,13 @@ class Parameter:
             assert self.value_range.min <= min_value
             assert self.value_range.max >= max_value
 
+    def __getstate__(self) -> dict[str, Any]:
+        # the compiled converters are local functions, they're rebuilt on use
+        state = self.__dict__.copy()
+        state.pop("_from_raw", None)
+        state.pop("_to_raw", None)
+        return state
+
     def iter_ids(self) -> Iterator[int]:
         if isinstance(self.id, int):
             yield self.id
@@ -176,6 +187,105 @@ class Parameter:
         return value
 
     def convert_from_raw(self, raw: str, *, lenient: bool = False) -> Any:
+        if lenient:
+            return self._convert_from_raw(raw, lenient=True)
+        return self._from_raw(raw)
+
+    def convert_to_raw(self, value: Any) -> str:
+        return self._to_raw(value)
+
+    @functools.cached_property
+    def _from_raw(self) -> Callable[[str], Any]:
+        """`convert_from_raw` specialised for this parameter.
+
+        Unusual input falls back to the generic conversion, which also raises
+        the errors.
+        """
+        slow = self._convert_from_raw
+        if self.type == ParameterType.STRING:
+            return slow if self.value_map is not None else _identity
+        if self.type == ParameterType.DOUBLE:
+            if self.value_map is not None:
+                return slow
+
+            def convert_double(raw: str) -> Any:
+                if not raw:
+                    return None
+                try:
+                    return float(raw)
+                except ValueError:
+                    return slow(raw)
+
+            return convert_double
+
+        if self.value_map is None:
+
+            def convert_int(raw: str) -> Any:
+                try:
+                    value = int(raw)
+                except ValueError:
+                    return slow(raw)
+                if -_MAX_EXACT_FLOAT_INT <= value <= _MAX_EXACT_FLOAT_INT:
+                    return value
+                return slow(raw)
+
+            return convert_int
+
+        if self.value_is_bitflag:
+            # bitflag values are decomposed once and remembered
+            flag_keys: dict[str, str] = {}
+
+            def convert_bitflag(raw: str) -> Any:
+                key = flag_keys.get(raw)
+                if key is None:
+                    key = slow(raw)
+                    if len(flag_keys) < 1024:
+                        flag_keys[raw] = key
+                return key
+
+            return convert_bitflag
+
+        # the first mapping of a value wins
+        value_keys: dict[int, str] = {}
+        for mapping in self.value_map:
+            value_keys.setdefault(mapping.value, mapping.key)
+
+        def convert_mapped(raw: str) -> Any:
+            try:
+                key = value_keys.get(int(raw))
+            except ValueError:
+                return slow(raw)
+            return key if key is not None else slow(raw)
+
+        return convert_mapped
+
+    @functools.cached_property
+    def _to_raw(self) -> Callable[[Any], str]:
+        """`convert_to_raw` specialised for this parameter."""
+        slow = self._convert_to_raw
+        if self.value_map is None:
+            if self.type == ParameterType.DOUBLE:
+                return slow
+            return _str_or_empty
+
+        raw_keys: dict[str, str] = {}
+        for mapping in self.value_map:
+            if mapping.key not in raw_keys:
+                raw_keys[mapping.key] = self.type.convert_to_raw(mapping.value)
+
+        def convert(value: Any) -> str:
+            if type(value) is not str:
+                return slow(value)
+            raw = raw_keys.get(value)
+            if raw is None:
+                raw = slow(value)
+                if self.value_is_bitflag and len(raw_keys) < 1024:
+                    raw_keys[value] = raw
+            return raw
+
+        return convert
+
+    def _convert_from_raw(self, raw: str, *, lenient: bool = False) -> Any:
         try:
             value = self.type.convert_from_raw(raw)
         except Exception as exc:
@@ -188,7 +298,7 @@ class Parameter:
             return self.map_value_to_key(value, retain=lenient)
         return value
 
-    def convert_to_raw(self, value: Any) -> str:
+    def _convert_to_raw(self, value: Any) -> str:
         if self.value_map is not None:
             try:
                 value = self.map_key_to_value(value)
@@ -202,6 +312,14 @@ class Parameter:
         return self.type.max_raw_len(self.value_range.max)
 
 
+def _identity(raw: str) -> str:
+    return raw
+
+
+def _str_or_empty(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ParameterGroup:
     key: str
@@ -0,0 +1,13 @@
+from ._pool import AvlTcpServerPool
+from ._sink import AvlBatch, AvlSink, ServerStats
+from ._tcp import AvlTcpServer
+from ._udp import AvlUdpServer
+
+__all__ = [
+    "AvlBatch",
+    "AvlSink",
+    "AvlTcpServer",
+    "AvlTcpServerPool",
+    "AvlUdpServer",
+    "ServerStats",
+]
@@ -0,0 +1,191 @@
+import asyncio
+import dataclasses
+import logging
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.queues
+import os
+import queue
+import signal
+import time
+from collections.abc import Callable
+from typing import Any
+
+from teltek.server._sink import AvlSink, ServerStats
+from teltek.server._tcp import AvlTcpServer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AvlTcpServerPool:
+    """Run AvlTcpServer in multiple worker processes sharing one port.
+
+    Every worker binds the port with SO_REUSEPORT so the kernel distributes
+    incoming connections between them, and runs its own event loop, decoder and
+    sink created by `sink_factory`. With the default "spawn" start method
+    `sink_factory` must be picklable, e.g. a module level function or class.
+
+    The parent restarts workers that exit unexpectedly and collects the stats
+    every worker reports periodically.
+    """
+
+    def __init__(
+        self,
+        sink_factory: Callable[[], AvlSink],
+        *,
+        workers: int | None = None,
+        host: str | None = None,
+        port: int = 5027,
+        stats_interval: float = 5,
+        start_method: str = "spawn",
+        **server_kwargs: Any,
+    ) -> None:
+        if "reuse_port" in server_kwargs:
+            raise TypeError("reuse_port is always enabled for the pool workers")
+        self._sink_factory = sink_factory
+        self._worker_count = workers or os.cpu_count() or 1
+        self._server_kwargs = {"host": host, "port": port, **server_kwargs}
+        self._stats_interval = stats_interval
+        self._ctx = multiprocessing.get_context(start_method)
+        self._stats_queue: multiprocessing.queues.Queue[tuple[int, dict[str, int]]] = (
+            self._ctx.Queue()
+        )
+        self._workers: dict[int, multiprocessing.process.BaseProcess] = {}
+        self._worker_stats: dict[int, ServerStats] = {}
+        # stats of workers that were restarted
+        self._retired_stats = ServerStats()
+        self._stopping = False
+
+    def start(self) -> None:
+        assert not self._workers
+        self._stopping = False
+        for index in range(self._worker_count):
+            self._start_worker(index)
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stopping = True
+        for process in self._workers.values():
+            process.terminate()
+        # a worker only exits once the stats it put are read from the queue,
+        # keep draining it until they are gone
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and any(
+            process.is_alive() for process in self._workers.values()
+        ):
+            self.supervise(0.05)
+        for process in self._workers.values():
+            if process.is_alive():
+                _LOGGER.warning("worker %s didn't stop, killing it", process.pid)
+                process.kill()
+            process.join()
+        self._drain_stats()
+        self._workers.clear()
+
+    def run(self) -> None:
+        """Start the workers and supervise them until interrupted."""
+        self.start()
+        try:
+            while True:
+                self.supervise(self._stats_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def supervise(self, timeout: float = 0) -> None:
+        """Collect worker stats and restart workers that died."""
+        try:
+            index, stats = self._stats_queue.get(timeout=timeout)
+        except queue.Empty:
+            pass
+        else:
+            self._worker_stats[index] = ServerStats(**stats)
+        self._drain_stats()
+
+        if self._stopping:
+            return
+        for index, process in list(self._workers.items()):
+            if process.is_alive():
+                continue
+            _LOGGER.warning(
+                "worker %d (pid %s) exited with %s, restarting",
+                index,
+                process.pid,
+                process.exitcode,
+            )
+            if (retired := self._worker_stats.pop(index, None)) is not None:
+                retired.active_connections = 0
+                self._retired_stats.merge(retired)
+            self._start_worker(index)
+
+    @property
+    def worker_stats(self) -> dict[int, ServerStats]:
+        """latest stats reported by each worker"""
+        return dict(self._worker_stats)
+
+    @property
+    def stats(self) -> ServerStats:
+        """sum of the latest stats of all workers"""
+        total = dataclasses.replace(self._retired_stats)
+        for stats in self._worker_stats.values():
+            total.merge(stats)
+        return total
+
+    def _drain_stats(self) -> None:
+        while True:
+            try:
+                index, stats = self._stats_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._worker_stats[index] = ServerStats(**stats)
+
+    def _start_worker(self, index: int) -> None:
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                index,
+                self._sink_factory,
+                self._server_kwargs,
+                self._stats_queue,
+                self._stats_interval,
+            ),
+            name=f"avl-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[index] = process
+        _LOGGER.info("started worker %d (pid %s)", index, process.pid)
+
+
+def _worker_main(
+    index: int,
+    sink_factory: Callable[[], AvlSink],
+    server_kwargs: dict[str, Any],
+    stats_queue: "multiprocessing.queues.Queue[tuple[int, dict[str, int]]]",
+    stats_interval: float,
+) -> None:
+    asyncio.run(
+        _serve_worker(index, sink_factory, server_kwargs, stats_queue, stats_interval)
+    )
+
+
+async def _serve_worker(
+    index: int,
+    sink_factory: Callable[[], AvlSink],
+    server_kwargs: dict[str, Any],
+    stats_queue: "multiprocessing.queues.Queue[tuple[int, dict[str, int]]]",
+    stats_interval: float,
+) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, stop.set)
+    loop.add_signal_handler(signal.SIGINT, stop.set)
+
+    server = AvlTcpServer(sink_factory(), reuse_port=True, **server_kwargs)
+    async with server:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=stats_interval)
+            except asyncio.TimeoutError:
+                pass
+            stats_queue.put((index, dataclasses.asdict(server.stats)))
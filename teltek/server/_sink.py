@@ -0,0 +1,42 @@
+import abc
+import dataclasses
+
+from teltek.codec import AvlCodec
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class AvlBatch:
+    imei: str
+    data: AvlCodec
+
+    @property
+    def record_count(self) -> int:
+        return len(self.data.avl_data)
+
+
+class AvlSink(abc.ABC):
+    @abc.abstractmethod
+    async def handle(self, batch: AvlBatch) -> None:
+        """Process a decoded batch.
+
+        The batch is only acknowledged to the device after this returns, so a
+        slow sink slows down the devices sending to it. Raising an exception
+        closes the connection without acknowledging the batch.
+        """
+
+
+@dataclasses.dataclass(kw_only=True)
+class ServerStats:
+    connections: int = 0
+    active_connections: int = 0
+    rejected_connections: int = 0
+    frames: int = 0
+    records: int = 0
+    bytes_received: int = 0
+    errors: int = 0
+
+    def merge(self, other: "ServerStats") -> None:
+        for field in dataclasses.fields(self):
+            setattr(
+                self, field.name, getattr(self, field.name) + getattr(other, field.name)
+            )
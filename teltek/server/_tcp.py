@@ -0,0 +1,255 @@
+import asyncio
+import collections
+import logging
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
+from teltek.codec import FrameDecoder, MessageFrame, decode_avl_frame
+from teltek.server._sink import AvlBatch, AvlSink, ServerStats
+
+_LOGGER = logging.getLogger(__name__)
+
+_IMEI_ACCEPTED = b"\x01"
+_IMEI_REJECTED = b"\x00"
+_MAX_IMEI_LEN = 32
+
+
+class AvlTcpServer:
+    """Receive AVL data from devices over TCP.
+
+    Every connection starts with the IMEI login (2 byte length followed by the
+    IMEI). Afterwards the device sends AVL data frames which are decoded, handed
+    to the sink and acknowledged with the number of records.
+    """
+
+    def __init__(
+        self,
+        sink: AvlSink,
+        *,
+        host: str | None = None,
+        port: int = 5027,
+        accept_imei: Callable[[str], bool] | None = None,
+        max_pending_frames: int = 4,
+        idle_timeout: float | None = 600,
+        reuse_port: bool = False,
+    ) -> None:
+        self._sink = sink
+        self._host = host
+        self._port = port
+        self._accept_imei = accept_imei
+        self._max_pending_frames = max_pending_frames
+        self._idle_timeout = idle_timeout
+        self._reuse_port = reuse_port
+        self._server: asyncio.Server | None = None
+        self._connections: set[_AvlTcpProtocol] = set()
+        self.stats = ServerStats()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        await self.close()
+
+    @property
+    def port(self) -> int:
+        """port the server is bound to, useful when started with port 0"""
+        if self._server is not None:
+            for sock in self._server.sockets:
+                return sock.getsockname()[1]
+        return self._port
+
+    async def start(self) -> None:
+        assert self._server is None
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _AvlTcpProtocol(self),
+            host=self._host,
+            port=self._port,
+            reuse_port=self._reuse_port or None,
+        )
+        _LOGGER.info("listening on port %d", self.port)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for conn in list(self._connections):
+            conn.close()
+        await self._server.wait_closed()
+        self._server = None
+
+
+class _AvlTcpProtocol(asyncio.Protocol):
+    def __init__(self, server: AvlTcpServer) -> None:
+        self._server = server
+        self._stats = server.stats
+        self._transport: asyncio.Transport | None = None
+        self._peer: object = None
+        self._imei: str | None = None
+        self._login_buffer = bytearray()
+        self._decoder = FrameDecoder()
+        self._pending: collections.deque[MessageFrame] = collections.deque()
+        self._worker: asyncio.Task[None] | None = None
+        self._paused = False
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._last_activity = 0.0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+        self._peer = transport.get_extra_info("peername")
+        self._server._connections.add(self)
+        self._stats.connections += 1
+        self._stats.active_connections += 1
+        self._schedule_idle_check()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._server._connections.discard(self)
+        self._stats.active_connections -= 1
+        self._transport = None
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._pending.clear()
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    def data_received(self, data: bytes) -> None:
+        self._stats.bytes_received += len(data)
+        self._last_activity = asyncio.get_running_loop().time()
+        if self._imei is None:
+            self._login_buffer += data
+            if not self._try_login():
+                return
+            data = bytes(self._login_buffer)
+            self._login_buffer.clear()
+            if not data:
+                return
+
+        self._decoder.feed(data)
+        try:
+            self._pending.extend(self._decoder)
+        except Exception:
+            _LOGGER.exception("%s: failed to decode frame", self._imei)
+            self._stats.errors += 1
+            self.close()
+            return
+
+        if self._pending and self._worker is None:
+            self._worker = asyncio.create_task(self._process_pending())
+        if len(self._pending) >= self._server._max_pending_frames:
+            self._pause()
+
+    def _try_login(self) -> bool:
+        buf = self._login_buffer
+        if len(buf) < 2:
+            return False
+        imei_len = int.from_bytes(buf[:2], byteorder="big")
+        if imei_len > _MAX_IMEI_LEN:
+            self._reject(f"invalid imei length {imei_len}")
+            return False
+        if len(buf) < 2 + imei_len:
+            return False
+        imei = buf[2 : 2 + imei_len].decode("ascii", errors="replace")
+        del buf[: 2 + imei_len]
+        if not imei.isdigit():
+            self._reject(f"invalid imei {imei!r}")
+            return False
+        accept_imei = self._server._accept_imei
+        if accept_imei is not None and not accept_imei(imei):
+            self._reject(f"imei {imei} not accepted")
+            return False
+
+        assert self._transport is not None
+        self._imei = imei
+        self._transport.write(_IMEI_ACCEPTED)
+        _LOGGER.debug("%s: logged in from %s", imei, self._peer)
+        return True
+
+    def _reject(self, reason: str) -> None:
+        _LOGGER.info("%s: rejecting connection: %s", self._peer, reason)
+        self._stats.rejected_connections += 1
+        assert self._transport is not None
+        self._transport.write(_IMEI_REJECTED)
+        self._transport.close()
+
+    async def _process_pending(self) -> None:
+        assert self._imei is not None
+        try:
+            while self._pending:
+                frame = self._pending.popleft()
+                if (
+                    self._paused
+                    and len(self._pending) < self._server._max_pending_frames
+                ):
+                    self._resume()
+                await self._process_frame(frame)
+        except Exception:
+            _LOGGER.exception("%s: failed to process frame", self._imei)
+            self._stats.errors += 1
+            self.close()
+        finally:
+            self._worker = None
+
+    async def _process_frame(self, frame: MessageFrame) -> None:
+        assert self._imei is not None
+        data = decode_avl_frame(frame)
+        batch = AvlBatch(imei=self._imei, data=data)
+        await self._server._sink.handle(batch)
+        self._stats.frames += 1
+        self._stats.records += batch.record_count
+        if self._transport is not None:
+            self._transport.write(batch.record_count.to_bytes(4, byteorder="big"))
+
+    def _pause(self) -> None:
+        if not self._paused and self._transport is not None:
+            self._paused = True
+            self._transport.pause_reading()
+
+    def _resume(self) -> None:
+        if self._paused and self._transport is not None:
+            self._paused = False
+            self._transport.resume_reading()
+
+    def _schedule_idle_check(self) -> None:
+        # instead of rescheduling a timer for every chunk of data, check the
+        # time of the last activity whenever the timer fires
+        timeout = self._server._idle_timeout
+        if timeout is None:
+            return
+        loop = asyncio.get_running_loop()
+        self._last_activity = loop.time()
+        self._idle_handle = loop.call_later(timeout, self._check_idle)
+
+    def _check_idle(self) -> None:
+        timeout = self._server._idle_timeout
+        assert timeout is not None
+        loop = asyncio.get_running_loop()
+        idle_for = loop.time() - self._last_activity
+        if self._worker is not None:
+            # waiting for the sink doesn't count as idle
+            idle_for = 0
+        if idle_for < timeout:
+            self._idle_handle = loop.call_later(timeout - idle_for, self._check_idle)
+            return
+        _LOGGER.info("%s: closing idle connection", self._imei or self._peer)
+        self._idle_handle = None
+        self.close()
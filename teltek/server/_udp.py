@@ -0,0 +1,151 @@
+import asyncio
+import collections
+import logging
+import socket
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
+from teltek.codec import UdpAvlPacket, decode_avl
+from teltek.server._sink import AvlBatch, AvlSink, ServerStats
+
+_LOGGER = logging.getLogger(__name__)
+
+_Addr = tuple[str, int]
+
+
+class AvlUdpServer:
+    """Receive AVL data from devices over UDP.
+
+    Datagrams are decoded as they arrive and handed to the sink in arrival
+    order, each one is acknowledged once the sink has processed it. There's no
+    per-device connection state apart from the last AVL packet id, which is used
+    to acknowledge retransmitted packets without passing them to the sink again.
+    """
+
+    def __init__(
+        self,
+        sink: AvlSink,
+        *,
+        host: str | None = None,
+        port: int = 5027,
+        accept_imei: Callable[[str], bool] | None = None,
+        max_pending_packets: int = 10_000,
+        receive_buffer_size: int | None = 4 * 1024 * 1024,
+    ) -> None:
+        self._sink = sink
+        self._host = host
+        self._port = port
+        self._accept_imei = accept_imei
+        self._max_pending_packets = max_pending_packets
+        self._receive_buffer_size = receive_buffer_size
+        self._transport: asyncio.DatagramTransport | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._pending: collections.deque[tuple[UdpAvlPacket, _Addr]] = (
+            collections.deque()
+        )
+        self._last_avl_packet_ids: dict[str, int] = {}
+        self.stats = ServerStats()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        await self.close()
+
+    @property
+    def port(self) -> int:
+        """port the server is bound to, useful when started with port 0"""
+        if self._transport is not None:
+            return self._transport.get_extra_info("sockname")[1]
+        return self._port
+
+    async def start(self) -> None:
+        assert self._transport is None
+        loop = asyncio.get_running_loop()
+        (self._transport, _) = await loop.create_datagram_endpoint(
+            lambda: _AvlUdpProtocol(self),
+            local_addr=(self._host or "0.0.0.0", self._port),
+        )
+        if self._receive_buffer_size is not None:
+            # a burst of datagrams from many devices easily fills the default
+            # buffer, every dropped datagram costs a device retransmission
+            sock = self._transport.get_extra_info("socket")
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self._receive_buffer_size
+            )
+        _LOGGER.info("listening on udp port %d", self.port)
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._pending.clear()
+
+    def _datagram_received(self, payload: bytes, addr: _Addr) -> None:
+        self.stats.bytes_received += len(payload)
+        try:
+            packet = UdpAvlPacket.decode(payload)
+        except Exception:
+            _LOGGER.warning("%s: failed to decode udp packet", addr, exc_info=True)
+            self.stats.errors += 1
+            return
+
+        if self._accept_imei is not None and not self._accept_imei(packet.imei):
+            _LOGGER.debug("%s: imei %s not accepted", addr, packet.imei)
+            self.stats.rejected_connections += 1
+            return
+        if len(self._pending) >= self._max_pending_packets:
+            # the device retransmits packets that aren't acknowledged
+            _LOGGER.warning("dropping udp packet from %s, sink is too slow", addr)
+            self.stats.errors += 1
+            return
+
+        self._pending.append((packet, addr))
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._process_pending())
+
+    async def _process_pending(self) -> None:
+        try:
+            while self._pending:
+                packet, addr = self._pending.popleft()
+                try:
+                    await self._process_packet(packet, addr)
+                except Exception:
+                    _LOGGER.exception("%s: failed to process udp packet", packet.imei)
+                    self.stats.errors += 1
+        finally:
+            self._worker = None
+
+    async def _process_packet(self, packet: UdpAvlPacket, addr: _Addr) -> None:
+        data = decode_avl(packet.codec_id, packet.data)
+        record_count = len(data.avl_data)
+        if self._last_avl_packet_ids.get(packet.imei) != packet.avl_packet_id:
+            await self._sink.handle(AvlBatch(imei=packet.imei, data=data))
+            self._last_avl_packet_ids[packet.imei] = packet.avl_packet_id
+            self.stats.frames += 1
+            self.stats.records += record_count
+        else:
+            _LOGGER.debug("%s: acknowledging retransmitted packet", packet.imei)
+        if self._transport is not None:
+            self._transport.sendto(packet.ack(record_count).encode(), addr)
+
+
+class _AvlUdpProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: AvlUdpServer) -> None:
+        self._server = server
+
+    def datagram_received(self, data: bytes, addr: _Addr) -> None:
+        self._server._datagram_received(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.warning("udp socket error: %s", exc)
@@ -0,0 +1,15 @@
+from ._device import VirtualDevice
+from ._fleet import Fleet, FleetStats
+from ._histogram import LatencyHistogram
+from ._params import ParameterStore, default_raw_parameters
+from ._transport import SimTransport
+
+__all__ = [
+    "Fleet",
+    "FleetStats",
+    "LatencyHistogram",
+    "ParameterStore",
+    "SimTransport",
+    "VirtualDevice",
+    "default_raw_parameters",
+]
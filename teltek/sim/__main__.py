@@ -0,0 +1,63 @@
+import argparse
+import asyncio
+import logging
+
+from aiomqtt import Client
+
+from teltek.sim import Fleet, FleetStats
+
+
+def _report(stats: FleetStats) -> None:
+    latency = stats.latency
+    print(f"frames sent:  {stats.frames_sent}")
+    print(f"frames acked: {stats.frames_acked} ({stats.records_acked} records)")
+    print(f"commands:     {stats.commands}")
+    print(f"errors:       {stats.errors}")
+    print(
+        f"ack latency:  mean {latency.mean * 1e3:.1f}ms"
+        f" p50 {latency.percentile(50) * 1e3:.1f}ms"
+        f" p99 {latency.percentile(99) * 1e3:.1f}ms"
+        f" max {latency.max * 1e3:.1f}ms"
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    fleet = Fleet.create(args.devices, record_interval=args.record_interval)
+    kwargs = dict(
+        frame_interval=args.frame_interval,
+        records_per_frame=args.records,
+        duration=args.duration,
+    )
+    if args.transport == "tcp":
+        stats = await fleet.run_tcp(args.host, args.port, **kwargs)
+    else:
+        async with Client(args.host, args.port) as client:
+            stats = await fleet.run_mqtt(client, **kwargs)
+    _report(stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m teltek.sim", description="simulate a fleet of devices"
+    )
+    parser.add_argument("transport", choices=["tcp", "mqtt"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument(
+        "--frame-interval", type=float, default=10, help="seconds between frames"
+    )
+    parser.add_argument("--records", type=int, default=1, help="records per frame")
+    parser.add_argument(
+        "--record-interval", type=float, default=10, help="simulated seconds per record"
+    )
+    parser.add_argument("--duration", type=float, default=60, help="seconds to run")
+    args = parser.parse_args()
+    if args.port is None:
+        args.port = 5027 if args.transport == "tcp" else 1883
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import math
+import random
+import time
+
+from teltek.codec import Codec8e, Codec8eAvlData, Codec8eGpsElement, Codec8eIoElement
+from teltek.sim._params import ParameterStore
+
+# io ids used in the generated records
+_IO_IGNITION = 239
+_IO_MOVEMENT = 240
+_IO_SPEED = 24
+_IO_EXTERNAL_VOLTAGE = 66
+_IO_TOTAL_ODOMETER = 16
+
+# meters per degree of latitude
+_METERS_PER_DEGREE = 111_320
+
+
+class VirtualDevice:
+    """Simulated FMB device producing time advancing Codec 8E records.
+
+    The device drives around randomly starting at the given position. Every
+    record advances the clock by `record_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        imei: str,
+        *,
+        latitude: float = 47.37,
+        longitude: float = 8.54,
+        record_interval: float = 10,
+        start_time: float | None = None,
+        parameters: ParameterStore | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.imei = imei
+        self.parameters = parameters if parameters is not None else ParameterStore()
+        self._random = random.Random(seed if seed is not None else imei)
+        self._latitude = latitude
+        self._longitude = longitude
+        self._heading = self._random.uniform(0, 360)
+        self._speed = 0.0
+        self._odometer = 0.0
+        self._record_interval = record_interval
+        self._timestamp = start_time if start_time is not None else time.time()
+
+    def next_record(self) -> Codec8eAvlData:
+        rng = self._random
+        self._timestamp += self._record_interval
+        # accelerate, brake or stop for a while
+        self._speed = min(max(self._speed + rng.uniform(-15, 15), 0), 130)
+        self._heading = (self._heading + rng.uniform(-20, 20)) % 360
+        distance = self._speed / 3.6 * self._record_interval
+        self._odometer += distance
+        heading = math.radians(self._heading)
+        self._latitude += distance * math.cos(heading) / _METERS_PER_DEGREE
+        self._longitude += (
+            distance
+            * math.sin(heading)
+            / (_METERS_PER_DEGREE * math.cos(math.radians(self._latitude)))
+        )
+        moving = int(self._speed > 0)
+        return Codec8eAvlData(
+            timestamp=int(self._timestamp * 1000),
+            priority=0,
+            gps=Codec8eGpsElement(
+                longitude=round(self._longitude * 1e7),
+                latitude=round(self._latitude * 1e7),
+                altitude=rng.randint(400, 600),
+                angle=round(self._heading) % 360,
+                satellites=rng.randint(6, 18),
+                speed=round(self._speed),
+            ),
+            io=Codec8eIoElement(
+                event_io_id=0,
+                n1={_IO_IGNITION: 1, _IO_MOVEMENT: moving},
+                n2={
+                    _IO_SPEED: round(self._speed),
+                    _IO_EXTERNAL_VOLTAGE: rng.randint(12_800, 14_200),
+                },
+                n4={_IO_TOTAL_ODOMETER: round(self._odometer)},
+                n8={},
+                nx={},
+            ),
+        )
+
+    def next_batch(self, records: int) -> Codec8e:
+        return Codec8e(avl_data=[self.next_record() for _ in range(records)])
+
+    def handle_command(self, command: str) -> str:
+        return self.parameters.handle_command(command)
@@ -0,0 +1,268 @@
+import asyncio
+import dataclasses
+import logging
+import random
+import time
+from collections.abc import Iterator
+from typing import Any, Self
+
+from aiomqtt import Client
+
+from teltek.codec import Codec12, Codec12Type, CodecId, MessageFrame
+from teltek.sim._device import VirtualDevice
+from teltek.sim._histogram import LatencyHistogram
+from teltek.sim._params import ParameterStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(kw_only=True)
+class FleetStats:
+    frames_sent: int = 0
+    frames_acked: int = 0
+    records_acked: int = 0
+    commands: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = dataclasses.field(default_factory=LatencyHistogram)
+
+
+class Fleet:
+    """Many virtual devices sending AVL data from a single event loop."""
+
+    def __init__(self, devices: list[VirtualDevice]) -> None:
+        self._devices = {device.imei: device for device in devices}
+
+    @classmethod
+    def create(
+        cls,
+        count: int,
+        *,
+        imei_prefix: str = "35630704",
+        parameters: ParameterStore | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Create `count` devices, every one with its own copy of `parameters`."""
+        width = 15 - len(imei_prefix)
+        return cls(
+            [
+                VirtualDevice(
+                    f"{imei_prefix}{idx:0{width}d}",
+                    parameters=parameters.copy() if parameters is not None else None,
+                    **kwargs,
+                )
+                for idx in range(count)
+            ]
+        )
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def __iter__(self) -> Iterator[VirtualDevice]:
+        return iter(self._devices.values())
+
+    def device(self, imei: str) -> VirtualDevice:
+        return self._devices[imei]
+
+    async def run_tcp(
+        self,
+        host: str,
+        port: int,
+        *,
+        frame_interval: float = 10,
+        records_per_frame: int = 1,
+        frames: int | None = None,
+        duration: float | None = None,
+        ack_timeout: float = 30,
+        max_connecting: int = 256,
+    ) -> FleetStats:
+        """Send AVL data to a TCP server.
+
+        Every device sends a frame of `records_per_frame` records every
+        `frame_interval` seconds (with a random start offset) until it sent
+        `frames` frames or `duration` elapsed, and waits for the record count
+        acknowledgement in between.
+        """
+        stats = FleetStats()
+        connect_limit = asyncio.Semaphore(max_connecting)
+        deadline = None if duration is None else time.monotonic() + duration
+        await asyncio.gather(
+            *(
+                self._run_tcp_device(
+                    device,
+                    host,
+                    port,
+                    stats,
+                    connect_limit,
+                    frame_interval=frame_interval,
+                    records_per_frame=records_per_frame,
+                    frames=frames,
+                    deadline=deadline,
+                    ack_timeout=ack_timeout,
+                )
+                for device in self
+            )
+        )
+        return stats
+
+    async def _run_tcp_device(
+        self,
+        device: VirtualDevice,
+        host: str,
+        port: int,
+        stats: FleetStats,
+        connect_limit: asyncio.Semaphore,
+        *,
+        frame_interval: float,
+        records_per_frame: int,
+        frames: int | None,
+        deadline: float | None,
+        ack_timeout: float,
+    ) -> None:
+        try:
+            async with connect_limit:
+                reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            _LOGGER.exception("%s: failed to connect", device.imei)
+            stats.errors += 1
+            return
+
+        try:
+            imei = device.imei.encode()
+            writer.write(len(imei).to_bytes(2, byteorder="big") + imei)
+            if await reader.readexactly(1) != b"\x01":
+                raise RuntimeError("imei rejected")
+
+            await asyncio.sleep(random.uniform(0, frame_interval))
+            sent = 0
+            buf = bytearray()
+            while (frames is None or sent < frames) and (
+                deadline is None or time.monotonic() < deadline
+            ):
+                codec = device.next_batch(records_per_frame)
+                frame_len = codec.frame_len()
+                if len(buf) < frame_len:
+                    buf = bytearray(frame_len)
+                codec.encode_frame_into(buf)
+
+                start = time.perf_counter()
+                # copy, the transport may still reference the data when the
+                # buffer is reused for the next frame
+                writer.write(buf[:frame_len])
+                stats.frames_sent += 1
+                sent += 1
+                ack = await asyncio.wait_for(reader.readexactly(4), ack_timeout)
+                stats.latency.record(time.perf_counter() - start)
+                stats.frames_acked += 1
+                stats.records_acked += int.from_bytes(ack, byteorder="big")
+
+                await asyncio.sleep(frame_interval)
+        except Exception:
+            _LOGGER.exception("%s: tcp session failed", device.imei)
+            stats.errors += 1
+        finally:
+            writer.close()
+
+    async def run_mqtt(
+        self,
+        client: Client,
+        *,
+        command_topic: str = "{imei}/commands",
+        data_topic: str = "{imei}/data",
+        frame_interval: float = 10,
+        records_per_frame: int = 1,
+        frames: int | None = None,
+        duration: float | None = None,
+    ) -> FleetStats:
+        """Publish AVL data over MQTT and answer Codec 12 commands.
+
+        The latency is the time until the broker acknowledged the publish. The
+        topics use the same defaults as `MqttTransport`, so commands sent by a
+        `CommandClient` are answered from each device's parameter store.
+        """
+        stats = FleetStats()
+        deadline = None if duration is None else time.monotonic() + duration
+        await client.subscribe(command_topic.format(imei="+"), qos=1)
+        responder = asyncio.create_task(
+            self._answer_mqtt_commands(client, command_topic, data_topic, stats)
+        )
+        try:
+            await asyncio.gather(
+                *(
+                    self._run_mqtt_device(
+                        device,
+                        client,
+                        data_topic.format(imei=device.imei),
+                        stats,
+                        frame_interval=frame_interval,
+                        records_per_frame=records_per_frame,
+                        frames=frames,
+                        deadline=deadline,
+                    )
+                    for device in self
+                )
+            )
+        finally:
+            responder.cancel()
+        return stats
+
+    async def _run_mqtt_device(
+        self,
+        device: VirtualDevice,
+        client: Client,
+        topic: str,
+        stats: FleetStats,
+        *,
+        frame_interval: float,
+        records_per_frame: int,
+        frames: int | None,
+        deadline: float | None,
+    ) -> None:
+        await asyncio.sleep(random.uniform(0, frame_interval))
+        sent = 0
+        while (frames is None or sent < frames) and (
+            deadline is None or time.monotonic() < deadline
+        ):
+            codec = device.next_batch(records_per_frame)
+            start = time.perf_counter()
+            try:
+                await client.publish(topic, codec.to_frame().encode(), qos=1)
+            except Exception:
+                _LOGGER.exception("%s: publish failed", device.imei)
+                stats.errors += 1
+            else:
+                stats.latency.record(time.perf_counter() - start)
+                stats.frames_acked += 1
+                stats.records_acked += records_per_frame
+            stats.frames_sent += 1
+            sent += 1
+            await asyncio.sleep(frame_interval)
+
+    async def _answer_mqtt_commands(
+        self, client: Client, command_topic: str, data_topic: str, stats: FleetStats
+    ) -> None:
+        prefix, _, suffix = command_topic.partition("{imei}")
+        async for msg in client.messages:
+            topic = msg.topic.value
+            if not (topic.startswith(prefix) and topic.endswith(suffix)):
+                continue
+            imei = topic[len(prefix) : len(topic) - len(suffix)]
+            device = self._devices.get(imei)
+            if device is None:
+                continue
+            try:
+                frame = MessageFrame.decode(msg.payload)  # type: ignore
+                if frame.codec_id != CodecId.CODEC_12:
+                    continue
+                request = Codec12.from_frame(frame)
+            except Exception:
+                _LOGGER.exception("%s: failed to decode command", imei)
+                stats.errors += 1
+                continue
+            response = Codec12(
+                type=Codec12Type.RESPONSE,
+                content=device.handle_command(request.content),
+            )
+            stats.commands += 1
+            await client.publish(
+                data_topic.format(imei=imei), response.to_frame().encode()
+            )
@@ -0,0 +1,59 @@
+import bisect
+import dataclasses
+import math
+
+
+@dataclasses.dataclass(kw_only=True)
+class LatencyHistogram:
+    """Latency histogram with logarithmic buckets.
+
+    Recording is O(log buckets) and memory use is independent of the number of
+    samples. Percentiles are accurate to the bucket width (~5% by default).
+    """
+
+    min_value: float = 1e-5
+    max_value: float = 600
+    growth: float = 1.05
+    count: int = 0
+    total: float = 0
+    max: float = 0
+    _bounds: list[float] = dataclasses.field(default_factory=list, repr=False)
+    _counts: list[int] = dataclasses.field(default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        buckets = math.ceil(math.log(self.max_value / self.min_value, self.growth))
+        self._bounds = [self.min_value * self.growth**i for i in range(buckets + 1)]
+        self._counts = [0] * (len(self._bounds) + 1)
+
+    def record(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        assert self._bounds == other._bounds, "histograms must use the same buckets"
+        for idx, count in enumerate(other._counts):
+            self._counts[idx] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket containing the p-th percentile (0-100)."""
+        if not self.count:
+            return 0
+        target = math.ceil(self.count * p / 100)
+        seen = 0
+        for idx, count in enumerate(self._counts):
+            seen += count
+            if seen >= max(target, 1):
+                if idx >= len(self._bounds):
+                    return self.max
+                return min(self._bounds[idx], self.max)
+        return self.max
@@ -0,0 +1,98 @@
+import collections
+import copy
+import functools
+import logging
+import types
+from collections.abc import Mapping, MutableMapping
+from typing import Self
+
+import teltek.parameters
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ParameterStore:
+    """In-memory device configuration answering Codec 12 parameter commands.
+
+    Without `raw_parameters` the store starts with the database defaults,
+    which are shared by all such stores and only the set values are kept per
+    store.
+    """
+
+    def __init__(self, raw_parameters: Mapping[int, str] | None = None) -> None:
+        self.raw_parameters: MutableMapping[int, str]
+        if raw_parameters is None:
+            self.raw_parameters = collections.ChainMap(
+                {}, _shared_default_raw_parameters()
+            )
+        else:
+            self.raw_parameters = dict(raw_parameters)
+
+    def copy(self) -> Self:
+        """Store starting with the same parameters, set values aren't shared."""
+        store = copy.copy(self)
+        raw = self.raw_parameters
+        if isinstance(raw, collections.ChainMap):
+            store.raw_parameters = collections.ChainMap(
+                dict(raw.maps[0]), *raw.maps[1:]
+            )
+        else:
+            store.raw_parameters = dict(raw)
+        return store
+
+    def handle_command(self, command: str) -> str:
+        name, _, args = command.partition(" ")
+        match name:
+            case "getparam":
+                return self._getparam(args)
+            case "setparam":
+                return self._setparam(args)
+            case "getver":
+                return "Ver:03.29.00 Rev:00 GPS:AXN_5.10 Hw:FMC130 Mod:68"
+            case _:
+                _LOGGER.debug("unsupported command %r", command)
+                return f"Unknown command: {name}"
+
+    def _getparam(self, args: str) -> str:
+        # Param ID:1000 Value:300;10000:60
+        parts: list[str] = []
+        for raw_id in args.split(";"):
+            try:
+                param_id = int(raw_id)
+            except ValueError:
+                continue
+            value = self.raw_parameters.get(param_id)
+            if value is None:
+                continue
+            if parts:
+                parts.append(f"{param_id}:{value}")
+            else:
+                parts.append(f"Param ID:{param_id} Value:{value}")
+        return ";".join(parts)
+
+    def _setparam(self, args: str) -> str:
+        # New value 2001:wap2;2002:user;2003:pass
+        applied: list[str] = []
+        for pair in args.split(";"):
+            raw_id, sep, value = pair.partition(":")
+            if not sep or not raw_id.isdigit():
+                continue
+            param_id = int(raw_id)
+            self.raw_parameters[param_id] = value
+            applied.append(f"{param_id}:{value}")
+        return "New value " + ";".join(applied)
+
+
+def default_raw_parameters() -> dict[int, str]:
+    """Raw default values of every parameter in the parameter database."""
+    return dict(_shared_default_raw_parameters())
+
+
+@functools.cache
+def _shared_default_raw_parameters() -> Mapping[int, str]:
+    raw: dict[int, str] = {}
+    for param in teltek.parameters.db.iter_parameters():
+        value = param.type.convert_to_raw(param.default_value)
+        for param_id in param.iter_ids():
+            raw[param_id] = value
+    return types.MappingProxyType(raw)
@@ -0,0 +1,54 @@
+import asyncio
+
+from teltek.cmd import DeviceId
+from teltek.cmd.transport import RateLimit, Transport
+from teltek.cmd.transport._rate_limit import _CommandLimiter
+from teltek.sim._device import VirtualDevice
+from teltek.sim._fleet import Fleet
+
+
+class SimTransport(Transport):
+    """Transport answering commands from a simulated fleet without any network.
+
+    `latency` is added to every command to emulate the round trip.
+    """
+
+    def __init__(
+        self,
+        fleet: Fleet,
+        *,
+        latency: float = 0,
+        max_command_len: int = 600,
+        max_concurrent_commands: int | None = None,
+        rate_limit: RateLimit | None = None,
+    ) -> None:
+        super().__init__()
+        self._fleet = fleet
+        self._latency = latency
+        self._max_command_len = max_command_len
+        self._max_concurrent_commands = max_concurrent_commands
+        self._rate_limit = rate_limit
+        self._command_limiter = _CommandLimiter(max_concurrent_commands, rate_limit)
+
+    @property
+    def max_command_len(self) -> int:
+        return self._max_command_len
+
+    @property
+    def max_concurrent_commands(self) -> int | None:
+        return self._max_concurrent_commands
+
+    @property
+    def rate_limit(self) -> RateLimit | None:
+        return self._rate_limit
+
+    async def run_command(self, device_id: DeviceId, command: str) -> str:
+        assert device_id.imei is not None, "IMEI required"
+        device = self._fleet.device(device_id.imei)
+        async with self._command_limiter.slot():
+            return await self._run_device_command(device, command)
+
+    async def _run_device_command(self, device: VirtualDevice, command: str) -> str:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return device.handle_command(command)
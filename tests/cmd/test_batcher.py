@@ -0,0 +1,25 @@
+import teltek.parameters
+from teltek.cmd._batcher import iter_param_batches, iter_set_param_batches
+
+
+def test_first_fit_decreasing_param_batches():
+    param_ids = list(teltek.parameters.db.iter_parameter_ids())
+    greedy = list(iter_param_batches(param_ids, 600))
+    packed = list(iter_param_batches(param_ids, 600, packing="first-fit-decreasing"))
+    assert len(packed) < len(greedy)
+    assert sorted(id for batch in packed for id in batch) == sorted(param_ids)
+    for batch in packed:
+        # input order is kept within a batch
+        assert batch == sorted(batch, key=param_ids.index)
+
+
+def test_first_fit_decreasing_set_param_batches():
+    # ";{id}:{raw}" takes 40, 60, 40 and 20 characters of the 89 available
+    params = {2001: "a" * 34, 2002: "b" * 54, 2003: "c" * 34, 2004: "d" * 14}
+    greedy = list(iter_set_param_batches(params.items(), 100))
+    packed = list(
+        iter_set_param_batches(params.items(), 100, packing="first-fit-decreasing")
+    )
+    assert [list(batch) for batch in greedy] == [[2001], [2002], [2003, 2004]]
+    assert [list(batch) for batch in packed] == [[2001, 2003], [2002, 2004]]
+    assert {id: raw for batch in packed for id, raw in batch.items()} == params
@@ -0,0 +1,213 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.sample_config import DATA, RAW
+from teltek.cmd import CommandClient, DeviceId, ParamLengthEstimator
+from teltek.cmd.transport import RateLimit
+from teltek.sim import Fleet, ParameterStore, SimTransport, VirtualDevice
+
+
+class _TrackingTransport(SimTransport):
+    def __init__(self, fleet: Fleet, **kwargs) -> None:
+        super().__init__(fleet, latency=0.001, **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _run_device_command(self, device: VirtualDevice, command: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await super()._run_device_command(device, command)
+        finally:
+            self.in_flight -= 1
+
+
+def test_get_full_parameters_many():
+    async def run() -> None:
+        fleet = Fleet(
+            [
+                VirtualDevice(f"35000000000000{i}", parameters=ParameterStore(RAW))
+                for i in range(6)
+            ]
+        )
+        transport = _TrackingTransport(fleet, max_concurrent_commands=3)
+        client = CommandClient(transport)
+        device_ids = [DeviceId(imei=device.imei) for device in fleet]
+        unknown = DeviceId(imei="359999999999999")
+
+        results = {}
+        async for device_id, result in client.get_full_parameters_many(
+            [*device_ids[:3], unknown, *device_ids[3:]], concurrency=4
+        ):
+            results[device_id] = result
+
+        assert len(results) == 7
+        assert isinstance(results.pop(unknown), KeyError)
+        assert all(result == DATA for result in results.values())
+        assert transport.max_in_flight == 3
+
+    asyncio.run(run())
+
+
+def test_get_full_parameters_many_break():
+    async def run() -> None:
+        fleet = Fleet.create(4, parameters=ParameterStore(RAW))
+        client = CommandClient(SimTransport(fleet, latency=0.001))
+        results = client.get_full_parameters_many(
+            [DeviceId(imei=device.imei) for device in fleet], concurrency=2
+        )
+        async for _ in results:
+            break
+        await results.aclose()
+        # no worker keeps running after the iterator is closed
+        assert len(asyncio.all_tasks()) == 1
+
+    asyncio.run(run())
+
+
+def test_get_full_parameters_many_backpressure():
+    async def run() -> None:
+        fleet = Fleet.create(20, parameters=ParameterStore(RAW))
+        client = CommandClient(SimTransport(fleet))
+        started = 0
+        get_full_parameters = client.get_full_parameters
+
+        async def counting_get_full_parameters(device_id: DeviceId):
+            nonlocal started
+            started += 1
+            return await get_full_parameters(device_id)
+
+        client.get_full_parameters = counting_get_full_parameters  # type: ignore
+        results = client.get_full_parameters_many(
+            [DeviceId(imei=device.imei) for device in fleet], concurrency=2
+        )
+        await anext(results)
+        await asyncio.sleep(0.05)
+        # 2 queued results and one result pending per worker
+        assert started <= 5
+        rest = [result async for _, result in results]
+        assert len(rest) == 19
+        assert all(result == DATA for result in rest)
+
+    asyncio.run(run())
+
+
+def test_rate_limit():
+    async def run() -> None:
+        fleet = Fleet.create(1, parameters=ParameterStore({1000: "60"}))
+        transport = SimTransport(fleet, rate_limit=RateLimit(commands=5, interval=0.1))
+        client = CommandClient(transport)
+        device_id = DeviceId(imei=next(iter(fleet)).imei)
+        start = time.monotonic()
+        await asyncio.gather(
+            *(client.run_command(device_id, "getparam 1000") for _ in range(15))
+        )
+        # a burst of 5, then 10 more at 50 per second
+        assert time.monotonic() - start >= 0.19
+
+    asyncio.run(run())
+
+
+class _SmsLikeTransport(SimTransport):
+    """Cuts off responses at `max_command_len` like a single SMS would."""
+
+    def __init__(self, fleet: Fleet) -> None:
+        super().__init__(fleet, max_command_len=160)
+        self.commands = 0
+
+    async def run_command(self, device_id: DeviceId, command: str) -> str:
+        self.commands += 1
+        response = await super().run_command(device_id, command)
+        return response[: self.max_command_len]
+
+
+def test_adaptive_batching():
+    async def run() -> None:
+        raw = dict(RAW)
+        fleet = Fleet.create(2, parameters=ParameterStore(raw))
+        (first, second) = [DeviceId(imei=device.imei) for device in fleet]
+
+        transport = _SmsLikeTransport(fleet)
+        assert await CommandClient(transport).get_raw_parameters(first, raw) == raw
+        worst_case_commands = transport.commands
+
+        estimator = ParamLengthEstimator()
+        estimator.observe(raw)
+        client = CommandClient(transport, length_estimator=estimator)
+        transport.commands = 0
+        assert await client.get_raw_parameters(first, raw) == raw
+        assert transport.commands < worst_case_commands / 2
+
+        # longer values than seen before are truncated and requested again
+        long_values = {2001: "a" * 32, 2002: "b" * 30, 2003: "c" * 30}
+        second_device = fleet.device(second.imei)
+        second_device.parameters = ParameterStore(raw | long_values)
+        assert await client.get_raw_parameters(second, raw) == raw | long_values
+        assert estimator.value_len(2001) == 32
+
+    asyncio.run(run())
+
+
+class _FlakyParameterStore(ParameterStore):
+    """Ignores `flaky_ids` the first time and `rejected_ids` always."""
+
+    def __init__(self, *, flaky_ids=(), rejected_ids=()) -> None:
+        super().__init__({})
+        self._flaky_ids = set(flaky_ids)
+        self._rejected_ids = set(rejected_ids)
+        self.commands: list[str] = []
+
+    def handle_command(self, command: str) -> str:
+        self.commands.append(command)
+        (name, _, args) = command.partition(" ")
+        pairs = [
+            pair
+            for pair in args.split(";")
+            if int(pair.partition(":")[0]) not in self._flaky_ids | self._rejected_ids
+        ]
+        self._flaky_ids.clear()
+        return super().handle_command(f"{name} {';'.join(pairs)}")
+
+
+def test_set_raw_parameters_resends_mismatches():
+    async def run() -> None:
+        store = _FlakyParameterStore(flaky_ids=[2002])
+        fleet = Fleet([VirtualDevice("356307042441013", parameters=store)])
+        client = CommandClient(SimTransport(fleet))
+        device_id = DeviceId(imei="356307042441013")
+
+        params = {2001: "wap2", 2002: "user", 2003: "pass"}
+        await client.set_raw_parameters(device_id, params)
+        assert store.raw_parameters == params
+        assert store.commands == [
+            "setparam 2001:wap2;2002:user;2003:pass",
+            "setparam 2002:user",
+        ]
+
+        store = _FlakyParameterStore(rejected_ids=[2003])
+        fleet = Fleet([VirtualDevice("356307042441013", parameters=store)])
+        client = CommandClient(SimTransport(fleet))
+        with pytest.raises(ValueError, match=r"\[2003\]"):
+            await client.set_raw_parameters(device_id, params)
+        assert store.commands[1:] == ["setparam 2003:pass"] * 2
+
+    asyncio.run(run())
+
+
+def test_adaptive_batching_requests_left_out_ids_again():
+    async def run() -> None:
+        params = {2001: "wap2", 2002: "user", 2003: "pass"}
+        store = _FlakyParameterStore(flaky_ids=[2002])
+        store.raw_parameters = dict(params)
+        fleet = Fleet([VirtualDevice("356307042441013", parameters=store)])
+        estimator = ParamLengthEstimator()
+        estimator.observe(params)
+        client = CommandClient(SimTransport(fleet), length_estimator=estimator)
+
+        raw = await client.get_raw_parameters(DeviceId(imei="356307042441013"), params)
+        assert raw == params
+        assert store.commands == ["getparam 2001;2002;2003", "getparam 2002"]
+
+    asyncio.run(run())
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+
+def test_import_doesnt_load_transport_clients():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys, teltek.cmd\n"
+                "print(*sorted({'aiomqtt', 'httpx', 'bs4'} & sys.modules.keys()))\n"
+                "teltek.cmd.transport.MqttTransport\n"
+                "print('aiomqtt' in sys.modules)"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.splitlines() == ["", "True"]
@@ -0,0 +1,212 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+from benchmarks.sample_config import RAW
+from teltek.cmd import CommandClient, DeviceId
+from teltek.cmd.transport import MqttTransport
+from teltek.codec import Codec12, Codec12Type, CodecException, CodecId, MessageFrame
+from teltek.sim import ParameterStore
+
+_IMEI = "356307042441013"
+
+
+@dataclasses.dataclass
+class _Topic:
+    value: str
+
+
+@dataclasses.dataclass
+class _Message:
+    topic: _Topic
+    payload: bytes
+
+
+class _FakeClient:
+    """Answers Codec 12 commands in order after a delay.
+
+    `delays` overrides the delay of single commands, responses still arrive in
+    the order the commands were sent.
+    """
+
+    def __init__(
+        self,
+        store: ParameterStore,
+        *,
+        delay: float = 0.005,
+        delays: dict[str, float] | None = None,
+    ) -> None:
+        self._store = store
+        self._delay = delay
+        self._delays = delays or {}
+        self._last_delivery = 0.0
+        self._messages: asyncio.Queue[_Message] = asyncio.Queue()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.published: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "_FakeClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def subscribe(self, topic: str) -> None:
+        pass
+
+    async def publish(self, topic: str, payload: bytes) -> None:
+        imei = topic.partition("/")[0]
+        command = Codec12.from_frame(MessageFrame.decode(payload)).content
+        self.published.append((imei, command))
+        if command == "drop":
+            return
+        if command == "garbage":
+            response = MessageFrame.build(CodecId.CODEC_12, b"\x01\x06")
+        else:
+            response = Codec12(
+                type=Codec12Type.RESPONSE, content=self._store.handle_command(command)
+            ).to_frame()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        loop = asyncio.get_running_loop()
+        delivery = loop.time() + self._delays.get(command, self._delay)
+        self._last_delivery = max(delivery, self._last_delivery)
+        loop.call_at(
+            self._last_delivery, self._deliver, f"{imei}/data", response.encode()
+        )
+
+    def _deliver(self, topic: str, payload: bytes) -> None:
+        self.in_flight -= 1
+        self._messages.put_nowait(_Message(_Topic(topic), payload))
+
+    @property
+    async def messages(self):
+        while True:
+            yield await self._messages.get()
+
+
+def test_pipelined_get_raw_parameters():
+    async def run() -> None:
+        fake = _FakeClient(ParameterStore(RAW))
+        async with MqttTransport(fake, pipeline_depth=4) as transport:  # type: ignore
+            client = CommandClient(transport)
+            raw = await client.get_raw_parameters(DeviceId(imei=_IMEI), list(RAW))
+        assert raw == RAW
+        assert fake.max_in_flight == 4
+
+    asyncio.run(run())
+
+
+def test_failure_only_affects_request():
+    async def run() -> None:
+        fake = _FakeClient(ParameterStore({1000: "300"}))
+        async with MqttTransport(fake, pipeline_depth=2) as transport:  # type: ignore
+            transport._RESP_TIMEOUT = 0.05
+            transport._LATE_RESP_TIMEOUT = 0.05
+            device_id = DeviceId(imei=_IMEI)
+
+            with pytest.raises(TimeoutError):
+                await transport.run_command(device_id, "drop")
+            # the response never arrives, the tombstone expires
+            await asyncio.sleep(0.06)
+
+            results = await asyncio.gather(
+                transport.run_command(device_id, "garbage"),
+                transport.run_command(device_id, "getparam 1000"),
+                return_exceptions=True,
+            )
+            assert isinstance(results[0], CodecException)
+            assert results[1] == "Param ID:1000 Value:300"
+            assert not transport._pending_requests
+
+    asyncio.run(run())
+
+
+def test_late_response_is_dropped():
+    async def run() -> None:
+        fake = _FakeClient(
+            ParameterStore({1000: "300", 1001: "30"}),
+            delays={"getparam 1000": 0.08},
+        )
+        async with MqttTransport(fake, pipeline_depth=2) as transport:  # type: ignore
+            transport._RESP_TIMEOUT = 0.05
+            device_id = DeviceId(imei=_IMEI)
+
+            with pytest.raises(TimeoutError):
+                await transport.run_command(device_id, "getparam 1000")
+            assert await transport.run_command(device_id, "getver") == (
+                "Ver:03.29.00 Rev:00 GPS:AXN_5.10 Hw:FMC130 Mod:68"
+            )
+            assert await transport.run_command(device_id, "getparam 1001") == (
+                "Param ID:1001 Value:30"
+            )
+            assert not transport._pending_requests
+
+    asyncio.run(run())
+
+
+def test_cancelled_command():
+    async def run() -> None:
+        fake = _FakeClient(ParameterStore({1000: "300"}))
+        async with MqttTransport(fake) as transport:  # type: ignore
+            device_id = DeviceId(imei=_IMEI)
+            task = asyncio.create_task(transport.run_command(device_id, "drop"))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            # the response arrives while the cancellation is in progress
+            response = Codec12(type=Codec12Type.RESPONSE, content="late")
+            fake._deliver(f"{_IMEI}/data", response.to_frame().encode())
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0.01)
+
+            assert transport._reader_task is not None
+            assert not transport._reader_task.done()
+            assert not transport._pending_requests
+            assert await transport.run_command(device_id, "getver") == (
+                "Ver:03.29.00 Rev:00 GPS:AXN_5.10 Hw:FMC130 Mod:68"
+            )
+
+    asyncio.run(run())
+
+
+def test_concurrent_callers_are_queued():
+    async def run() -> None:
+        fake = _FakeClient(ParameterStore({1000: "300"}))
+        async with MqttTransport(fake) as transport:  # type: ignore
+            device_id = DeviceId(imei=_IMEI)
+            results = await asyncio.gather(
+                *(transport.run_command(device_id, "getparam 1000") for _ in range(5))
+            )
+        assert results == ["Param ID:1000 Value:300"] * 5
+        assert fake.max_in_flight == 1
+        stats = transport.device_queue_stats[_IMEI]
+        assert stats.commands == 5
+        assert stats.waiting == 0
+        assert stats.max_waiting == 4
+        assert stats.max_wait >= 4 * 0.005
+
+    asyncio.run(run())
+
+
+def test_busy_device_doesnt_block_others():
+    async def run() -> None:
+        fake = _FakeClient(ParameterStore({1000: "300"}), delay=0.02)
+        other_imei = "356307042441014"
+        async with MqttTransport(fake, max_concurrent_commands=2) as transport:  # type: ignore
+            client = CommandClient(transport)
+            await asyncio.gather(
+                *(
+                    client.run_command(DeviceId(imei=_IMEI), "getparam 1000")
+                    for _ in range(3)
+                ),
+                client.run_command(DeviceId(imei=other_imei), "getver"),
+            )
+        # commands queued for the first device don't hold the global slots
+        assert fake.published[:2] == [
+            (_IMEI, "getparam 1000"),
+            (other_imei, "getver"),
+        ]
+
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+import asyncio
+
+from teltek.cmd import DeviceId
+from teltek.cmd.transport import TruphoneTransport
+
+_ICCID = "8944477100002778325"
+
+
+class _EchoTransport(TruphoneTransport):
+    """Answers every SMS with its content instead of talking to Truphone."""
+
+    def __init__(self) -> None:
+        super().__init__(email="user@example.com", password="secret")
+        self.sent: list[str] = []
+
+    async def _post_sms(
+        self, iccid: str, message: str, source_msisdn: str = "6260"
+    ) -> None:
+        self.sent.append(message)
+        (fut, _) = self._pending_requests[iccid]
+        asyncio.get_running_loop().call_later(0.005, fut.set_result, message.strip())
+
+
+def test_concurrent_callers_are_queued():
+    async def run() -> None:
+        transport = _EchoTransport()
+        device_id = DeviceId(iccid=_ICCID)
+        results = await asyncio.gather(
+            *(transport.run_command(device_id, f"cmd{i}") for i in range(3))
+        )
+        assert results == ["cmd0", "cmd1", "cmd2"]
+        stats = transport.device_queue_stats[_ICCID]
+        assert stats.commands == 3
+        assert stats.max_waiting == 2
+        assert stats.mean_wait > 0
+
+    asyncio.run(run())
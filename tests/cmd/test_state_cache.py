@@ -0,0 +1,99 @@
+import asyncio
+import copy
+
+from benchmarks.sample_config import DATA, RAW
+from teltek.cmd import (
+    CommandClient,
+    DeviceId,
+    DeviceStateCache,
+    MemoryStateCache,
+    SqliteStateCache,
+)
+from teltek.sim import Fleet, ParameterStore, SimTransport
+
+
+class _RecordingTransport(SimTransport):
+    def __init__(self, fleet: Fleet) -> None:
+        super().__init__(fleet, max_command_len=160)
+        self.commands: list[str] = []
+
+    async def run_command(self, device_id: DeviceId, command: str) -> str:
+        self.commands.append(command)
+        return await super().run_command(device_id, command)
+
+
+def test_memory_state_cache_lru():
+    cache = MemoryStateCache(max_devices=2)
+    (a, b, c) = (DeviceId(imei=imei) for imei in ("1", "2", "3"))
+    cache.update(a, {1000: "300"})
+    cache.update(b, {1000: "60"})
+    cache.update(a, {2001: "internet"})
+    cache.update(c, {1000: "30"})
+    assert len(cache) == 2
+    assert cache.get(a) == {1000: "300", 2001: "internet"}
+    assert cache.get(b) is None
+    cache.invalidate(a)
+    assert cache.get(a) is None
+
+
+def test_sqlite_state_cache(tmp_path):
+    device_id = DeviceId(iccid="8944477100002778325")
+    cache = SqliteStateCache(tmp_path / "state.db")
+    cache.update(device_id, {1000: "300", 2001: "internet"})
+    cache.update(device_id, {2001: "iot.example"})
+    cache.close()
+
+    cache = SqliteStateCache(tmp_path / "state.db")
+    assert cache.get(device_id) == {1000: "300", 2001: "iot.example"}
+    assert cache.get(DeviceId(imei="356307042441013")) is None
+    cache.invalidate(device_id)
+    assert cache.get(device_id) is None
+    cache.close()
+
+
+def _check_cache_keys(cache: DeviceStateCache) -> None:
+    imei = "356307042441013"
+    iccid = "8944477100002778325"
+    # devices without any ID don't share a state
+    cache.update(DeviceId(), {1000: "300"})
+    assert cache.get(DeviceId()) is None
+
+    cache.update(DeviceId(iccid=iccid), {1000: "300"})
+    cache.update(DeviceId(imei=imei, iccid=iccid), {1000: "60"})
+    assert cache.get(DeviceId(imei=imei)) == {1000: "60"}
+    # the state keyed by the ICCID may be stale now
+    assert cache.get(DeviceId(iccid=iccid)) is None
+    cache.invalidate(DeviceId(imei=imei, iccid=iccid))
+    assert cache.get(DeviceId(imei=imei)) is None
+
+
+def test_state_cache_keys(tmp_path):
+    _check_cache_keys(MemoryStateCache())
+    cache = SqliteStateCache(tmp_path / "state.db")
+    _check_cache_keys(cache)
+    cache.close()
+
+
+def test_set_full_parameters_sends_delta():
+    async def run() -> None:
+        fleet = Fleet.create(1, parameters=ParameterStore(RAW))
+        device_id = DeviceId(imei=next(iter(fleet)).imei)
+        transport = _RecordingTransport(fleet)
+        client = CommandClient(transport, state_cache=MemoryStateCache())
+
+        await client.get_raw_parameters(device_id, RAW)
+        transport.commands.clear()
+        await client.set_full_parameters(device_id, DATA)
+        assert transport.commands == []
+
+        values = copy.deepcopy(DATA)
+        values["gprs"]["apn"] = "iot.example"
+        await client.set_full_parameters(device_id, values)
+        assert transport.commands == ["setparam 2001:iot.example"]
+
+        # the cache now knows the new value
+        transport.commands.clear()
+        await client.set_full_parameters(device_id, values)
+        assert transport.commands == []
+
+    asyncio.run(run())
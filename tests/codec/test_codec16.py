@@ -0,0 +1,53 @@
+import pytest
+
+from teltek.codec import (
+    Codec8eGpsElement,
+    Codec16,
+    Codec16AvlData,
+    Codec16IoElement,
+    CodecException,
+    CodecId,
+    MessageFrame,
+    decode_avl_frame,
+)
+
+_ZERO_GPS = Codec8eGpsElement(
+    longitude=0, latitude=0, altitude=0, angle=0, satellites=0, speed=0
+)
+
+
+def test_decode():
+    raw = bytes.fromhex(
+        "000000000000005F10020000016BDBC7833000000000000000000000000000000000000B05040200010000030002000B00270042563A00000000016BDBC7871800000000000000000000000000000000000B05040200010000030002000B00260042563A00000200005FB3"
+    )
+    expected = Codec16(
+        avl_data=[
+            Codec16AvlData(
+                timestamp=timestamp,
+                priority=0,
+                gps=_ZERO_GPS,
+                io=Codec16IoElement(
+                    event_io_id=0x0B,
+                    generation_type=5,
+                    n1={0x01: 0, 0x03: 0},
+                    n2={0x0B: odometer, 0x42: 0x563A},
+                    n4={},
+                    n8={},
+                ),
+            )
+            for timestamp, odometer in ((1562760414000, 0x27), (1562760415000, 0x26))
+        ]
+    )
+    frame = MessageFrame.decode(raw)
+    assert frame.codec_id == CodecId.CODEC_16
+    inner = Codec16.from_frame(frame)
+    assert inner == expected
+    assert decode_avl_frame(frame) == expected
+    # ensure roundtrip
+    assert inner.to_frame().encode() == raw
+
+
+def test_dispatch_rejects_non_avl():
+    frame = MessageFrame.build(CodecId.CODEC_12, b"\x01\x05\x00\x00\x00\x00\x01")
+    with pytest.raises(CodecException):
+        decode_avl_frame(frame)
@@ -0,0 +1,42 @@
+from teltek.codec import (
+    Codec8,
+    Codec8AvlData,
+    Codec8eGpsElement,
+    Codec8IoElement,
+    CodecId,
+    MessageFrame,
+    decode_avl_frame,
+)
+
+_ZERO_GPS = Codec8eGpsElement(
+    longitude=0, latitude=0, altitude=0, angle=0, satellites=0, speed=0
+)
+
+
+def test_decode():
+    raw = bytes.fromhex(
+        "000000000000003608010000016B40D8EA30010000000000000000000000000000000105021503010101425E0F01F10000601A014E0000000000000000010000C7CF"
+    )
+    expected = Codec8(
+        avl_data=[
+            Codec8AvlData(
+                timestamp=1560161086000,
+                priority=1,
+                gps=_ZERO_GPS,
+                io=Codec8IoElement(
+                    event_io_id=1,
+                    n1={0x15: 3, 0x01: 1},
+                    n2={0x42: 0x5E0F},
+                    n4={0xF1: 0x601A},
+                    n8={0x4E: 0},
+                ),
+            )
+        ]
+    )
+    frame = MessageFrame.decode(raw)
+    assert frame.codec_id == CodecId.CODEC_8
+    inner = Codec8.from_frame(frame)
+    assert inner == expected
+    assert decode_avl_frame(frame) == expected
+    # ensure roundtrip
+    assert inner.to_frame().encode() == raw
@@ -1,12 +1,17 @@
+import base64
+import dataclasses
+
+import pytest
+
 from teltek.codec import (
     Codec8e,
-    CodecId,
-    MessageFrame,
     Codec8eAvlData,
     Codec8eGpsElement,
     Codec8eIoElement,
+    CodecException,
+    CodecId,
+    MessageFrame,
 )
-import base64
 
 
 def test_decode_real():
@@ -111,6 +116,46 @@ def test_decode():
     assert _decode_frame(raw) == expected
 
 
+def test_roundtrip_full_batch():
+    codec = Codec8e(
+        avl_data=[
+            Codec8eAvlData(
+                timestamp=1740492332000 + i,
+                priority=i % 3,
+                gps=Codec8eGpsElement(
+                    longitude=77031566,
+                    latitude=472914500,
+                    altitude=489,
+                    angle=i,
+                    satellites=18,
+                    speed=i,
+                ),
+                io=Codec8eIoElement(
+                    event_io_id=i,
+                    n1={1: i % 256},
+                    n2={17: i},
+                    n4={},
+                    n8={11: i << 40},
+                    nx={385: bytes(range(i % 16))},
+                ),
+            )
+            for i in range(255)
+        ]
+    )
+    frame = codec.to_frame()
+    assert _decode_frame(frame.encode()) == codec
+
+
+def test_decode_truncated():
+    raw = bytes.fromhex(
+        "000000000000004A8E010000016B412CEE000100000000000000000000000000000000010005000100010100010011001D00010010015E2C880002000B000000003544C87A000E000000001DD7E06A00000100002994"
+    )
+    body = MessageFrame.decode(raw).data
+    # drop the last n8 value but keep the trailing record count
+    with pytest.raises(CodecException):
+        Codec8e.decode(body[:-12] + body[-1:])
+
+
 def _decode_frame(data: bytes) -> Codec8e:
     frame = MessageFrame.decode(data)
     assert frame.codec_id == CodecId.CODEC_8E
@@ -118,3 +163,50 @@ def _decode_frame(data: bytes) -> Codec8e:
     # ensure roundtrip
     assert inner.encode() == frame.data
     return inner
+
+
+def test_gps_signed_coordinates():
+    # 74.0060° W, 40.7128° S
+    raw = bytes.fromhex("D3E394A0E7BBB840002A00B40C0032")
+    gps = Codec8eGpsElement.decode(raw)
+    assert gps == Codec8eGpsElement(
+        longitude=-740060000,
+        latitude=-407128000,
+        altitude=42,
+        angle=180,
+        satellites=12,
+        speed=50,
+    )
+    assert gps.encode() == raw
+
+
+def test_decode_lazy():
+    raw = bytes.fromhex(
+        "000000000000004A8E010000016B412CEE000100000000000000000000000000000000010005000100010100010011001D00010010015E2C880002000B000000003544C87A000E000000001DD7E06A00000100002994"
+    )
+    body = MessageFrame.decode(raw).data
+    (lazy,) = Codec8e.decode_lazy(body)
+    assert lazy.timestamp == 1560166592000
+    assert lazy.priority == 1
+    assert lazy.n8 == {11: 0x3544C87A, 14: 0x1DD7E06A}
+    (eager,) = Codec8e.decode(body).avl_data
+    assert lazy.to_avl_data() == eager
+
+    with pytest.raises(CodecException):
+        Codec8e.decode_lazy(body[:-12] + body[-1:])
+
+
+def test_encode_frame_into():
+    raw = bytes.fromhex(
+        "000000000000004A8E010000016B412CEE000100000000000000000000000000000000010005000100010100010011001D00010010015E2C880002000B000000003544C87A000E000000001DD7E06A00000100002994"
+    )
+    (avl,) = Codec8e.from_frame(MessageFrame.decode(raw)).avl_data
+    io = dataclasses.replace(avl.io, nx={385: b"\x01\x02\x03"})
+    codec = Codec8e(avl_data=[dataclasses.replace(avl, io=io)])
+    expected = codec.to_frame().encode()
+
+    assert codec.frame_len() == len(expected)
+    buf = bytearray(3 + 2 * codec.frame_len())
+    offset = codec.encode_frame_into(buf, 3)
+    assert codec.encode_frame_into(memoryview(buf), offset) == len(buf)
+    assert buf == b"\0\0\0" + expected + expected
@@ -0,0 +1,95 @@
+import pytest
+
+from teltek.codec import (
+    Codec8e,
+    Codec8eAvlData,
+    Codec8eColumns,
+    Codec8eGpsElement,
+    Codec8eIoElement,
+    CodecException,
+)
+
+
+def _codec() -> Codec8e:
+    return Codec8e(
+        avl_data=[
+            Codec8eAvlData(
+                timestamp=1740492332000 + i,
+                priority=i % 2,
+                gps=Codec8eGpsElement(
+                    longitude=-77031566 + i,
+                    latitude=472914500,
+                    altitude=489,
+                    angle=309,
+                    satellites=18,
+                    speed=i,
+                ),
+                io=Codec8eIoElement(
+                    event_io_id=449,
+                    n1={1: i % 2},
+                    n2={},
+                    n4={449: 3305536 + i},
+                    n8={},
+                    nx={385: b"\x01\x02"} if i == 1 else {},
+                ),
+            )
+            for i in range(3)
+        ]
+    )
+
+
+def test_decode_matches_records():
+    codec = _codec()
+    columns = Codec8eColumns.decode(codec.encode())
+    assert len(columns) == 3
+    assert list(columns.timestamp) == [avl.timestamp for avl in codec.avl_data]
+    assert list(columns.longitude) == [avl.gps.longitude for avl in codec.avl_data]
+    assert list(columns.speed) == [0, 1, 2]
+    assert list(columns.io_record) == [0, 0, 1, 1, 2, 2]
+    assert list(columns.io_id) == [1, 449] * 3
+    assert list(columns.io_value) == [0, 3305536, 1, 3305537, 0, 3305538]
+    assert list(columns.nx_record) == [1]
+    assert columns.nx_value == [b"\x01\x02"]
+
+
+def test_from_frames_offsets_records():
+    frame = _codec().to_frame()
+    columns = Codec8eColumns.from_frames([frame, frame])
+    assert len(columns) == 6
+    assert list(columns.nx_record) == [1, 4]
+    assert columns.io_record[-1] == 5
+
+
+def test_invalid_body_leaves_columns_untouched():
+    body = _codec().encode()
+    columns = Codec8eColumns.decode(body)
+    with pytest.raises(CodecException):
+        columns.extend(body[:-3] + body[-1:])
+    assert len(columns) == 3
+    assert len(columns.io_record) == 6
+
+
+def test_exported_column_leaves_columns_untouched():
+    body = _codec().encode()
+    columns = Codec8eColumns.decode(body)
+    # what a NumPy view from columns() holds, on a column after the first ones
+    view = memoryview(columns.io_value)
+    with pytest.raises(BufferError):
+        columns.extend(body)
+    assert {len(getattr(columns, name)) for name in ("timestamp", "speed")} == {3}
+    assert len(columns.io_record) == len(columns.io_id) == 6
+    view.release()
+    columns.extend(body)
+    assert len(columns) == 6
+
+
+def test_columns_without_numpy():
+    columns = Codec8eColumns.decode(_codec().encode()).columns(numpy=False)
+    assert list(columns["altitude"]) == [489] * 3
+
+
+def test_columns_numpy():
+    np = pytest.importorskip("numpy")
+    columns = Codec8eColumns.decode(_codec().encode()).columns(numpy=True)
+    assert columns["latitude"].dtype == np.int32
+    assert columns["timestamp"][0] == 1740492332000
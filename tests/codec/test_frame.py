@@ -0,0 +1,36 @@
+import os
+
+from teltek.codec import CodecId, MessageFrame
+from teltek.codec._frame import _crc16_ibm
+
+
+def _crc16_ibm_bitwise(data: bytes) -> int:
+    crc = 0
+    for b in data:
+        crc = crc ^ b
+        for _ in range(8):
+            carry = crc & 1
+            crc = crc >> 1
+            if carry:
+                crc = crc ^ 0xA001
+    return crc
+
+
+def test_crc16_matches_bitwise():
+    for size in (0, 1, 7, 256, 1024):
+        data = os.urandom(size)
+        assert _crc16_ibm(data) == _crc16_ibm_bitwise(data)
+
+
+def test_crc16_incremental():
+    data = os.urandom(4096)
+    crc = 0
+    view = memoryview(data)
+    for start in range(0, len(data), 1000):
+        crc = _crc16_ibm(view[start : start + 1000], crc)
+    assert crc == _crc16_ibm(data)
+
+
+def test_build_roundtrip():
+    frame = MessageFrame.build(CodecId.CODEC_12, b"\x01\x05\x00\x00\x00\x00\x01")
+    assert MessageFrame.decode(frame.encode()) == frame
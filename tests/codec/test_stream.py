@@ -0,0 +1,74 @@
+import pytest
+
+from teltek.codec import (
+    Codec12,
+    Codec12Type,
+    CodecException,
+    FrameDecoder,
+    MessageFrame,
+)
+
+
+def _frames(*commands: str) -> list[bytes]:
+    return [
+        Codec12(type=Codec12Type.REQUEST, content=command).to_frame().encode()
+        for command in commands
+    ]
+
+
+def test_byte_by_byte():
+    raw = _frames("getinfo", "getver")
+    stream = b"".join(raw)
+    decoder = FrameDecoder()
+    decoded: list[Codec12] = []
+    for b in stream:
+        decoder.feed(bytes([b]))
+        decoded.extend(Codec12.from_frame(frame) for frame in decoder)
+    assert [codec.content for codec in decoded] == ["getinfo", "getver"]
+    assert decoder.bytes_consumed == len(stream)
+    assert decoder.pending == 0
+
+
+def test_multiple_frames_in_chunk():
+    raw = _frames("a", "bb", "ccc")
+    stream = b"".join(raw)
+    decoder = FrameDecoder()
+    # split the last frame in two
+    decoder.feed(stream[:-3])
+    frames = list(decoder)
+    assert len(frames) == 2
+    assert decoder.bytes_consumed == len(raw[0]) + len(raw[1])
+    assert decoder.pending == len(raw[2]) - 3
+    decoder.feed(stream[-3:])
+    (frame,) = list(decoder)
+    assert Codec12.from_frame(frame).content == "ccc"
+
+
+def test_bad_crc():
+    (raw,) = _frames("getinfo")
+    corrupted = raw[:-1] + bytes([raw[-1] ^ 0xFF])
+    decoder = FrameDecoder()
+    decoder.feed(corrupted)
+    with pytest.raises(CodecException):
+        next(iter(decoder))
+    assert decoder.pending == 0
+    # the decoder is usable again after an error
+    decoder.feed(raw)
+    assert len(list(decoder)) == 1
+
+
+def test_max_data_size():
+    (raw,) = _frames("x" * 100)
+    decoder = FrameDecoder(max_data_size=50)
+    decoder.feed(raw[:8])
+    with pytest.raises(CodecException):
+        decoder.next_frame()
+
+
+def test_unknown_codec_id():
+    # valid crc over an unknown codec id
+    raw = MessageFrame.build(0x7F, b"\x01").encode()  # type: ignore[arg-type]
+    decoder = FrameDecoder()
+    decoder.feed(raw)
+    with pytest.raises(CodecException, match="0x7f"):
+        decoder.next_frame()
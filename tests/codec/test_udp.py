@@ -0,0 +1,49 @@
+import pytest
+
+from teltek.codec import (
+    Codec8,
+    CodecException,
+    CodecId,
+    UdpAvlAck,
+    UdpAvlPacket,
+    decode_avl,
+)
+
+_RAW = bytes.fromhex(
+    "003DCAFE0105000F33353230393330383634303336353508010000016B4F815B30010000000000000000000000000000000103021503010101425DBC000001"
+)
+
+
+def test_decode():
+    packet = UdpAvlPacket.decode(_RAW)
+    assert packet.packet_id == 0xCAFE
+    assert packet.avl_packet_id == 0x05
+    assert packet.imei == "352093086403655"
+    assert packet.codec_id == CodecId.CODEC_8
+    codec = decode_avl(packet.codec_id, packet.data)
+    assert isinstance(codec, Codec8)
+    assert codec.avl_data[0].timestamp == 1560407006000
+    assert codec.avl_data[0].io.n2 == {0x42: 0x5DBC}
+    # ensure roundtrip
+    assert packet.encode() == _RAW
+
+
+def test_ack():
+    ack = UdpAvlPacket.decode(_RAW).ack(1)
+    assert ack.encode() == bytes.fromhex("0005CAFE010501")
+    assert UdpAvlAck.decode(ack.encode()) == ack
+
+
+def test_decode_non_ascii_imei():
+    raw = bytearray(_RAW)
+    raw[8] = 0xFF
+    with pytest.raises(CodecException):
+        UdpAvlPacket.decode(bytes(raw))
+
+
+def test_decode_unknown_codec_id():
+    raw = bytearray(_RAW)
+    # right after the 15 digit imei
+    raw[23] = 0x7F
+    with pytest.raises(CodecException, match="0x7f"):
+        UdpAvlPacket.decode(bytes(raw))
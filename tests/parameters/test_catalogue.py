@@ -0,0 +1,51 @@
+import io
+from pathlib import Path
+
+import pytest
+
+import teltek.parameters
+from teltek.parameters import ParameterCatalogue
+
+
+def test_round_trip(tmp_path: Path):
+    catalogue = ParameterCatalogue.from_db(model="FMC130", firmware="03.28.07")
+    path = tmp_path / ParameterCatalogue.file_name("FMC130", "03.28.07")
+    catalogue.write(path)
+
+    loaded = ParameterCatalogue.read(path)
+    assert (loaded.model, loaded.firmware) == ("FMC130", "03.28.07")
+    assert loaded.group_keys == [group.key for group in teltek.parameters.db.ALL_GROUPS]
+    assert list(loaded.iter_parameter_ids()) == list(
+        teltek.parameters.db.iter_parameter_ids()
+    )
+    assert list(loaded.iter_parameters()) == list(
+        teltek.parameters.db.iter_parameters()
+    )
+    assert loaded.groups == teltek.parameters.db.ALL_GROUPS
+
+    buf = io.BytesIO()
+    loaded.write(buf)
+    assert buf.getvalue() == path.read_bytes()
+
+
+def test_groups_built_on_access():
+    buf = io.BytesIO()
+    ParameterCatalogue.from_db().write(buf)
+    buf.seek(0)
+    catalogue = ParameterCatalogue.read(buf)
+
+    # IDs are read without building the groups
+    assert 2001 in set(catalogue.iter_parameter_ids())
+    assert not catalogue._groups
+
+    gprs = catalogue.group("gprs")
+    assert gprs == teltek.parameters.db.GPRS
+    assert catalogue.group("gprs") is gprs
+    assert list(catalogue._groups) == ["gprs"]
+    with pytest.raises(KeyError):
+        catalogue.group("nope")
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported catalogue format: 2"):
+        ParameterCatalogue.read(io.BytesIO(b'{"format":2}'))
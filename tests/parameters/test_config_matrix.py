@@ -0,0 +1,82 @@
+from teltek.parameters import Config, ConfigMatrix
+
+_RAWS = {
+    "dev1": {1000: "60", 2001: "iot.a", 2004: "dev1.example.com"},
+    "dev2": {1000: "60", 2001: "iot.b", 2004: "dev2.example.com"},
+    # another firmware, other ID order and an ID unknown to the catalogue
+    "dev3": {2001: "iot.a", 1000: "30", 999999: "x"},
+    "dev4": {1000: "60", 2001: "iot.a", 2004: "dev4.example.com"},
+}
+
+
+def test_table():
+    matrix = ConfigMatrix.from_raw_parameters(_RAWS)
+    assert len(matrix) == 4
+    # devices with the same layout are kept together
+    assert matrix.devices == ["dev1", "dev2", "dev4", "dev3"]
+    assert matrix.param_ids == [1000, 2001, 2004, 999999]
+    assert matrix.get("dev3", 2004) is None
+    assert matrix.get("dev3", 999999) == "x"
+    assert matrix.get("dev1", 1) is None
+    assert matrix.column(2004) == [
+        "dev1.example.com",
+        "dev2.example.com",
+        "dev4.example.com",
+        None,
+    ]
+    for device, raw in _RAWS.items():
+        assert matrix.row(device) == dict(sorted(raw.items()))
+
+
+def test_queries():
+    matrix = ConfigMatrix.from_raw_parameters(_RAWS)
+    assert matrix.value_counts(2001) == {"iot.a": 3, "iot.b": 1}
+    assert matrix.value_counts(999999) == {None: 3, "x": 1}
+    assert matrix.group_by_value(1000) == {
+        "60": ["dev1", "dev2", "dev4"],
+        "30": ["dev3"],
+    }
+
+    golden = {1000: "60", 2001: "iot.a", 2005: "5"}
+    assert matrix.diff(golden) == {
+        "dev1": [2005],
+        "dev2": [2001, 2005],
+        "dev4": [2005],
+        "dev3": [1000, 2005],
+    }
+    assert matrix.diff(matrix.row("dev1")) == {
+        "dev2": [2001, 2004],
+        "dev4": [2004],
+        "dev3": [1000, 2004],
+    }
+
+    # values of a single device out of four, 2004 is different everywhere
+    assert matrix.outliers(max_share=0.25) == {
+        "dev2": [2001],
+        "dev3": [1000, 999999],
+    }
+    assert matrix.outliers(max_share=0.25, param_ids=[2001]) == {"dev2": [2001]}
+
+
+def test_many_values():
+    raws = {f"dev{i}": {1000: str(i)} for i in range(300)}
+    raws |= {f"other{i}": {2001: "a", 1000: str(i)} for i in range(300, 600)}
+    matrix = ConfigMatrix.from_raw_parameters(raws)
+    assert matrix.column(1000) == [str(i) for i in range(600)]
+    assert matrix.column(2001) == [None] * 300 + ["a"] * 300
+
+
+def test_from_configs():
+    configs = {
+        device: Config(
+            configuration_version="1",
+            hw_version="FMC130",
+            title="",
+            fm_type="FMC130",
+            spec_id=1,
+            raw_parameters=raw,
+        )
+        for device, raw in _RAWS.items()
+    }
+    matrix = ConfigMatrix.from_configs(configs)
+    assert matrix.row("dev2") == _RAWS["dev2"]
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def _imported_modules(stderr: str) -> set[str]:
+    # import time: self [us] | cumulative | imported package
+    return {
+        line.rpartition("|")[2].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_import_doesnt_load_db():
+    result = _run("import teltek.cmd, teltek.codec, teltek.parameters")
+    modules = _imported_modules(result.stderr)
+    assert "teltek.parameters._db" in modules
+    assert not [name for name in modules if name.startswith("teltek.parameters._db.")]
+
+
+def test_group_loaded_on_access():
+    result = _run(
+        "import sys, teltek.parameters\n"
+        "teltek.parameters.db.IO\n"
+        "print(*sorted(m for m in sys.modules if 'parameters._db.' in m))"
+    )
+    assert result.stdout.split() == ["teltek.parameters._db._io"]
+
+    result = _run(
+        "import sys, teltek.parameters\n"
+        "len(teltek.parameters.db.ALL_GROUPS)\n"
+        "print(sum('parameters._db.' in m for m in sys.modules))"
+    )
+    assert int(result.stdout) > 1
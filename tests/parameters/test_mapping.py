@@ -1,4 +1,5 @@
 import teltek.parameters
+from benchmarks.sample_config import DATA, RAW
 
 
 def test_bitflag():
@@ -11,2058 +12,11 @@ def test_bitflag():
     assert movement_source.convert_to_raw("IGNITION|MOVEMENT") == "3"
 
 
-_RAW = {
-    11500: "2",
-    11501: "1",
-    11502: "0",
-    7036: "0",
-    8036: "Unplug",
-    11600: "1",
-    11601: "1",
-    11602: "5",
-    11603: "10",
-    11604: "0",
-    11605: "0.220000",
-    11606: "1.000000",
-    11607: "998",
-    7035: "0",
-    8035: "Towing",
-    11400: "2",
-    11401: "5",
-    11402: "1500",
-    11406: "2",
-    7037: "0",
-    8037: "Crash",
-    11200: "0",
-    11203: "1",
-    11205: "60",
-    11206: "5",
-    11204: "0",
-    11201: "200",
-    11202: "200",
-    7033: "0",
-    8033: "Idling Event",
-    7585: "0",
-    8585: "LVC Distance Need To Service",
-    10000: "10",
-    10004: "10",
-    10005: "10",
-    10050: "1",
-    10051: "0",
-    10052: "0",
-    10053: "0",
-    10054: "10",
-    10055: "10",
-    10100: "3600",
-    10104: "1",
-    10105: "120",
-    10150: "300",
-    10151: "100",
-    10152: "10",
-    10153: "10",
-    10154: "1",
-    10155: "120",
-    10200: "10",
-    10204: "10",
-    10205: "10",
-    10250: "1",
-    10251: "100",
-    10252: "30",
-    10253: "5",
-    10254: "10",
-    10255: "1",
-    11000: "1",
-    11004: "0.500000",
-    11005: "0.500000",
-    11006: "3.400000",
-    11007: "1",
-    11008: "1",
-    11003: "0",
-    11001: "200",
-    11002: "200",
-    7034: "0",
-    8034: "Green Driving",
-    11100: "0",
-    11104: "90",
-    11103: "0",
-    11101: "200",
-    11102: "200",
-    7032: "0",
-    8032: "Overspeeding",
-    11300: "2",
-    11303: "1",
-    11304: "0",
-    11301: "200",
-    11302: "200",
-    11305: "60",
-    1000: "259200",
-    1001: "30",
-    1002: "0",
-    2000: "1",
-    2001: "internet",
-    2002: "",
-    2003: "",
-    2004: "a27fww76cm8ynq-ats.iot.eu-central-1.amazonaws.com",
-    2005: "8883",
-    2006: "3",
-    2010: "0",
-    2007: "",
-    2008: "0",
-    2009: "0",
-    13003: "1",
-    13000: "fm.teltonika.lt",
-    13001: "5000",
-    13002: "30",
-    5000: "0",
-    5001: "0",
-    5002: "0",
-    5003: "0",
-    5004: "0",
-    5005: "0",
-    5006: "0",
-    5007: "0",
-    5008: "0",
-    5009: "0",
-    5010: "0",
-    5011: "0",
-    5012: "0",
-    5013: "0",
-    5014: "0",
-    5015: "0",
-    5016: "0",
-    5017: "0",
-    5018: "0",
-    5019: "0",
-    5020: "0",
-    5021: "0",
-    5022: "0",
-    5023: "0",
-    5024: "0",
-    5025: "0",
-    5026: "0",
-    5027: "0",
-    5028: "0",
-    5029: "0",
-    5030: "0",
-    5031: "0",
-    5032: "0",
-    5033: "0",
-    5034: "0",
-    5035: "0",
-    5036: "0",
-    5037: "0",
-    5038: "0",
-    5039: "0",
-    5040: "0",
-    5041: "0",
-    5042: "0",
-    5043: "0",
-    5044: "0",
-    5045: "0",
-    5046: "0",
-    5047: "0",
-    5048: "0",
-    5049: "0",
-    5500: "0",
-    5501: "0",
-    5502: "0",
-    5503: "0",
-    5504: "0",
-    5505: "0",
-    5506: "0",
-    5507: "0",
-    5508: "0",
-    5509: "0",
-    5510: "0",
-    5511: "0",
-    5512: "0",
-    5513: "0",
-    5514: "0",
-    5515: "0",
-    5516: "0",
-    5517: "0",
-    5518: "0",
-    5519: "0",
-    5520: "0",
-    5521: "0",
-    5522: "0",
-    5523: "0",
-    5524: "0",
-    5525: "0",
-    5526: "0",
-    5527: "0",
-    5528: "0",
-    5529: "0",
-    5530: "0",
-    5531: "0",
-    5532: "0",
-    5533: "0",
-    5534: "0",
-    5535: "0",
-    5536: "0",
-    5537: "0",
-    5538: "0",
-    5539: "0",
-    5540: "0",
-    5541: "0",
-    5542: "0",
-    5543: "0",
-    5544: "0",
-    5545: "0",
-    5546: "0",
-    5547: "0",
-    5548: "0",
-    5549: "0",
-    50000: "2",
-    50001: "3",
-    50002: "0",
-    50003: "0",
-    50004: "0",
-    50005: "10",
-    7000: "0",
-    8000: "Ignition",
-    50010: "2",
-    50011: "3",
-    50012: "0",
-    50013: "0",
-    50014: "0",
-    50015: "10",
-    7001: "0",
-    8001: "Movement",
-    50020: "2",
-    50021: "3",
-    50022: "0",
-    50023: "0",
-    50024: "0",
-    7002: "0",
-    8002: "Data Mode",
-    50030: "2",
-    50031: "3",
-    50032: "0",
-    50033: "0",
-    50034: "0",
-    50035: "1",
-    7003: "0",
-    8003: "GSM Signal",
-    50040: "1",
-    50041: "5",
-    50042: "0",
-    50043: "0",
-    50044: "0",
-    7004: "0",
-    8004: "Sleep Mode",
-    50050: "2",
-    50051: "3",
-    50052: "0",
-    50053: "0",
-    7005: "0",
-    8005: "GNSS Power",
-    50060: "2",
-    5061: "0",
-    5062: "0",
-    5063: "0",
-    5064: "0",
-    5065: "0",
-    7006: "0",
-    8006: "GNSS PDOP",
-    50070: "2",
-    50071: "3",
-    50072: "0",
-    50073: "0",
-    50074: "0",
-    50075: "10",
-    7007: "0",
-    8007: "GNSS HDOP",
-    50080: "2",
-    50081: "3",
-    50082: "0",
-    50083: "0",
-    50084: "0",
-    50085: "10",
-    7008: "0",
-    8008: "External Voltage",
-    50090: "2",
-    50091: "3",
-    50092: "0",
-    50093: "0",
-    50094: "0",
-    50095: "1",
-    7009: "0",
-    8009: "Speed",
-    50100: "0",
-    50101: "3",
-    50102: "0",
-    50103: "0",
-    50104: "0",
-    7010: "0",
-    8010: "GSM Cell ID",
-    50110: "2",
-    50111: "3",
-    50112: "0",
-    50113: "0",
-    50114: "0",
-    7011: "0",
-    8011: "GSM Area Code",
-    50120: "1",
-    50121: "3",
-    50122: "0",
-    50123: "0",
-    50124: "0",
-    50125: "10",
-    7012: "0",
-    8012: "Battery Voltage",
-    50130: "2",
-    50131: "3",
-    50132: "0",
-    50133: "0",
-    50134: "0",
-    50135: "10",
-    7013: "0",
-    8013: "Battery Current",
-    50140: "1",
-    50141: "5",
-    50142: "0",
-    50143: "0",
-    50144: "0",
-    7014: "0",
-    8014: "Active GSM Operator",
-    50150: "2",
-    50151: "3",
-    50152: "0",
-    50153: "0",
-    50154: "0",
-    7015: "0",
-    8015: "Trip Odometer",
-    50160: "1",
-    50161: "5",
-    50162: "0",
-    50163: "0",
-    50164: "0",
-    7016: "0",
-    8016: "Total Odometer",
-    50200: "0",
-    50201: "3",
-    50202: "0",
-    50203: "0",
-    50204: "0",
-    50205: "1",
-    7020: "0",
-    8020: "FC By GPS",
-    50210: "0",
-    50211: "3",
-    50212: "0",
-    50213: "0",
-    50214: "0",
-    50215: "1",
-    7021: "0",
-    8021: "FC AVG By GPS",
-    50220: "1",
-    50221: "6",
-    50222: "10",
-    50223: "0",
-    50224: "0",
-    50225: "1",
-    7022: "0",
-    8022: "Axis X",
-    50230: "1",
-    50231: "6",
-    50232: "10",
-    50233: "0",
-    50234: "0",
-    50235: "1",
-    7023: "0",
-    8023: "Axis Y",
-    50240: "1",
-    50241: "6",
-    50242: "10",
-    50243: "0",
-    50244: "0",
-    50245: "1",
-    7024: "0",
-    8024: "Axis Z",
-    50250: "1",
-    50251: "5",
-    50254: "0",
-    7069: "0",
-    8069: "ICCID",
-    50510: "0",
-    50511: "3",
-    50512: "0",
-    50513: "0",
-    50514: "0",
-    7220: "0",
-    8220: "EcoScore",
-    50690: "2",
-    50691: "3",
-    50692: "0",
-    50693: "0",
-    50694: "0",
-    7243: "0",
-    8243: "Battery Level %",
-    50720: "0",
-    50721: "3",
-    50722: "0",
-    50723: "0",
-    50724: "0",
-    7250: "0",
-    8250: "BT Status",
-    40100: "1",
-    40103: "0",
-    40102: "0",
-    40104: "0",
-    40101: "5",
-    7038: "0",
-    8038: "Number of DTC",
-    40110: "0",
-    40113: "0",
-    40112: "0",
-    40114: "0",
-    40111: "3",
-    7039: "0",
-    8039: "Calculated engine load value",
-    40120: "1",
-    40123: "0",
-    40122: "5",
-    40124: "0",
-    40121: "6",
-    7040: "0",
-    8040: "Engine coolant temperature",
-    40130: "0",
-    40133: "0",
-    40132: "0",
-    40134: "0",
-    40131: "3",
-    7041: "0",
-    8041: "Short term fuel trim 1",
-    40140: "0",
-    40143: "0",
-    40142: "0",
-    40144: "0",
-    40141: "3",
-    7042: "0",
-    8042: "Fuel pressure",
-    40150: "0",
-    40153: "0",
-    40152: "0",
-    40154: "0",
-    40151: "3",
-    7043: "0",
-    8043: "Intake MAP",
-    40160: "2",
-    40163: "0",
-    40162: "0",
-    40164: "0",
-    40161: "3",
-    7044: "0",
-    8044: "Engine RPM",
-    40170: "2",
-    40173: "0",
-    40172: "0",
-    40174: "0",
-    40171: "3",
-    7045: "0",
-    8045: "Vehicle speed",
-    40180: "0",
-    40183: "0",
-    40182: "0",
-    40184: "0",
-    40181: "3",
-    7046: "0",
-    8046: "Timing advance",
-    40190: "0",
-    40193: "0",
-    40192: "0",
-    40194: "0",
-    40191: "3",
-    7047: "0",
-    8047: "Intake air temperature",
-    40200: "2",
-    40203: "0",
-    40202: "0",
-    40204: "0",
-    40201: "3",
-    7048: "0",
-    8048: "MAF rate",
-    40210: "2",
-    40213: "0",
-    40212: "0",
-    40214: "0",
-    40211: "3",
-    7049: "0",
-    8049: "Throttle position",
-    40220: "0",
-    40223: "0",
-    40222: "0",
-    40224: "0",
-    40221: "3",
-    7050: "0",
-    8050: "Run time since engine start",
-    40230: "0",
-    40233: "0",
-    40232: "0",
-    40234: "0",
-    40231: "3",
-    7051: "0",
-    8051: "Distance traveled MIL on",
-    40240: "0",
-    40243: "0",
-    40242: "0",
-    40244: "0",
-    40241: "3",
-    7052: "0",
-    8052: "Relative fuel rail pressure",
-    40250: "0",
-    40253: "0",
-    40252: "0",
-    40254: "0",
-    40251: "3",
-    7053: "0",
-    8053: "Direct fuel rail pressure",
-    40260: "0",
-    40263: "0",
-    40262: "0",
-    40264: "0",
-    40261: "3",
-    7054: "0",
-    8054: "Commanded EGR",
-    40270: "0",
-    40273: "0",
-    40272: "0",
-    40274: "0",
-    40271: "3",
-    7055: "0",
-    8055: "EGR error",
-    40280: "2",
-    40283: "0",
-    40282: "0",
-    40284: "0",
-    40281: "3",
-    7056: "0",
-    8056: "Fuel level",
-    40290: "0",
-    40293: "0",
-    40292: "0",
-    40294: "0",
-    40291: "3",
-    7057: "0",
-    8057: "Distance traveled since codes clear",
-    40300: "0",
-    40303: "0",
-    40302: "0",
-    40304: "0",
-    40301: "3",
-    7058: "0",
-    8058: "Barometric pressure",
-    40310: "2",
-    40313: "0",
-    40312: "0",
-    40314: "0",
-    40311: "3",
-    7059: "0",
-    8059: "Control module voltage",
-    40320: "2",
-    40323: "0",
-    40322: "0",
-    40324: "0",
-    40321: "3",
-    7060: "0",
-    8060: "Absolute load value",
-    40330: "2",
-    40333: "0",
-    40332: "0",
-    40334: "0",
-    40331: "3",
-    7061: "0",
-    8061: "Ambient air temperature",
-    40340: "0",
-    40343: "0",
-    40342: "0",
-    40344: "0",
-    40341: "3",
-    7062: "0",
-    8062: "Time run with MIL on",
-    40350: "0",
-    40353: "0",
-    40352: "0",
-    40354: "0",
-    40351: "3",
-    7063: "0",
-    8063: "Time since trouble codes cleared",
-    40560: "1",
-    40563: "0",
-    40562: "0",
-    40564: "0",
-    40561: "5",
-    7633: "0",
-    8633: "Fuel Type",
-    40360: "0",
-    40363: "0",
-    40362: "0",
-    40364: "0",
-    40361: "3",
-    7064: "0",
-    8064: "Absolute fuel rail pressure",
-    40370: "2",
-    40373: "0",
-    40372: "0",
-    40374: "0",
-    40371: "3",
-    7065: "0",
-    8065: "Hybrid battery pack remaining life",
-    40380: "0",
-    40383: "0",
-    40382: "0",
-    40384: "0",
-    40381: "3",
-    7066: "0",
-    8066: "Engine oil temperature",
-    40390: "0",
-    40393: "-4",
-    40392: "0",
-    40394: "0",
-    40391: "3",
-    7067: "0",
-    8067: "Fuel injection timing",
-    40400: "0",
-    40403: "0",
-    40402: "0",
-    40404: "0",
-    40401: "3",
-    7068: "0",
-    8068: "Fuel Rate",
-    40460: "0",
-    40463: "0",
-    40462: "0",
-    40464: "0",
-    40461: "3",
-    7524: "0",
-    8524: "Command Equivalence Ratio",
-    40470: "2",
-    40473: "0",
-    40472: "0",
-    40474: "0",
-    40471: "3",
-    7525: "0",
-    8525: "Intake MAP (2 Bytes)",
-    40480: "2",
-    40483: "0",
-    40482: "0",
-    40484: "0",
-    40481: "3",
-    7526: "0",
-    8526: "Hybrid Vehicle System Voltage",
-    40490: "2",
-    40493: "0",
-    40492: "0",
-    40494: "0",
-    40491: "3",
-    7527: "0",
-    8527: "Hybrid Vehicle System Current",
-    40420: "1",
-    40424: "1",
-    40421: "5",
-    7264: "0",
-    8264: "OBD Fault Codes",
-    40410: "1",
-    40414: "0",
-    40411: "5",
-    7241: "0",
-    8241: "VIN",
-    40430: "2",
-    40433: "0",
-    40432: "0",
-    40434: "0",
-    40431: "3",
-    7522: "0",
-    8522: "OEM Total mileage",
-    40440: "2",
-    40443: "0",
-    40442: "0",
-    40444: "0",
-    40441: "3",
-    7529: "0",
-    8529: "OEM Fuel level l",
-    40520: "2",
-    40523: "0",
-    40522: "0",
-    40524: "0",
-    40521: "3",
-    7628: "0",
-    8628: "OEM Remaining Distance",
-    40510: "2",
-    40513: "0",
-    40512: "0",
-    40514: "0",
-    40511: "3",
-    40570: "2",
-    40573: "0",
-    40572: "0",
-    40574: "0",
-    40571: "3",
-    7634: "0",
-    8634: "OEM Battery Charge State",
-    40580: "2",
-    40583: "0",
-    40582: "0",
-    40584: "0",
-    40581: "3",
-    7635: "0",
-    8635: "OEM Battery Charge Level",
-    3000: "0",
-    3001: "",
-    3003: "",
-    3004: "",
-    3006: "0",
-    3005: "0",
-    4000: "",
-    4001: "",
-    4002: "",
-    4003: "",
-    4004: "",
-    4005: "",
-    4006: "",
-    4007: "",
-    4008: "",
-    4009: "",
-    4010: "",
-    4011: "",
-    4012: "",
-    4013: "",
-    4014: "",
-    4015: "",
-    4016: "",
-    4017: "",
-    4018: "",
-    4019: "",
-    4020: "",
-    4021: "",
-    4022: "",
-    4023: "",
-    4024: "",
-    4025: "",
-    4026: "",
-    4027: "",
-    4028: "",
-    4029: "",
-    4030: "",
-    4031: "",
-    4032: "",
-    4033: "",
-    4034: "",
-    4035: "",
-    4036: "",
-    4037: "",
-    4038: "",
-    4039: "",
-    4040: "",
-    4041: "",
-    4042: "",
-    4043: "",
-    4044: "",
-    4045: "",
-    4046: "",
-    4047: "",
-    4048: "",
-    4049: "",
-    4050: "",
-    4051: "",
-    4052: "",
-    4053: "",
-    4054: "",
-    4055: "",
-    4056: "",
-    4057: "",
-    4058: "",
-    4059: "",
-    4060: "",
-    4061: "",
-    4062: "",
-    4063: "",
-    4064: "",
-    4065: "",
-    4066: "",
-    4067: "",
-    4068: "",
-    4069: "",
-    4070: "",
-    4071: "",
-    4072: "",
-    4073: "",
-    4074: "",
-    4075: "",
-    4076: "",
-    4077: "",
-    4078: "",
-    4079: "",
-    4080: "",
-    4081: "",
-    4082: "",
-    4083: "",
-    4084: "",
-    4085: "",
-    4086: "",
-    4087: "",
-    4088: "",
-    4089: "",
-    4090: "",
-    4091: "",
-    4092: "",
-    4093: "",
-    4094: "",
-    4095: "",
-    4096: "",
-    4097: "",
-    4098: "",
-    4099: "",
-    4100: "",
-    4101: "",
-    4102: "",
-    4103: "",
-    4104: "",
-    4105: "",
-    4106: "",
-    4107: "",
-    4108: "",
-    4109: "",
-    4110: "",
-    4111: "",
-    4112: "",
-    4113: "",
-    4114: "",
-    4115: "",
-    4116: "",
-    4117: "",
-    4118: "",
-    4119: "",
-    4120: "",
-    4121: "",
-    4122: "",
-    4123: "",
-    4124: "",
-    4125: "",
-    4126: "",
-    4127: "",
-    4128: "",
-    4129: "",
-    4130: "",
-    4131: "",
-    4132: "",
-    4133: "",
-    4134: "",
-    4135: "",
-    4136: "",
-    4137: "",
-    4138: "",
-    4139: "",
-    4140: "",
-    4141: "",
-    4142: "",
-    4143: "",
-    4144: "",
-    4145: "",
-    4146: "",
-    4147: "",
-    4148: "",
-    4149: "",
-    4150: "",
-    4151: "",
-    4152: "",
-    4153: "",
-    4154: "",
-    4155: "",
-    4156: "",
-    4157: "",
-    4158: "",
-    4159: "",
-    4160: "",
-    4161: "",
-    4162: "",
-    4163: "",
-    4164: "",
-    4165: "",
-    4166: "",
-    4167: "",
-    4168: "",
-    4169: "",
-    4170: "",
-    4171: "",
-    4172: "",
-    4173: "",
-    4174: "",
-    4175: "",
-    4176: "",
-    4177: "",
-    4178: "",
-    4179: "",
-    4180: "",
-    4181: "",
-    4182: "",
-    4183: "",
-    4184: "",
-    4185: "",
-    4186: "",
-    4187: "",
-    4188: "",
-    4189: "",
-    4190: "",
-    4191: "",
-    4192: "",
-    4193: "",
-    4194: "",
-    4195: "",
-    4196: "",
-    4197: "",
-    4198: "",
-    4199: "",
-    6000: "",
-    6001: "",
-    6002: "",
-    6003: "",
-    6004: "",
-    6005: "",
-    6006: "",
-    6007: "",
-    6008: "",
-    6009: "",
-    138: "1",
-    106: "0",
-    112: "1",
-    107: "2",
-    108: "1",
-    109: "14",
-    110: "0",
-    113: "1",
-    102: "2",
-    103: "120",
-    101: "12",
-    104: "30000",
-    105: "13200",
-    19001: "2",
-    19002: "60",
-    901: "3",
-    902: "avl1.teltonika.lt",
-    903: "pool.ntp.org",
-    169: "1",
-    170: "1",
-}
-
-_DATA = {
-    "accelerometer": {
-        "unplug_detection": {
-            "scenario_setting": "HIGH_PRIORITY",
-            "eventual_records": "ENABLE",
-            "detection_mode": "SIMPLE",
-            "send_sms_to": 0,
-            "sms_text": "Unplug",
-        },
-        "towing_detection": {
-            "priority": "LOW_PRIORITY",
-            "eventual_records": "ENABLE",
-            "activation_timeout": 5,
-            "event_timeout": 10,
-            "make_call_to": 0,
-            "threshold": 0.22,
-            "angle": 1.0,
-            "duration": 998,
-            "send_sms_to": 0,
-            "sms_text": "Towing",
-        },
-        "crash_detection": {
-            "scenario_setting": "HIGH_PRIORITY",
-            "duration": 5,
-            "threshold": 1500,
-            "crash_trace": "TRACE_FULL",
-            "send_sms_to": 0,
-            "sms_text": "Crash",
-        },
-        "excessive_idling": {
-            "scenario_settings": "DISABLE",
-            "eventual_records": "ENABLE",
-            "time_to_stopped": 60,
-            "time_to_moving": 5,
-            "output_control": "NONE",
-            "dout_on_duration": 200,
-            "dout_off_duration": 200,
-            "send_sms_to": 0,
-            "sms_text": "Idling Event",
-        },
-        "motorcycle_fall_detection": {
-            "send_sms_to": 0,
-            "sms_text": "LVC Distance Need To Service",
-        },
-    },
-    "data_acquisition_mode": {
-        "home_stop": {"min_period": 10, "min_saved_records": 10, "send_period": 10},
-        "home_moving": {
-            "min_period": 1,
-            "min_distance": 0,
-            "min_angle": 0,
-            "min_speed_delta": 0,
-            "min_saved_records": 10,
-            "send_period": 10,
-        },
-        "roaming_stop": {
-            "min_period": 3600,
-            "min_saved_records": 1,
-            "send_period": 120,
-        },
-        "roaming_moving": {
-            "min_period": 300,
-            "min_distance": 100,
-            "min_angle": 10,
-            "min_speed_delta": 10,
-            "min_saved_records": 1,
-            "send_period": 120,
-        },
-        "unknown_stop": {"min_period": 10, "min_saved_records": 10, "send_period": 10},
-        "unknown_moving": {
-            "min_period": 1,
-            "min_distance": 100,
-            "min_angle": 30,
-            "min_speed_delta": 5,
-            "min_saved_records": 10,
-            "send_period": 1,
-        },
-    },
-    "features": {
-        "green_driving": {
-            "scenario_settings": "LOW_PRIORITY",
-            "max_acceleration": 0.5,
-            "max_braking": 0.5,
-            "max_cornering": 3.4,
-            "source": "ACCELEROMETER",
-            "duration": 1,
-            "output_control": "NONE",
-            "dout_on_duration": 200,
-            "dout_off_duration": 200,
-            "send_sms_to": 0,
-            "sms_text": "Green Driving",
-        },
-        "overspeeding_scenario": {
-            "scenario_settings": "DISABLE",
-            "max_speed": 90,
-            "output_control": "NONE",
-            "dout_on_duration": 200,
-            "dout_off_duration": 200,
-            "send_sms_to": 0,
-            "sms_text": "Overspeeding",
-        },
-        "jamming_scenario": {
-            "scenario_settings": "HIGH_PRIORITY",
-            "eventual_records": "ENABLE",
-            "output_control": "NONE",
-            "dout_on_duration": 200,
-            "dout_off_duration": 200,
-            "timeout": 60,
-        },
-    },
-    "gprs": {
-        "open_link_timeout": 259200,
-        "response_timeout": 30,
-        "sort_by": "NEWEST",
-        "gprs_context": "ENABLE",
-        "apn": "internet",
-        "apn_username": "",
-        "apn_password": "",
-        "domain": "a27fww76cm8ynq-ats.iot.eu-central-1.amazonaws.com",
-        "port": 8883,
-        "protocol": "MQTT",
-        "backup_server_mode": "DISABLE",
-        "backup_server_domain": "",
-        "backup_server_port": 0,
-        "backup_server_protocol": "TCP",
-        "fota_web_status": "ENABLE",
-        "fota_web_domain": "fm.teltonika.lt",
-        "fota_web_port": 5000,
-        "fota_web_period": 30,
-    },
-    "gsm": {
-        "sim_roaming_operator_list": [
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-        ],
-        "operator_blacklist": [
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-            0,
-        ],
-    },
-    "io": {
-        "ignition": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 10,
-            "send_sms_to": 0,
-            "sms_text": "Ignition",
-        },
-        "movement": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 10,
-            "send_sms_to": 0,
-            "sms_text": "Movement",
-        },
-        "data_mode": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "Data Mode",
-        },
-        "gsm_signal": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 1,
-            "send_sms_to": 0,
-            "sms_text": "GSM Signal",
-        },
-        "sleep": {
-            "priority": "LOW",
-            "operand": "ON_CHANGE",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "Sleep Mode",
-        },
-        "gnss_status": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "GNSS Power",
-        },
-        "gnss_pdop": {
-            "priority": "HIGH",
-            "operand": "ON_RANGE_EXIT",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 0,
-            "send_sms_to": 0,
-            "sms_text": "GNSS PDOP",
-        },
-        "gnss_hdop": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 10,
-            "send_sms_to": 0,
-            "sms_text": "GNSS HDOP",
-        },
-        "external_voltage": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 10,
-            "send_sms_to": 0,
-            "sms_text": "External Voltage",
-        },
-        "speed": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 1,
-            "send_sms_to": 0,
-            "sms_text": "Speed",
-        },
-        "gsm_cell_id": {
-            "priority": "DISABLED",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "GSM Cell ID",
-        },
-        "gsm_area_code": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "GSM Area Code",
-        },
-        "battery_voltage": {
-            "priority": "LOW",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 10,
-            "send_sms_to": 0,
-            "sms_text": "Battery Voltage",
-        },
-        "battery_current": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 10,
-            "send_sms_to": 0,
-            "sms_text": "Battery Current",
-        },
-        "active_gsm_operator": {
-            "priority": "LOW",
-            "operand": "ON_CHANGE",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "Active GSM Operator",
-        },
-        "trip_odometer": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "Trip Odometer",
-        },
-        "total_odometer": {
-            "priority": "LOW",
-            "operand": "ON_CHANGE",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "Total Odometer",
-        },
-        "fuel_used_gps": {
-            "priority": "DISABLED",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 1,
-            "send_sms_to": 0,
-            "sms_text": "FC By GPS",
-        },
-        "fuel_rate_gps": {
-            "priority": "DISABLED",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 1,
-            "send_sms_to": 0,
-            "sms_text": "FC AVG By GPS",
-        },
-        "axis_x": {
-            "priority": "LOW",
-            "operand": "ON_DELTA_CHANGE",
-            "high_level": 10,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 1,
-            "send_sms_to": 0,
-            "sms_text": "Axis X",
-        },
-        "axis_y": {
-            "priority": "LOW",
-            "operand": "ON_DELTA_CHANGE",
-            "high_level": 10,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 1,
-            "send_sms_to": 0,
-            "sms_text": "Axis Y",
-        },
-        "axis_z": {
-            "priority": "LOW",
-            "operand": "ON_DELTA_CHANGE",
-            "high_level": 10,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "average": 1,
-            "send_sms_to": 0,
-            "sms_text": "Axis Z",
-        },
-        "iccid": {
-            "priority": "LOW",
-            "operand": "ON_CHANGE",
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "ICCID",
-        },
-        "eco_score": {
-            "priority": "DISABLED",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "EcoScore",
-        },
-        "battery_level": {
-            "priority": "HIGH",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "Battery Level %",
-        },
-        "bt_status": {
-            "priority": "DISABLED",
-            "operand": "MONITORING",
-            "high_level": 0,
-            "low_level": 0,
-            "event_only": "DISABLE",
-            "send_sms_to": 0,
-            "sms_text": "BT Status",
-        },
-    },
-    "obd": {
-        "number_of_dtc": {
-            "priority": "LOW",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "ON_CHANGE",
-            "send_sms_to": 0,
-            "sms_text": "Number of DTC",
-        },
-        "engine_load": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Calculated engine load value",
-        },
-        "coolant_temperature": {
-            "priority": "LOW",
-            "low_level": 0,
-            "high_level": 5,
-            "event_only": "DISABLE",
-            "operand": "ON_DELTA_CHANGE",
-            "send_sms_to": 0,
-            "sms_text": "Engine coolant temperature",
-        },
-        "short_fuel_trim": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Short term fuel trim 1",
-        },
-        "fuel_pressure": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Fuel pressure",
-        },
-        "intake_map": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Intake MAP",
-        },
-        "engine_rpm": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Engine RPM",
-        },
-        "vehicle_speed": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Vehicle speed",
-        },
-        "timing_advance": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Timing advance",
-        },
-        "intake_air_temperature": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Intake air temperature",
-        },
-        "maf": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "MAF rate",
-        },
-        "throttle_position": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Throttle position",
-        },
-        "run_time_since_engine_start": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Run time since engine start",
-        },
-        "distance_traveled_mil_on": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Distance traveled MIL on",
-        },
-        "relative_fuel_rail_pressure": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Relative fuel rail pressure",
-        },
-        "direct_fuel_rail_pressure": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Direct fuel rail pressure",
-        },
-        "commanded_egr": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Commanded EGR",
-        },
-        "egr_error": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "EGR error",
-        },
-        "fuel_level": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Fuel level",
-        },
-        "distance_traveled_since_codes_clear": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Distance traveled since codes clear",
-        },
-        "barometric_pressure": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Barometric pressure",
-        },
-        "control_module_voltage": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Control module voltage",
-        },
-        "absolute_load_value": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Absolute load value",
-        },
-        "ambient_air_temperature": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Ambient air temperature",
-        },
-        "time_run_with_mil_on": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Time run with MIL on",
-        },
-        "time_since_trouble_codes_cleared": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Time since trouble codes cleared",
-        },
-        "fuel_type": {
-            "priority": "LOW",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "ON_CHANGE",
-            "send_sms_to": 0,
-            "sms_text": "Fuel Type",
-        },
-        "absolute_fuel_rail_pressure": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Absolute fuel rail pressure",
-        },
-        "hybrid_battery_pack_remaining_life": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Hybrid battery pack remaining life",
-        },
-        "engine_oil_temperature": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Engine oil temperature",
-        },
-        "fuel_injection_timing": {
-            "priority": "DISABLED",
-            "low_level": -4,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Fuel injection timing",
-        },
-        "fuel_rate": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Fuel Rate",
-        },
-        "command_equivalence_ratio": {
-            "priority": "DISABLED",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Command Equivalence Ratio",
-        },
-        "intake_map_2_bytes": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Intake MAP (2 Bytes)",
-        },
-        "hybrid_vehicle_system_voltage": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Hybrid Vehicle System Voltage",
-        },
-        "hybrid_vehicle_system_current": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "Hybrid Vehicle System Current",
-        },
-        "fault_codes": {
-            "priority": "LOW",
-            "event_only": "ENABLE",
-            "operand": "ON_CHANGE",
-            "send_sms_to": 0,
-            "sms_text": "OBD Fault Codes",
-        },
-        "vin": {
-            "priority": "LOW",
-            "event_only": "DISABLE",
-            "operand": "ON_CHANGE",
-            "send_sms_to": 0,
-            "sms_text": "VIN",
-        },
-        "oem_total_mileage": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "OEM Total mileage",
-        },
-        "oem_fuel_level": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "OEM Fuel level l",
-        },
-        "oem_remaining_distance": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "OEM Remaining Distance",
-        },
-        "oem_distance_until_service": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-        },
-        "oem_battery_charge_state": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "OEM Battery Charge State",
-        },
-        "oem_battery_charge_level": {
-            "priority": "HIGH",
-            "low_level": 0,
-            "high_level": 0,
-            "event_only": "DISABLE",
-            "operand": "MONITORING",
-            "send_sms_to": 0,
-            "sms_text": "OEM Battery Charge Level",
-        },
-    },
-    "sms": {
-        "allow_sms_data_sending": "DISABLE",
-        "data_send_number": "",
-        "login": "",
-        "password": "",
-        "sms_event_time_zone": 0,
-        "incoming_call_action": "DO_NOTHING",
-        "authorized_number": [
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-        ],
-        "predefined_number": ["", "", "", "", "", "", "", "", "", ""],
-    },
-    "system": {
-        "movement_source": "IGNITION",
-        "static_navigation": "DISABLE",
-        "static_navigation_src": "MOVEMENT",
-        "records_without_ts": "AFTER_TIME_SYNC",
-        "led_indication": "ENABLE",
-        "gnss_source": "GPS_GALILEO_GLONASS",
-        "battery_charge_mode": "ON_NEED",
-        "protocol_settings": "CODEC_8_EXT",
-        "sleep_settings": "DEEP_SLEEP",
-        "timeout": 120,
-        "ignition_settings": "POWER_VOLTAGE_OR_ENGINE_RPM",
-        "high_voltage": 30000,
-        "low_voltage": 13200,
-        "movement_start_delay": 2,
-        "movement_stop_delay": 60,
-        "ntp_resync": 3,
-        "ntp_server1": "avl1.teltonika.lt",
-        "ntp_server2": "pool.ntp.org",
-        "accel_auto_calib": "ONCE",
-        "gravity_filter": "ENABLED",
-    },
-}
-
-
 def test_map_from_raw():
-    data = teltek.parameters.map_raw_parameters(_RAW)
-    assert data == _DATA
+    data = teltek.parameters.map_raw_parameters(RAW)
+    assert data == DATA
 
 
 def test_map_to_raw():
-    raw = teltek.parameters.map_parameters_to_raw(_DATA)
-    assert raw == _RAW
+    raw = teltek.parameters.map_parameters_to_raw(DATA)
+    assert raw == RAW
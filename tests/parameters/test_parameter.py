@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+
+import teltek.parameters
+from teltek.parameters import Parameter, ParameterType, ValueMapping, ValueRange
+
+
+def _param(**kwargs) -> Parameter:
+    kwargs = {
+        "key": "test",
+        "id": 1000,
+        "type": ParameterType.U8,
+        "default_value": 0,
+        "value_range": ValueRange(min=0, max=255),
+        "name": "Test",
+    } | kwargs
+    return Parameter(**kwargs)
+
+
+def test_convert_integer():
+    param = _param(type=ParameterType.U64, value_range=ValueRange(min=0, max=2**64))
+    assert param.convert_from_raw("42") == 42
+    assert param.convert_from_raw("42.0") == 42
+    assert param.convert_from_raw("") is None
+    # large values keep going through float like before
+    assert param.convert_from_raw(str(2**64 - 1)) == 2**64
+    with pytest.raises(ValueError, match="Failed to convert 1.5"):
+        param.convert_from_raw("1.5")
+    assert param.convert_to_raw(42) == "42"
+    assert param.convert_to_raw(None) == ""
+
+
+def test_convert_mapped():
+    param = _param(
+        value_map=[
+            ValueMapping(key="OFF", value=0, display="Off"),
+            ValueMapping(key="ON", value=1, display="On"),
+            ValueMapping(key="ENABLED", value=1, display="Enabled"),
+        ]
+    )
+    # the first mapping of a value wins
+    assert param.convert_from_raw("1") == "ON"
+    assert param.convert_to_raw("ENABLED") == "1"
+    assert param.convert_to_raw("7") == "7"
+    assert param.convert_from_raw("7", lenient=True) == "7"
+    with pytest.raises(ValueError, match="No mapping for value 7"):
+        param.convert_from_raw("7")
+    with pytest.raises(ValueError, match="Failed to convert MAYBE"):
+        param.convert_to_raw("MAYBE")
+
+
+def test_convert_bitflag():
+    param = _param(
+        value_is_bitflag=True,
+        value_map=[
+            ValueMapping(key="NONE", value=0, display="None"),
+            ValueMapping(key="A", value=1, display="A"),
+            ValueMapping(key="B", value=2, display="B"),
+            ValueMapping(key="C", value=4, display="C"),
+        ],
+    )
+    for _ in range(2):
+        assert param.convert_from_raw("5") == "A|C"
+        assert param.convert_from_raw("0") == "NONE"
+        assert param.convert_to_raw("A|C") == "5"
+        assert param.convert_to_raw("B|8") == "10"
+
+
+def test_pickle_after_use():
+    param = _param(value_map=[ValueMapping(key="ON", value=1, display="On")])
+    assert param.convert_from_raw("1") == "ON"
+    assert param.convert_to_raw("ON") == "1"
+    copy = pickle.loads(pickle.dumps(param))
+    assert copy == param
+    assert copy.convert_from_raw("1") == "ON"
+
+    # every parameter after a mapping pass
+    teltek.parameters.map_raw_parameters({1000: "60", 2001: "iot"})
+    teltek.parameters.map_parameters_to_raw({"gprs": {"apn": "iot"}})
+    groups = pickle.loads(pickle.dumps(teltek.parameters.db.ALL_GROUPS))
+    assert groups == teltek.parameters.db.ALL_GROUPS
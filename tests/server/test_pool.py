@@ -0,0 +1,76 @@
+import asyncio
+import socket
+import time
+
+import pytest
+
+from teltek.server import AvlBatch, AvlSink, AvlTcpServerPool
+
+_FRAME = bytes.fromhex(
+    "000000000000004A8E010000016B412CEE000100000000000000000000000000000000010005000100010100010011001D00010010015E2C880002000B000000003544C87A000E000000001DD7E06A00000100002994"
+)
+_IMEI = b"\x00\x0f356307042441013"
+
+
+class _NullSink(AvlSink):
+    async def handle(self, batch: AvlBatch) -> None:
+        pass
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _send_frames(port: int, connections: int) -> None:
+    for _ in range(connections):
+        for _ in range(50):
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                break
+            except ConnectionRefusedError:
+                # workers are still starting
+                await asyncio.sleep(0.1)
+        else:
+            raise TimeoutError("workers didn't start")
+        writer.write(_IMEI + _FRAME)
+        assert await reader.readexactly(5) == b"\x01\x00\x00\x00\x01"
+        writer.close()
+        await writer.wait_closed()
+
+
+def test_pool_aggregates_stats():
+    port = _free_port()
+    pool = AvlTcpServerPool(
+        _NullSink, workers=2, host="127.0.0.1", port=port, stats_interval=0.1
+    )
+    pool.start()
+    try:
+        asyncio.run(_send_frames(port, 10))
+        deadline = time.monotonic() + 10
+        while pool.stats.records < 10 and time.monotonic() < deadline:
+            pool.supervise(0.1)
+    finally:
+        pool.stop()
+    assert pool.stats.records == 10
+    assert pool.stats.connections == 10
+    assert set(pool.worker_stats) == {0, 1}
+
+
+def test_pool_stop_drains_stats():
+    pool = AvlTcpServerPool(
+        _NullSink, workers=2, host="127.0.0.1", port=_free_port(), stats_interval=0.001
+    )
+    pool.start()
+    # unread stats fill the queue's pipe so the workers can't flush them on exit
+    time.sleep(2)
+    start = time.monotonic()
+    pool.stop(timeout=5)
+    assert time.monotonic() - start < 5
+    assert set(pool.worker_stats) == {0, 1}
+
+
+def test_pool_rejects_reuse_port():
+    with pytest.raises(TypeError, match="reuse_port"):
+        AvlTcpServerPool(_NullSink, reuse_port=False)
@@ -0,0 +1,71 @@
+import asyncio
+
+from teltek.codec import Codec8e, MessageFrame
+from teltek.server import AvlBatch, AvlSink, AvlTcpServer
+
+_FRAME = bytes.fromhex(
+    "000000000000004A8E010000016B412CEE000100000000000000000000000000000000010005000100010100010011001D00010010015E2C880002000B000000003544C87A000E000000001DD7E06A00000100002994"
+)
+_IMEI = b"\x00\x0f356307042441013"
+
+
+class _ListSink(AvlSink):
+    def __init__(self) -> None:
+        self.batches: list[AvlBatch] = []
+
+    async def handle(self, batch: AvlBatch) -> None:
+        self.batches.append(batch)
+
+
+def test_login_and_ack():
+    async def run() -> None:
+        sink = _ListSink()
+        async with AvlTcpServer(sink, host="127.0.0.1", port=0) as server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            # login and the first frame split across writes
+            writer.write(_IMEI + _FRAME[:10])
+            assert await reader.readexactly(1) == b"\x01"
+            writer.write(_FRAME[10:] + _FRAME)
+            assert await reader.readexactly(4) == (1).to_bytes(4, "big")
+            assert await reader.readexactly(4) == (1).to_bytes(4, "big")
+            writer.close()
+            await writer.wait_closed()
+
+        assert len(sink.batches) == 2
+        batch = sink.batches[0]
+        assert batch.imei == "356307042441013"
+        assert batch.data == Codec8e.from_frame(MessageFrame.decode(_FRAME))
+        assert server.stats.records == 2
+
+    asyncio.run(run())
+
+
+def test_rejected_imei():
+    async def run() -> None:
+        sink = _ListSink()
+        async with AvlTcpServer(
+            sink, host="127.0.0.1", port=0, accept_imei=lambda imei: False
+        ) as server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(_IMEI)
+            assert await reader.readexactly(1) == b"\x00"
+            assert await reader.read() == b""
+            writer.close()
+        assert server.stats.rejected_connections == 1
+
+    asyncio.run(run())
+
+
+def test_corrupt_frame_closes_connection():
+    async def run() -> None:
+        sink = _ListSink()
+        async with AvlTcpServer(sink, host="127.0.0.1", port=0) as server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(_IMEI + _FRAME[:-1] + b"\xff")
+            assert await reader.readexactly(1) == b"\x01"
+            assert await reader.read() == b""
+            writer.close()
+        assert not sink.batches
+        assert server.stats.errors == 1
+
+    asyncio.run(run())
@@ -0,0 +1,52 @@
+import asyncio
+
+from teltek.codec import UdpAvlAck
+from teltek.server import AvlBatch, AvlSink, AvlUdpServer
+
+_RAW = bytes.fromhex(
+    "003DCAFE0105000F33353230393330383634303336353508010000016B4F815B30010000000000000000000000000000000103021503010101425DBC000001"
+)
+
+
+class _ListSink(AvlSink):
+    def __init__(self) -> None:
+        self.batches: list[AvlBatch] = []
+
+    async def handle(self, batch: AvlBatch) -> None:
+        self.batches.append(batch)
+
+
+class _Client(asyncio.DatagramProtocol):
+    def __init__(self) -> None:
+        self.received: asyncio.Queue[bytes] = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self.received.put_nowait(data)
+
+
+def test_ack_and_retransmission():
+    async def run() -> None:
+        sink = _ListSink()
+        async with AvlUdpServer(sink, host="127.0.0.1", port=0) as server:
+            loop = asyncio.get_running_loop()
+            transport, client = await loop.create_datagram_endpoint(
+                _Client, remote_addr=("127.0.0.1", server.port)
+            )
+            try:
+                for _ in range(2):
+                    transport.sendto(_RAW)
+                    raw_ack = await asyncio.wait_for(client.received.get(), 5)
+                    ack = UdpAvlAck.decode(raw_ack)
+                    assert ack.packet_id == 0xCAFE
+                    assert ack.accepted_records == 1
+                # garbage is ignored
+                transport.sendto(b"\x00\x01")
+            finally:
+                transport.close()
+
+        # the retransmitted packet is acknowledged but not processed again
+        assert len(sink.batches) == 1
+        assert sink.batches[0].imei == "352093086403655"
+        assert server.stats.records == 1
+
+    asyncio.run(run())
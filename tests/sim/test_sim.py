@@ -0,0 +1,99 @@
+import asyncio
+
+from teltek.cmd import CommandClient, DeviceId
+from teltek.server import AvlBatch, AvlSink, AvlTcpServer
+from teltek.sim import (
+    Fleet,
+    LatencyHistogram,
+    ParameterStore,
+    SimTransport,
+    default_raw_parameters,
+)
+
+
+class _CountingSink(AvlSink):
+    def __init__(self) -> None:
+        self.records = 0
+        self.imeis: set[str] = set()
+
+    async def handle(self, batch: AvlBatch) -> None:
+        self.records += batch.record_count
+        self.imeis.add(batch.imei)
+
+
+def test_parameter_store():
+    store = ParameterStore({1000: "300", 2001: "internet"})
+    assert store.handle_command("getparam 1000;2001") == (
+        "Param ID:1000 Value:300;2001:internet"
+    )
+    assert store.handle_command("setparam 2001:wap2;1000:60") == (
+        "New value 2001:wap2;1000:60"
+    )
+    assert store.raw_parameters == {1000: "60", 2001: "wap2"}
+
+
+def test_fleet_devices_have_own_parameters():
+    fleet = Fleet.create(2, parameters=ParameterStore({1000: "300"}))
+    (first, second) = fleet
+    first.handle_command("setparam 1000:60")
+    assert second.parameters.raw_parameters == {1000: "300"}
+
+    # stores with the default values share them
+    (first, second) = Fleet.create(2)
+    first.handle_command("setparam 1000:60")
+    assert second.handle_command("getparam 1000") == (
+        f"Param ID:1000 Value:{default_raw_parameters()[1000]}"
+    )
+    assert first.handle_command("getparam 1000") == "Param ID:1000 Value:60"
+    assert first.parameters.copy().handle_command("getparam 1000") == (
+        "Param ID:1000 Value:60"
+    )
+
+
+def test_command_client_offline():
+    async def run() -> None:
+        fleet = Fleet.create(3)
+        client = CommandClient(SimTransport(fleet, max_command_len=160))
+        device = next(iter(fleet))
+        device_id = DeviceId(imei=device.imei)
+
+        param_ids = list(device.parameters.raw_parameters)
+        raw = await client.get_raw_parameters(device_id, param_ids)
+        assert raw == device.parameters.raw_parameters
+
+        await client.set_raw_parameters(device_id, {2001: "iot.example", 1000: "60"})
+        raw = await client.get_raw_parameters(device_id, [1000, 2001])
+        assert raw == {1000: "60", 2001: "iot.example"}
+
+    asyncio.run(run())
+
+
+def test_tcp_fleet():
+    async def run() -> None:
+        sink = _CountingSink()
+        fleet = Fleet.create(20, record_interval=1)
+        async with AvlTcpServer(sink, host="127.0.0.1", port=0) as server:
+            stats = await fleet.run_tcp(
+                "127.0.0.1",
+                server.port,
+                frame_interval=0.01,
+                records_per_frame=5,
+                frames=3,
+            )
+        assert stats.errors == 0
+        assert stats.frames_acked == 60
+        assert stats.records_acked == sink.records == 300
+        assert sink.imeis == {device.imei for device in fleet}
+        assert stats.latency.count == 60
+
+    asyncio.run(run())
+
+
+def test_histogram():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    assert histogram.count == 100
+    assert 0.048 <= histogram.percentile(50) <= 0.053
+    assert 0.097 <= histogram.percentile(99) <= 0.1
+    assert histogram.percentile(100) == 0.1